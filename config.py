@@ -9,13 +9,27 @@ APP_ID = f"LingMoe404.MagicalGirlWorkshop.Encoder.{VERSION}"
 ENC_QSV = "Intel QSV"
 ENC_NVENC = "NVIDIA NVENC"
 ENC_AMF = "AMD AMF"
+ENC_SVT = "SVT-AV1 (CPU)"
+ENC_AOM = "libaom (CPU)"
+HW_ENCODERS = (ENC_QSV, ENC_NVENC, ENC_AMF)
+CPU_ENCODERS = (ENC_SVT, ENC_AOM)
+ALL_ENCODERS = HW_ENCODERS + CPU_ENCODERS
 
 # 默认参数
 DEFAULT_VMAF = "93.0"
 DEFAULT_AUDIO_BITRATE = "96k"
 DEFAULT_PRESET = "4"
 DEFAULT_ICQ = 24
+# 1-7 档 Preset 到 CPU 编码器档位的映射 (1 最慢/画质最好，7 最快)
+SVT_PRESET_MAP = {1: 3, 2: 4, 3: 5, 4: 6, 5: 8, 6: 10, 7: 12}
+AOM_CPU_USED_MAP = {1: 2, 2: 3, 3: 4, 4: 5, 5: 6, 6: 7, 7: 8}
 DEFAULT_LOUDNORM_FILTER = "loudnorm=I=-16:TP=-1.5:LRA=11,aresample=48000"
+LOUDNORM_CACHE_FILE = "loudnorm_cache.json"
+CPU_SPEED_CACHE_FILE = "cpu_speed_history.json"
+QUARANTINE_CACHE_FILE = "quarantine.json"
+CRF_CACHE_FILE = "crf_cache.json"
+INTEGRITY_CACHE_FILE = "integrity_cache.json"
+MEMORY_CACHE_FILE = "memory_history.json"
 
 # FFmpeg 相关
 AUDIO_CODEC = "libopus"
@@ -32,8 +46,48 @@ MAX_THUMBNAIL_CACHE_SIZE = 5000
 LOG_UPDATE_INTERVAL = 50
 LOG_MAX_BLOCKS = 2000
 GPU_COOLING_TIME = 3
+MAX_GPU_DEVICES = 4
+MIXED_POOL_RESERVED_CPUS = 2 # 混合池中每个 GPU 槽位预留的逻辑处理器数
+MIXED_POOL_DEFAULT_DURATION = 600.0 # 时长未知的文件按 10 分钟估算工作量
+FAST_LANE_FOLDER_HISTORY = 8 # 快速通道按文件夹预测参数时参考的最近记录数
+FAST_LANE_BUCKET_HISTORY = 32 # 按分辨率档位预测参数时参考的最近记录数
+# 1-7 档 Preset 的相对编码速度 (以第 4 档为 1)，截止时间模式在缺少实测记录时据此换算
+PRESET_SPEED_FACTOR = {1: 0.3, 2: 0.45, 3: 0.65, 4: 1.0, 5: 1.5, 6: 2.2, 7: 3.2}
+DEADLINE_FILE_OVERHEAD = 45 # 截止时间模式中每个文件的固定开销估计 (探测、启动等，秒)
+CROP_SAMPLE_COUNT = 6 # 黑边检测的采样点数 (并行解码)
+CROP_SAMPLE_FRAMES = 24 # 每个采样点解码的帧数
+CROP_MIN_RATIO = 0.02 # 裁剪面积低于画面的 2% 时不裁剪
+CROP_LIMIT = 0.094 # cropdetect 的黑色阈值，0~1 之间按位深缩放 (8bit 约 24，10bit 约 96)
+DECIMATE_FILTER = "mpdecimate"
+DECIMATE_SAMPLE_COUNT = 4 # 重复帧分析的采样区间数 (并行解码)
+DECIMATE_SAMPLE_SECONDS = 10 # 每个采样区间的时长 (秒)
+# 看门狗超时的倍率：按分辨率档位、CPU 编码器与 ab-av1 探测 (两次输出之间包含整段样本编码) 放宽
+WATCHDOG_BUCKET_FACTOR = {"720p": 1.0, "1080p": 1.0, "1440p": 1.5, "2160p": 2.5}
+WATCHDOG_CPU_FACTOR = 3.0
+WATCHDOG_SEARCH_FACTOR = 4.0
+COPY_CHUNK_SIZE = 8 * 1024 * 1024 # 跨卷收尾复制时的分块大小 (字节)
+DISK_RESERVE_BYTES = 2 * 1024 ** 3 # 各磁盘始终保留的剩余空间，低于此值 (加上预计需求) 时暂停领取新文件
+DISK_SAMPLE_RATIO = 0.05 # ab-av1 探测样本占用的缓存空间，按源文件大小的比例估算
+DISK_MONITOR_INTERVAL = 10 # 空间不足暂停时重新检查的间隔 (秒)
+STAGING_DIR_NAME = "staging" # 缓存目录下存放预读暂存副本的子目录
+STAGING_POLL_INTERVAL = 2 # 预读暂存检查队列的间隔 (秒)
+SCRATCH_SIZE_RATIO = 0.05 # ab-av1 探测样本的预估占用，按源文件大小的比例
+SCRATCH_MIN_BYTES = 256 * 1024 ** 2 # 每次探测至少预留的临时空间
+SCRATCH_POLL_INTERVAL = 1.0 # 统计探测临时空间占用的间隔 (秒)
 ERROR_DECISION_TIMEOUT = 30
 DEPENDENCY_CHECK_DELAY = 500
+INTEGRITY_SAMPLE_COUNT = 4 # 完整性预检的抽样点数 (另加片尾一段)
+INTEGRITY_SAMPLE_SECONDS = 5 # 每个抽样点解码的时长 (秒)
+CACHE_SWEEP_DELAY = 3000 # 启动后清理缓存遗留文件的延迟 (毫秒)
+CACHE_SWEEP_INTERVAL = 10 * 60 * 1000 # 定期检查缓存大小上限的间隔 (毫秒)
+GOVERNOR_POLL_INTERVAL = 30 # 资源调控检查时段并重新应用配置的间隔 (秒)
+# 内存准入控制：没有实测记录时各分辨率档位硬件最终编码的典型峰值内存 (MB)，按阶段与 CPU 编码器放大
+MEMORY_ESTIMATE_MB = {"720p": 500, "1080p": 1000, "1440p": 1800, "2160p": 3500}
+MEMORY_PHASE_FACTOR = {"search": 1.5, "encode": 1.0, "encode_vmaf": 1.6} # ab-av1 探测与同步验收需额外解码参考帧并计算 VMAF
+MEMORY_CPU_FACTOR = 2.0 # SVT-AV1 / libaom 的帧队列与多线程缓冲
+MEMORY_RENDITION_FACTOR = 0.3 # 每个附加规格输出的额外占用比例
+MEMORY_SAFETY_MARGIN = 1.2 # 实测峰值的安全系数
+MEMORY_POLL_INTERVAL = 1.0 # 采样子进程内存的间隔 (秒)
 
 # UI 相关
 MIN_WINDOW_SIZE = QSize(1180, 780)
@@ -49,13 +103,118 @@ LOUDNORM_MODE_ALWAYS = "Always"
 LOUDNORM_MODE_DISABLE = "Disable"
 LOUDNORM_MODE_AUTO = "Stereo/Mono Only"
 
+# 编码后 VMAF 验收不达标时的处理方式
+VERIFY_ACTION_FLAG = "flag"
+VERIFY_ACTION_REQUEUE = "requeue"
+
+# 源文件完整性预检：sample 抽样解码，full 完整解码；损坏的文件仅标记或跳过
+INTEGRITY_SCAN_SAMPLE = "sample"
+INTEGRITY_SCAN_FULL = "full"
+INTEGRITY_ACTION_FLAG = "flag"
+INTEGRITY_ACTION_SKIP = "skip"
+
+# 多显卡时文件分配到设备的方式
+GPU_ASSIGN_LEAST_LOADED = "least_loaded"
+GPU_ASSIGN_ROUND_ROBIN = "round_robin"
+
+# CPU 并行编码实例的处理器绑定方式
+CPU_PINNING_OFF = "off"
+CPU_PINNING_CORES = "cores"
+CPU_PINNING_NUMA = "numa"
+
+# 编码队列的排序策略
+QUEUE_ORDER_ADDED = "added"
+QUEUE_ORDER_SHORTEST = "shortest"
+QUEUE_ORDER_SAVINGS = "savings"
+QUEUE_ORDER_FOLDER = "folder"
+QUEUE_ORDER_DISK = "disk"
+QUEUE_ORDERS = (QUEUE_ORDER_ADDED, QUEUE_ORDER_SHORTEST, QUEUE_ORDER_SAVINGS, QUEUE_ORDER_FOLDER, QUEUE_ORDER_DISK)
+
+# 子进程资源调控：auto 按 interactive_hours 在工作时段 / 空闲时段配置之间切换
+GOVERNOR_OFF = "off"
+GOVERNOR_AUTO = "auto"
+GOVERNOR_INTERACTIVE = "interactive"
+GOVERNOR_OFFHOURS = "offhours"
+GOVERNOR_MODES = (GOVERNOR_OFF, GOVERNOR_AUTO, GOVERNOR_INTERACTIVE, GOVERNOR_OFFHOURS)
+PRIORITY_NORMAL = "normal"
+PRIORITY_BELOW_NORMAL = "below_normal"
+PRIORITY_IDLE = "idle"
+
+# 预计节省空间的估算：各源编码转为 AV1 后的典型体积比，以及 AV1 输出的典型每像素比特数
+SAVINGS_CODEC_RATIO = {"mpeg2video": 0.25, "mpeg4": 0.35, "vc1": 0.35, "wmv3": 0.35, "h264": 0.45, "hevc": 0.75, "vp9": 0.8}
+SAVINGS_AV1_BPP = 0.04
+
 DEFAULT_SETTINGS = {
     "encoder": ENC_QSV,
     "theme": "Auto",
     "save_mode": SAVE_MODE_OVERWRITE,
+    "queue_order": QUEUE_ORDER_ADDED,
+    "governor_mode": GOVERNOR_OFF,
     "export_dir": ""
 }
 
+# 高级设置 (config.ini 的 [Advanced] 段，按默认值类型解析)
+ADVANCED_SETTINGS = {
+    "loudnorm_two_pass": True,
+    "verify_vmaf": False,
+    "verify_subsample": 5,
+    "verify_action": VERIFY_ACTION_FLAG,
+    "verify_crf_step": 2,
+    "verify_max_retries": 2,
+    "repair_segments": False,
+    "repair_vmaf_margin": 2.0,
+    "repair_crf_step": 4,
+    "repair_max_ratio": 0.3,
+    "repair_subsample": 3,
+    "cpu_threads": 0,
+    "svt_lp": 0,
+    "cpu_instances": 0,
+    "cpu_pinning": CPU_PINNING_OFF,
+    "multi_gpu": True,
+    "gpu_assignment": GPU_ASSIGN_LEAST_LOADED,
+    "mixed_pool": False,
+    "hw_decode": False,
+    "crop_detect": False,
+    "decimate": False,
+    "decimate_min_ratio": 0.15,
+    "renditions": "", # 多规格输出，例如 "720:93:_720p;480:90:_480p" (高度:VMAF:后缀)
+    "failure_retries": 1,
+    "failure_fallback": True,
+    "circuit_breaker": 3,
+    "quarantine_after": 2,
+    "interactive_errors": False,
+    "watchdog_timeout": 0, # 卡死看门狗的基础超时 (秒，按分辨率、编码器与阶段放宽)；0 关闭 (默认)，建议 180 起
+    "fast_lane_duration": 0,
+    "fast_lane_instances": 3,
+    "deadline": "", # 截止时间，例如 "06:30" 或 "2026-03-01 06:30"
+    "temp_on_destination": True, # 临时输出放在目标所在的磁盘上，收尾只需重命名
+    "disk_space_check": True,
+    "finalize_verify": True, # 跨盘收尾复制时校验源文件与目标文件的校验和
+    "staging": False, # 预读暂存：编码期间把接下来的源文件复制到本地缓存
+    "staging_count": 2,
+    "staging_budget_gb": 50.0,
+    "staging_bandwidth_mb": 0.0, # 暂存复制速度上限 (MB/s)，0 不限
+    "staging_remote_only": True, # 只暂存网络存储 (SMB/NFS) 上的文件
+    "ram_scratch": False, # ab-av1 探测样本放到内存盘
+    "ram_scratch_dir": "", # 内存盘目录，留空时 Linux 使用 /dev/shm
+    "ram_scratch_budget_mb": 4096,
+    "integrity_scan": "", # 源文件完整性预检：留空关闭，sample 抽样解码，full 完整解码
+    "integrity_action": INTEGRITY_ACTION_FLAG,
+    "integrity_workers": 4,
+    "integrity_tolerance": 0, # 允许的解码错误行数
+    "cache_max_gb": 0.0, # 缓存目录大小上限，超出时按最近使用时间淘汰；0 关闭 (默认)
+    "interactive_hours": "09:00-18:00", # 资源调控 auto 模式下的工作时段，可用逗号分隔多段
+    "interactive_priority": PRIORITY_IDLE, # normal / below_normal / idle
+    "interactive_io": PRIORITY_IDLE,
+    "interactive_cpu_percent": 50, # 子进程可使用的处理器比例 (%)
+    "interactive_max_jobs": 1, # 同时处理的文件数上限，0 不限
+    "offhours_priority": PRIORITY_BELOW_NORMAL,
+    "offhours_io": PRIORITY_BELOW_NORMAL,
+    "offhours_cpu_percent": 100,
+    "offhours_max_jobs": 0,
+    "memory_ceiling_gb": 0.0, # 子进程内存上限，预估放不下时推迟启动新的探测 / 编码，0 不限
+}
+
 ENCODER_CONFIGS = {
     ENC_QSV: {
         "vmaf": "93.0",
@@ -83,5 +242,23 @@ ENCODER_CONFIGS = {
         "loudnorm_mode": LOUDNORM_MODE_AUTO,
         "nv_aq": "True",
         "amf_offset": "-6"
+    },
+    ENC_SVT: {
+        "vmaf": "93.0",
+        "audio_bitrate": DEFAULT_AUDIO_BITRATE,
+        "preset": DEFAULT_PRESET,
+        "loudnorm": DEFAULT_LOUDNORM_FILTER,
+        "loudnorm_mode": LOUDNORM_MODE_AUTO,
+        "nv_aq": "True",
+        "amf_offset": "0"
+    },
+    ENC_AOM: {
+        "vmaf": "93.0",
+        "audio_bitrate": DEFAULT_AUDIO_BITRATE,
+        "preset": DEFAULT_PRESET,
+        "loudnorm": DEFAULT_LOUDNORM_FILTER,
+        "loudnorm_mode": LOUDNORM_MODE_AUTO,
+        "nv_aq": "True",
+        "amf_offset": "0"
     }
 }
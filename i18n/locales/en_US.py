@@ -167,7 +167,7 @@ translation = {
     "dialog.clear_list.yes_button": "Confirm (Void)", # Clear List Confirm Dialog "Yes" Button
     "dialog.clear_list.cancel_button": "Cancel (Stay)", # Clear List Confirm Dialog "Cancel" Button
     "dialog.clear_cache.title": "Confirm Purge of Mana Residue?", # Clear Cache Confirm Dialog Title
-    "dialog.clear_cache.content": "These are chaotic fragments (*.temp.mkv) generated during alchemy. Keeping them might disturb the world line stability.\n\nTarget Area: {path}\n\nOnce purged, these fragments will return to void forever. Invoke purification spell?", # Clear Cache Confirm Dialog Content
+    "dialog.clear_cache.content": "These are chaotic fragments (*.temp.mkv, search samples, staged copies) generated during alchemy. Keeping them might disturb the world line stability.\n\nTarget Area: {path}\n\nOnce purged, these fragments will return to void forever. Invoke purification spell?", # Clear Cache Confirm Dialog Content
     "dialog.clear_cache.yes_button": "Invoke Purification (Purify)", # Clear Cache Confirm Dialog "Yes" Button
     "dialog.clear_cache.cancel_button": "Maintain Barrier", # Clear Cache Confirm Dialog "Cancel" Button
     "dialog.error.skip_button": "Skip & Continue (Skip)", # Error Dialog "Skip" Button
@@ -284,4 +284,108 @@ translation = {
     "log.encoder.info_multichannel": " -> Multi-channel ({channels}ch) detected, maintaining status quo.", # Multichannel Info Log
     "log.encoder.info_loudnorm_enabled": " -> Sound Field Harmonization (Loudnorm): Enabled ({mode})", # Loudnorm Enabled Log
     "log.encoder.info_loudnorm_skipped": " -> Sound Field Harmonization (Loudnorm): Skipped ({mode})", # Loudnorm Skipped Log
+    "log.encoder.loudnorm_measure_start": " -> Sound field survey (Loudnorm pass 1) running alongside the spell analysis...", # Loudnorm Measurement Start Log
+    "log.encoder.loudnorm_measured": " -> Sound field survey complete: {input_i} LUFS / TP {input_tp} dBTP / LRA {input_lra} LU, applying linear gain", # Loudnorm Measured Log
+    "log.encoder.loudnorm_cached": " -> Sound field survey record found ({input_i} LUFS), skipping measurement", # Loudnorm Cache Hit Log
+    "log.encoder.loudnorm_measure_failed": " -> Sound field survey failed, falling back to single-pass dynamic loudnorm", # Loudnorm Measurement Failed Log
+    "log.encoder.loudnorm_multi_stream": " -> {count} audio tracks detected, using single-pass dynamic loudnorm", # Multi-track Loudnorm Info Log
+    "log.encoder.verify_passed": " -> Quality check passed: VMAF {score:.2f} ≥ {target} (param {icq})", # VMAF Verification Passed Log
+    "log.encoder.verify_flagged": " -> Quality check below target: VMAF {score:.2f} < {target} (param {icq}), file flagged", # VMAF Verification Flagged Log
+    "log.encoder.verify_requeue": " -> Quality check below target: VMAF {score:.2f} < {target}, re-encoding with param {icq} -> {next_icq}", # VMAF Verification Requeue Log
+    "log.encoder.verify_no_score": " -> Quality check produced no VMAF score, skipping verification", # VMAF Verification No Score Log
+    "log.encoder.verify_unsupported": " -> This FFmpeg cannot verify inline (needs 7.1+ with libvmaf), verification disabled for this batch and re-encoding", # VMAF Verification Unsupported Log
+    "log.encoder.repair_start": " -> Inspecting weak spots of the spell (per-segment VMAF, threshold {threshold:.1f})...", # Weak Segment Scan Start Log
+    "log.encoder.repair_none": " -> No weak segments found, the spell is intact", # No Weak Segments Log
+    "log.encoder.repair_found": " -> Found {count} weak segment(s) ({frames}/{total} frames), re-forging locally with param {icq}...", # Weak Segments Found Log
+    "log.encoder.repair_done": " -> Local re-forge complete: {count} segment(s) repaired [Time: {duration:.1f}s]", # Weak Segment Repair Done Log
+    "log.encoder.repair_too_many": " -> Weak segments exceed {ratio:.0f}% of the file, local re-forge not worthwhile, keeping result", # Too Many Weak Segments Log
+    "log.encoder.repair_no_data": " -> Per-frame scores or keyframe data unavailable, skipping local re-forge", # Weak Segment No Data Log
+    "log.encoder.repair_failed": " -> Local re-forge failed, keeping original result", # Weak Segment Repair Failed Log
+    "log.encoder.repair_failed_error": " -> Local re-forge error: {error}, keeping original result", # Weak Segment Repair Error Log
+    "home.settings_card.nv_aq.label.cpu": "Enhanced Analysis (N/A for CPU encoders)", # CPU Encoder Analysis Setting Label
+    "log.dependency.cpu_encoder_failed": ">>> CPU encoder {encoder} detection failed: {error}", # CPU Encoder Detection Failed Log
+    "log.encoder.cpu_plan": "🧮 CPU parallel plan: {instances} instance(s) × {threads} thread(s) (resolution tier {bucket}, {cores} logical cores available)", # CPU Parallel Plan Log
+    "log.encoder.cpu_plan_pinned": "    -> Each instance is pinned to a disjoint CPU set (mode: {mode})", # CPU Pinning Log
+    "log.dependency.device_found": "    -> {encoder} device #{index} is available", # Hardware Device Found Log
+    "log.encoder.multi_gpu": "🖧 Multi-GPU: tasks will be spread across {count} devices (assignment: {mode})", # Multi-GPU Assignment Log
+    "log.encoder.mixed_pool": "⚖️ Mixed pool: {gpu} GPU slot(s) + {cpu} CPU slot(s) working together (long/high-res files prefer GPU, short/low-res files prefer CPU)", # Mixed Pool Log
+    "log.encoder.hw_decode_enabled": " -> Hardware decoding enabled ({hwaccel}), frames stay in GPU memory", # Hardware Decode Enabled Log
+    "log.encoder.hw_decode_unsupported": " -> Source format not supported by hardware decoding ({codec} / {profile} / {pix_fmt}), using software decoding", # Hardware Decode Unsupported Log
+    "log.encoder.hw_decode_fallback": "⚠️ Hardware decoding failed, re-encoding with software decoding...", # Hardware Decode Fallback Log
+    "log.encoder.rendition_search": "🪜 Rendition {label}: searching (target VMAF {vmaf})...", # Rendition Search Log
+    "log.encoder.rendition_skip": " -> Rendition {label} is not below the source resolution ({height}p), skipped", # Rendition Skip Log
+    "log.encoder.rendition_hw_decode_disabled": " -> Renditions are scaled in system memory, hardware decoding disabled for this file", # Rendition HW Decode Disabled Log
+    "log.encoder.rendition_done": "✅ Rendition {label} done (quality {icq}) -> {dest}", # Rendition Done Log
+    "log.encoder.rendition_failed": "❌ Rendition {label} failed", # Rendition Failed Log
+    "log.encoder.crop_detected": "✂️ Black bars detected: {width}x{height} -> cropping to {w}x{h} (offset {x},{y}, {agree}/{samples} samples agree)", # Crop Detected Log
+    "log.encoder.crop_none": " -> No stable black bars detected, not cropping", # No Crop Log
+    "log.encoder.filter_hw_decode_disabled": " -> Video filter ({filter}) runs in system memory, hardware decoding disabled for this file", # Filter HW Decode Disabled Log
+    "log.encoder.decimate_enabled": "🎞️ About {ratio:.1f}% duplicate frames, dropping duplicates (VFR output), saving ~{frames}/{total} frames", # Decimate Enabled Log
+    "log.encoder.decimate_skipped": " -> Only about {ratio:.1f}% duplicate frames, keeping constant frame rate", # Decimate Skipped Log
+    "log.encoder.repair_decimate_skipped": " -> Duplicate frames were dropped, skipping weak segment repair", # Repair Skipped For Decimate Log
+    "log.encoder.status_quarantined": "⛔ Quarantined", # Status: Quarantined
+    "log.encoder.quarantine_skip": "⛔ {fname} failed {failures} times and is quarantined, skipping (last error: {error})", # Quarantine Skip Log
+    "log.encoder.quarantined": "⛔ {fname} failed {failures} times and was quarantined; later batches will skip it (delete quarantine.json in the cache folder to reset)", # Quarantined Log
+    "log.encoder.failure_retry": "🔁 Encode failed, retrying ({attempt}/{retries})...", # Failure Retry Log
+    "log.encoder.failure_fallback": "🔀 {encoder} failed, re-searching and encoding with {fallback}...", # Failure Fallback Log
+    "log.encoder.circuit_tripped": "🧯 {encoder} crashed {count} times in a row, disabled for the rest of this batch", # Circuit Breaker Tripped Log
+    "log.encoder.circuit_open": " -> {encoder} is disabled by the circuit breaker, using {fallback}", # Circuit Open Log
+    "log.encoder.circuit_no_fallback": "❌ {encoder} is disabled and no fallback encoder is available, skipping this file", # Circuit No Fallback Log
+    "log.encoder.watchdog_killed": "⏱️ Watchdog: {tool} made no progress for {seconds}s, treating it as hung and killing the process tree", # Watchdog Killed Log
+    "log.encoder.fast_lane": "⚡ Fast lane: {count} short clips on {slots} concurrent slots (no search, no cooldown)", # Fast Lane Log
+    "log.encoder.fast_lane_crf": "⚡ Fast lane: using {source} value {icq}, search skipped", # Fast Lane CRF Log
+    "log.encoder.fast_lane_source_file": "the cached", # Source: File Cache
+    "log.encoder.fast_lane_source_folder": "the per-folder", # Source: Folder
+    "log.encoder.fast_lane_source_predicted": "the predicted", # Source: Predicted
+    "log.encoder.fast_lane_no_crf": " -> Fast lane: no cached value yet, running the search", # Fast Lane No CRF Log
+    "log.encoder.deadline_mode": "⏰ Deadline mode: must finish by {deadline}, choosing a preset per file from measured speeds", # Deadline Mode Log
+    "log.encoder.deadline_invalid": "⚠️ Could not parse deadline \"{value}\" (format: HH:MM or YYYY-MM-DD HH:MM), using the fixed preset", # Deadline Invalid Log
+    "log.encoder.deadline_plan": "⏰ Using preset {preset} for this file; {remaining} remaining files expected to finish at {finish} (deadline achievable)", # Deadline Plan Log
+    "log.encoder.deadline_unreachable": "⚠️ Even at the fastest preset {preset}, {remaining} remaining files are expected to finish at {finish}; the deadline cannot be met", # Deadline Unreachable Log
+    "home.action_card.queue_order.added": "Order Added", # Queue Order: Added
+    "home.action_card.queue_order.shortest": "Shortest First", # Queue Order: Shortest
+    "home.action_card.queue_order.savings": "Biggest Savings First", # Queue Order: Savings
+    "home.action_card.queue_order.folder": "By Folder / Series", # Queue Order: Folder
+    "home.action_card.queue_order.disk": "Round-Robin Disks", # Queue Order: Disks
+    "home.action_card.queue_order.tooltip": "Processing order of the encode queue", # Queue Order Tooltip
+    "log.encoder.queue_order": "📋 Queue order: {mode}", # Queue Order Log
+    "log.encoder.temp_cross_volume": "⚠️ Destination volume not writable, temp file placed in {dir}; a cross-volume copy will follow", # Temp Cross Volume Warning
+    "log.encoder.finalize_queued": "📦 Copying output to {dest} in the background, moving on to the next file", # Background Finalize Log
+    "log.encoder.status_copying": "Copying", # Status: Copying
+    "log.encoder.finalize_wait": "⏳ Waiting for {count} output(s) to finish copying...", # Finalize Wait Log
+    "log.encoder.disk_space_short": "💾 Disk space may run out: {dir} needs about {need}, {free} free; new files will be held when space runs low", # Disk Space Preflight Warning
+    "log.encoder.disk_space_paused": "⏸️ Low disk space ({dir} needs {need}, {free} free); holding new files until space is freed", # Disk Space Paused Log
+    "log.encoder.disk_space_resumed": "▶️ Disk space available again, resuming", # Disk Space Resumed Log
+    "log.encoder.status_waiting_space": "Waiting for Space", # Status: Waiting for Space
+    "log.encoder.staging_enabled": "📥 Read-ahead staging on: copying the next {count} source(s) to the local cache (up to {budget:g} GB)", # Staging Enabled Log
+    "log.encoder.staging_used": "📥 Using the locally staged copy for search and encode", # Staging Used Log
+    "log.encoder.scratch_enabled": "🧮 Search samples use RAM scratch: {dir} (budget {budget})", # RAM Scratch Enabled Log
+    "log.encoder.scratch_unavailable": "⚠️ RAM scratch directory unavailable ({dir}); search samples stay on the disk cache", # RAM Scratch Unavailable Log
+    "log.encoder.scratch_usage": "    -> Search scratch peak: {size} ({location})", # Scratch Usage Log
+    "log.encoder.scratch_ram": "RAM", # Scratch Location: RAM
+    "log.encoder.scratch_disk": "disk", # Scratch Location: Disk
+    "log.cache.orphans_swept": "🧹 Swept {count} cache leftovers from previous runs ({size})", # Cache Orphan Sweep Log
+    "log.cache.evicted": "🧹 Cache over its size cap, evicted {count} least recently used item(s) ({size})", # Cache Eviction Log
+    "log.encoder.integrity_start": "🩺 Integrity pre-scan: checking {count} source(s) ({mode})...", # Integrity Scan Start Log
+    "log.encoder.integrity_mode_sample": "sampled decode", # Scan Mode: Sample
+    "log.encoder.integrity_mode_full": "full decode", # Scan Mode: Full
+    "log.encoder.integrity_flagged": "⚠️ Source may be corrupt: {fname} ({count} decode error(s): {error}); it will still be encoded", # Integrity Flagged Log
+    "log.encoder.integrity_skipped": "⛔ Source is corrupt, skipped: {fname} ({count} decode error(s): {error})", # Integrity Skipped Log
+    "log.encoder.integrity_done": "🩺 Integrity pre-scan done: {ok} OK, {bad} with errors", # Integrity Scan Done Log
+    "log.encoder.integrity_none_left": "⛔ No sources passed the integrity pre-scan; nothing to encode", # Integrity None Left Log
+    "log.encoder.status_corrupt": "Corrupt Source", # Status: Corrupt Source
+    "home.action_card.governor.off": "Governor: Off", # Governor: Off
+    "home.action_card.governor.auto": "Governor: By Schedule", # Governor: Auto
+    "home.action_card.governor.interactive": "Governor: Interactive", # Governor: Interactive
+    "home.action_card.governor.offhours": "Governor: Off-hours", # Governor: Off-hours
+    "home.action_card.governor.tooltip": "CPU / I/O priority, processor and concurrency limits for child processes; can be switched while encoding", # Governor Tooltip
+    "log.encoder.governor_profile": "🎛️ Resource governor: {profile}", # Governor Profile Log
+    "log.encoder.governor_off": "🎛️ Resource governor off; child processes restored to normal priority", # Governor Off Log
+    "log.encoder.status_waiting_governor": "Waiting for Slot", # Status: Waiting for Governor
+    "log.encoder.memory_ceiling": "🧠 Memory admission control: child process ceiling {ceiling}", # Memory Ceiling Log
+    "log.encoder.memory_wait": "⏳ Not enough memory, waiting for other jobs: needs ~{need}, in use {used} / {ceiling}", # Memory Wait Log
+    "log.encoder.memory_usage": "🧠 Peak memory: {peak} (estimated {estimate})", # Peak Memory Log
+    "log.encoder.finalize_kept": "💾 Encoded output kept at: {path}; move it to the destination manually", # Finalize Kept Output Log
+    "log.encoder.slot_exception": "Unexpected error while processing {filename}, file skipped: {error}", # Unexpected exception in a slot
+    "log.encoder.disk_space_forced": "⚠️ Disk space may be insufficient ({dir} needs about {need}, {free} free), but no other file holds space; starting anyway", # Admitted despite shortage with nothing else in flight
 }
\ No newline at end of file
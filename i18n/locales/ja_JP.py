@@ -167,7 +167,7 @@ translation = {
     "dialog.clear_list.yes_button": "確定 (Void)", # リストクリア確認ダイアログ「はい」ボタン
     "dialog.clear_list.cancel_button": "取消 (Stay)", # リストクリア確認ダイアログ「キャンセル」ボタン
     "dialog.clear_cache.title": "魔力残滓を粛清しますか？", # キャッシュクリア確認ダイアログタイトル
-    "dialog.clear_cache.content": "これらは錬成儀式中に生じた混沌の欠片 (*.temp.mkv) です。残しておくと世界線の安定に影響する可能性があります。\n\n対象領域：{path}\n\n粛清を実行すると、これらの欠片は完全に虚無へ帰し、復元できません。浄化術式を発動しますか？", # キャッシュクリア確認ダイアログ内容
+    "dialog.clear_cache.content": "これらは錬成儀式中に生じた混沌の欠片 (*.temp.mkv、探索サンプル、ステージングのコピーなど) です。残しておくと世界線の安定に影響する可能性があります。\n\n対象領域：{path}\n\n粛清を実行すると、これらの欠片は完全に虚無へ帰し、復元できません。浄化術式を発動しますか？", # キャッシュクリア確認ダイアログ内容
     "dialog.clear_cache.yes_button": "浄化発動 (Purify)", # キャッシュクリア確認ダイアログ「はい」ボタン
     "dialog.clear_cache.cancel_button": "結界維持", # キャッシュクリア確認ダイアログ「キャンセル」ボタン
     "dialog.error.skip_button": "スキップして継続 (Skip)", # エラーダイアログ「スキップ」ボタン
@@ -284,4 +284,108 @@ translation = {
     "log.encoder.info_multichannel": " -> 多重音場 ({channels}ch) を感知、現状を維持します。", # 多チャンネル情報ログ
     "log.encoder.info_loudnorm_enabled": " -> 音場調和 (Loudnorm): 有効 ({mode})", # ラウドネス均一化有効ログ
     "log.encoder.info_loudnorm_skipped": " -> 音場調和 (Loudnorm): スキップ ({mode})", # ラウドネス均一化スキップログ
+    "log.encoder.loudnorm_measure_start": " -> 音場測量 (Loudnorm 1パス目) を術式推演と同時に展開中...", # ラウドネス測定開始ログ
+    "log.encoder.loudnorm_measured": " -> 音場測量完了: {input_i} LUFS / TP {input_tp} dBTP / LRA {input_lra} LU、リニアゲインで調律します", # ラウドネス測定完了ログ
+    "log.encoder.loudnorm_cached": " -> 音場測量の記録あり ({input_i} LUFS)、測定をスキップします", # ラウドネス測定キャッシュヒットログ
+    "log.encoder.loudnorm_measure_failed": " -> 音場測量に失敗、シングルパスの動的調律に戻します", # ラウドネス測定失敗ログ
+    "log.encoder.loudnorm_multi_stream": " -> {count} 本の音声トラックを感知、シングルパスの動的調律を使用します", # 複数音声トラックのラウドネス情報ログ
+    "log.encoder.verify_passed": " -> 成果検収合格: VMAF {score:.2f} ≥ {target} (パラメータ {icq})", # VMAF 検収合格ログ
+    "log.encoder.verify_flagged": " -> 成果検収未達: VMAF {score:.2f} < {target} (パラメータ {icq})、ファイルをマークしました", # VMAF 検収未達ログ
+    "log.encoder.verify_requeue": " -> 成果検収未達: VMAF {score:.2f} < {target}、パラメータ {icq} -> {next_icq} で再錬成します", # VMAF 検収再エンコードログ
+    "log.encoder.verify_no_score": " -> 成果検収で VMAF スコアを取得できず、検収をスキップします", # VMAF 検収スコアなしログ
+    "log.encoder.verify_unsupported": " -> この FFmpeg は同時検収に非対応 (7.1+ と libvmaf が必要)、本バッチの検収を無効にして再錬成します", # VMAF 検収非対応ログ
+    "log.encoder.repair_start": " -> 術式の綻びを巡回中 (セグメント毎の VMAF、閾値 {threshold:.1f})...", # 弱セグメント検出開始ログ
+    "log.encoder.repair_none": " -> 弱いセグメントは見つかりません、術式は完全です", # 弱セグメントなしログ
+    "log.encoder.repair_found": " -> 弱いセグメントを {count} 箇所発見 ({frames}/{total} フレーム)、パラメータ {icq} で部分再鋳造中...", # 弱セグメント発見ログ
+    "log.encoder.repair_done": " -> 部分再鋳造完了: {count} 箇所を修復 [所要時間: {duration:.1f}s]", # 弱セグメント修復完了ログ
+    "log.encoder.repair_too_many": " -> 弱いセグメントが全体の {ratio:.0f}% を超過、部分再鋳造は割に合わないため結果を維持します", # 弱セグメント過多ログ
+    "log.encoder.repair_no_data": " -> フレーム毎のスコアまたはキーフレーム情報を取得できず、部分再鋳造をスキップします", # 弱セグメントデータなしログ
+    "log.encoder.repair_failed": " -> 部分再鋳造に失敗、元の結果を維持します", # 弱セグメント修復失敗ログ
+    "log.encoder.repair_failed_error": " -> 部分再鋳造異常: {error}、元の結果を維持します", # 弱セグメント修復異常ログ
+    "home.settings_card.nv_aq.label.cpu": "拡張分析 (CPU エンコーダーは対象外)", # CPU エンコーダー分析設定ラベル
+    "log.dependency.cpu_encoder_failed": ">>> CPU エンコーダー {encoder} の検知に失敗: {error}", # CPU エンコーダー検知失敗ログ
+    "log.encoder.cpu_plan": "🧮 CPU 並列計画: {instances} インスタンス × {threads} スレッド (解像度帯 {bucket}、利用可能な論理コア {cores})", # CPU 並列計画ログ
+    "log.encoder.cpu_plan_pinned": "    -> 各インスタンスを重複しない CPU セットに固定しました (モード: {mode})", # CPU 固定ログ
+    "log.dependency.device_found": "    -> {encoder} デバイス #{index} が利用可能", # ハードウェアデバイス検出ログ
+    "log.encoder.multi_gpu": "🖧 マルチ GPU: タスクを {count} 台のデバイスに分配します (割り当て: {mode})", # マルチ GPU 割り当てログ
+    "log.encoder.mixed_pool": "⚖️ 混合プール: GPU スロット {gpu} 個 + CPU スロット {cpu} 個で同時処理 (長尺/高解像度は GPU、短尺/低解像度は CPU を優先)", # 混合プールログ
+    "log.encoder.hw_decode_enabled": " -> ハードウェアデコードを有効化 ({hwaccel})、フレームは GPU メモリ上に保持されます", # ハードウェアデコード有効ログ
+    "log.encoder.hw_decode_unsupported": " -> ソース形式がハードウェアデコード非対応 ({codec} / {profile} / {pix_fmt})、ソフトウェアデコードを使用します", # ハードウェアデコード非対応ログ
+    "log.encoder.hw_decode_fallback": "⚠️ ハードウェアデコードに失敗、ソフトウェアデコードで再エンコードします...", # ハードウェアデコードフォールバックログ
+    "log.encoder.rendition_search": "🪜 レンディション {label}: 探索開始 (目標 VMAF {vmaf})...", # レンディション探索ログ
+    "log.encoder.rendition_skip": " -> レンディション {label} はソース解像度 ({height}p) 以上のためスキップ", # レンディションスキップログ
+    "log.encoder.rendition_hw_decode_disabled": " -> レンディションはメモリ上で縮小するため、このファイルではハードウェアデコードを使用しません", # レンディション HW デコード無効ログ
+    "log.encoder.rendition_done": "✅ レンディション {label} 完了 (パラメータ {icq}) -> {dest}", # レンディション完了ログ
+    "log.encoder.rendition_failed": "❌ レンディション {label} の出力に失敗しました", # レンディション失敗ログ
+    "log.encoder.crop_detected": "✂️ 黒帯を検出: {width}x{height} -> {w}x{h} にクロップ (オフセット {x},{y}、{agree}/{samples} サンプルが一致)", # 黒帯検出ログ
+    "log.encoder.crop_none": " -> 安定した黒帯は検出されませんでした、クロップしません", # 黒帯なしログ
+    "log.encoder.filter_hw_decode_disabled": " -> ビデオフィルター ({filter}) はメモリ上で処理するため、このファイルではハードウェアデコードを使用しません", # フィルター HW デコード無効ログ
+    "log.encoder.decimate_enabled": "🎞️ 重複フレームは約 {ratio:.1f}%、重複フレームを間引きます (可変フレームレート出力)、約 {frames}/{total} フレーム削減見込み", # 重複フレーム間引き有効ログ
+    "log.encoder.decimate_skipped": " -> 重複フレームは約 {ratio:.1f}% のみのため、固定フレームレートを維持します", # 重複フレーム間引きスキップログ
+    "log.encoder.repair_decimate_skipped": " -> 重複フレームを間引いたため、弱セグメント修復をスキップします", # 間引き時の修復スキップログ
+    "log.encoder.status_quarantined": "⛔ 隔離済み", # ステータス：隔離済み
+    "log.encoder.quarantine_skip": "⛔ {fname} は {failures} 回失敗したため隔離済み、スキップします (最後のエラー: {error})", # 隔離スキップログ
+    "log.encoder.quarantined": "⛔ {fname} は {failures} 回失敗したため隔離リストに追加、以降のバッチではスキップします (キャッシュフォルダの quarantine.json を削除すると解除)", # 隔離追加ログ
+    "log.encoder.failure_retry": "🔁 エンコードに失敗、再試行します ({attempt}/{retries})...", # 失敗再試行ログ
+    "log.encoder.failure_fallback": "🔀 {encoder} が失敗したため、{fallback} で再探索・エンコードします...", # 失敗フォールバックログ
+    "log.encoder.circuit_tripped": "🧯 {encoder} が {count} 回連続でクラッシュしたため、このバッチでは使用を停止します", # サーキットブレーカー作動ログ
+    "log.encoder.circuit_open": " -> {encoder} はサーキットブレーカーで停止中、{fallback} を使用します", # サーキット停止中ログ
+    "log.encoder.circuit_no_fallback": "❌ {encoder} は停止中で利用可能なフォールバックエンコーダーがないため、このファイルをスキップします", # フォールバックなしログ
+    "log.encoder.watchdog_killed": "⏱️ ウォッチドッグ: {tool} が {seconds} 秒間進捗なし、ハングと判断してプロセスツリーを終了します", # ウォッチドッグ終了ログ
+    "log.encoder.fast_lane": "⚡ 高速レーン: 短いクリップ {count} 件を {slots} スロットで同時エンコード (探索と冷却を省略)", # 高速レーンログ
+    "log.encoder.fast_lane_crf": "⚡ 高速レーン: {source}パラメータ {icq} を使用、探索を省略", # 高速レーンパラメータログ
+    "log.encoder.fast_lane_source_file": "このファイルのキャッシュ済み", # ソース：ファイルキャッシュ
+    "log.encoder.fast_lane_source_folder": "同じフォルダの", # ソース：フォルダ
+    "log.encoder.fast_lane_source_predicted": "同じ解像度から予測した", # ソース：予測
+    "log.encoder.fast_lane_no_crf": " -> 高速レーン: 利用可能な記録がないため探索します", # 高速レーン記録なしログ
+    "log.encoder.deadline_mode": "⏰ 期限モード: {deadline} までに完了するよう、実測速度からファイルごとに Preset を選択します", # 期限モードログ
+    "log.encoder.deadline_invalid": "⚠️ 期限 \"{value}\" を解析できません (形式: HH:MM または YYYY-MM-DD HH:MM)、固定の Preset を使用します", # 期限無効ログ
+    "log.encoder.deadline_plan": "⏰ このファイルは Preset {preset}、残り {remaining} ファイルは {finish} 完了見込み (期限に間に合います)", # 期限計画ログ
+    "log.encoder.deadline_unreachable": "⚠️ 最速の Preset {preset} でも残り {remaining} ファイルの完了は {finish} 見込みで、期限に間に合いません", # 期限達成不可ログ
+    "home.action_card.queue_order.added": "追加順", # キュー順序：追加順
+    "home.action_card.queue_order.shortest": "短い順", # キュー順序：短い順
+    "home.action_card.queue_order.savings": "削減量が多い順", # キュー順序：削減量順
+    "home.action_card.queue_order.folder": "フォルダ/シリーズ別", # キュー順序：フォルダ
+    "home.action_card.queue_order.disk": "ディスク順番", # キュー順序：ディスク
+    "home.action_card.queue_order.tooltip": "エンコードキューの処理順序", # キュー順序ツールチップ
+    "log.encoder.queue_order": "📋 キュー順序: {mode}", # キュー順序ログ
+    "log.encoder.temp_cross_volume": "⚠️ 出力先ディスクに書き込めないため一時ファイルを {dir} に配置します。完了後にディスク間コピーが必要です", # 一時ファイルのディスク間警告
+    "log.encoder.finalize_queued": "📦 出力をバックグラウンドで {dest} にコピーし、次のファイルへ進みます", # バックグラウンド仕上げログ
+    "log.encoder.status_copying": "コピー中", # 状態：コピー中
+    "log.encoder.finalize_wait": "⏳ {count} 件の出力のコピー完了を待っています...", # 仕上げ待機ログ
+    "log.encoder.disk_space_short": "💾 ディスク容量が不足する可能性があります: {dir} 必要量 約 {need}、空き {free}。不足時は新しいファイルの開始を保留します", # ディスク容量事前チェック警告
+    "log.encoder.disk_space_paused": "⏸️ ディスク容量不足 ({dir} 必要 {need}、空き {free})。空きができるまで新しいファイルの開始を保留します", # 容量不足保留ログ
+    "log.encoder.disk_space_resumed": "▶️ ディスク容量が確保できたため再開します", # 容量回復ログ
+    "log.encoder.status_waiting_space": "容量待ち", # 状態：容量待ち
+    "log.encoder.staging_enabled": "📥 先読みステージング有効: 次の {count} 件のソースをローカルキャッシュにコピーします (上限 {budget:g} GB)", # ステージング有効ログ
+    "log.encoder.staging_used": "📥 ローカルにステージングしたコピーで探索とエンコードを行います", # ステージング使用ログ
+    "log.encoder.scratch_enabled": "🧮 探索サンプルに RAM ディスクを使用: {dir} (予算 {budget})", # RAM スクラッチ有効ログ
+    "log.encoder.scratch_unavailable": "⚠️ RAM ディスクのディレクトリが使用できません ({dir})。探索サンプルはディスクキャッシュに書き込みます", # RAM スクラッチ使用不可ログ
+    "log.encoder.scratch_usage": "    -> 探索の一時領域ピーク: {size} ({location})", # スクラッチ使用量ログ
+    "log.encoder.scratch_ram": "RAM ディスク", # スクラッチ位置：RAM
+    "log.encoder.scratch_disk": "ディスク", # スクラッチ位置：ディスク
+    "log.cache.orphans_swept": "🧹 前回の実行で残ったキャッシュの残滓 {count} 件を削除しました ({size})", # キャッシュ残留物削除ログ
+    "log.cache.evicted": "🧹 キャッシュが上限を超えたため、最も古い {count} 件を削除しました ({size})", # キャッシュ削除ログ
+    "log.encoder.integrity_start": "🩺 整合性事前チェック: {count} 件のソースを確認中 ({mode})...", # 整合性チェック開始ログ
+    "log.encoder.integrity_mode_sample": "サンプルデコード", # チェックモード：サンプル
+    "log.encoder.integrity_mode_full": "フルデコード", # チェックモード：フル
+    "log.encoder.integrity_flagged": "⚠️ ソースが破損している可能性があります: {fname} (デコードエラー {count} 件: {error})。エンコードは続行します", # 破損フラグログ
+    "log.encoder.integrity_skipped": "⛔ ソースが破損しているためスキップ: {fname} (デコードエラー {count} 件: {error})", # 破損スキップログ
+    "log.encoder.integrity_done": "🩺 整合性事前チェック完了: 正常 {ok} 件、異常 {bad} 件", # 整合性チェック完了ログ
+    "log.encoder.integrity_none_left": "⛔ 整合性事前チェックを通過したソースがないため、エンコードするファイルがありません", # エンコード対象なしログ
+    "log.encoder.status_corrupt": "ソース破損", # 状態：ソース破損
+    "home.action_card.governor.off": "リソース制御: オフ", # リソース制御：オフ
+    "home.action_card.governor.auto": "リソース制御: 時間帯で切替", # リソース制御：自動
+    "home.action_card.governor.interactive": "リソース制御: 作業時間", # リソース制御：作業時間
+    "home.action_card.governor.offhours": "リソース制御: 時間外", # リソース制御：時間外
+    "home.action_card.governor.tooltip": "子プロセスの CPU / I/O 優先度、プロセッサと同時実行数の制限。エンコード中も切り替え可能", # リソース制御ツールチップ
+    "log.encoder.governor_profile": "🎛️ リソース制御: {profile}", # リソースプロファイルログ
+    "log.encoder.governor_off": "🎛️ リソース制御をオフにしました。子プロセスの優先度を通常に戻します", # リソース制御オフログ
+    "log.encoder.status_waiting_governor": "実行枠待ち", # 状態：実行枠待ち
+    "log.encoder.memory_ceiling": "🧠 メモリ受け入れ制御: 子プロセスの上限 {ceiling}", # メモリ上限ログ
+    "log.encoder.memory_wait": "⏳ メモリ不足のため他のジョブを待機中: 必要量 約 {need}、使用中 {used} / {ceiling}", # メモリ待機ログ
+    "log.encoder.memory_usage": "🧠 ピークメモリ: {peak} (推定 {estimate})", # ピークメモリログ
+    "log.encoder.finalize_kept": "💾 エンコード出力を保持しました: {path}。手動で保存先へ移動してください", # 出力保持ログ
+    "log.encoder.slot_exception": "{filename} の処理中に予期しないエラーが発生したため、スキップしました：{error}", # スロット処理中の予期しない例外
+    "log.encoder.disk_space_forced": "⚠️ ディスク容量が不足する可能性があります ({dir} 必要見込み {need}、空き {free})。他に使用中のファイルがないため開始します", # 他に使用中がない場合は容量不足でも開始
 }
\ No newline at end of file
@@ -167,7 +167,7 @@ translation = {
     "dialog.clear_list.yes_button": "确定 (Void)", # 清空列表确认对话框“是”按钮
     "dialog.clear_list.cancel_button": "取消 (Stay)", # 清空列表确认对话框“取消”按钮
     "dialog.clear_cache.title": "确认要肃清魔力残渣吗？", # 清除缓存确认对话框标题
-    "dialog.clear_cache.content": "这些是炼成仪式中产生的混沌碎片 (*.temp.mkv)，继续留存可能会干扰世界线的稳定。\n\n目标区域：{path}\n\n一旦执行肃清，这些碎片将彻底归于虚无，无法找回。确定要发动净化术式吗？", # 清除缓存确认对话框内容
+    "dialog.clear_cache.content": "这些是炼成仪式中产生的混沌碎片 (*.temp.mkv、探测样本、暂存副本等)，继续留存可能会干扰世界线的稳定。\n\n目标区域：{path}\n\n一旦执行肃清，这些碎片将彻底归于虚无，无法找回。确定要发动净化术式吗？", # 清除缓存确认对话框内容
     "dialog.clear_cache.yes_button": "发动净化 (Purify)", # 清除缓存确认对话框“是”按钮
     "dialog.clear_cache.cancel_button": "维持结界", # 清除缓存确认对话框“取消”按钮
     "dialog.error.skip_button": "跳过并继续 (Skip)", # 错误对话框“跳过”按钮
@@ -284,4 +284,108 @@ translation = {
     "log.encoder.info_multichannel": " -> 感知到多重声场 ({channels}ch)，已保持原样。", # 多声道信息日志
     "log.encoder.info_loudnorm_enabled": " -> 声场调和 (Loudnorm): 启用 ({mode})", # 响度均衡启用日志
     "log.encoder.info_loudnorm_skipped": " -> 声场调和 (Loudnorm): 跳过 ({mode})", # 响度均衡跳过日志
+    "log.encoder.loudnorm_measure_start": " -> 声场测绘 (Loudnorm 第一遍) 已与术式推演同步展开...", # 响度测量开始日志
+    "log.encoder.loudnorm_measured": " -> 声场测绘完成: {input_i} LUFS / TP {input_tp} dBTP / LRA {input_lra} LU，将以线性增益调和", # 响度测量完成日志
+    "log.encoder.loudnorm_cached": " -> 声场测绘记录已存在 ({input_i} LUFS)，跳过测量", # 响度测量缓存命中日志
+    "log.encoder.loudnorm_measure_failed": " -> 声场测绘失败，回退为单遍动态调和", # 响度测量失败日志
+    "log.encoder.loudnorm_multi_stream": " -> 感知到 {count} 条音轨，使用单遍动态调和", # 多音轨响度信息日志
+    "log.encoder.verify_passed": " -> 成果验收通过: VMAF {score:.2f} ≥ {target} (参数 {icq})", # VMAF 验收通过日志
+    "log.encoder.verify_flagged": " -> 成果验收未达标: VMAF {score:.2f} < {target} (参数 {icq})，已标记该文件", # VMAF 验收未达标日志
+    "log.encoder.verify_requeue": " -> 成果验收未达标: VMAF {score:.2f} < {target}，以参数 {icq} -> {next_icq} 重新炼成", # VMAF 验收重编码日志
+    "log.encoder.verify_no_score": " -> 成果验收未能取得 VMAF 分数，跳过验收", # VMAF 验收无分数日志
+    "log.encoder.verify_unsupported": " -> 当前 FFmpeg 不支持同步验收 (需 7.1+ 且含 libvmaf)，本批次已关闭验收并重新炼成", # VMAF 验收不支持日志
+    "log.encoder.repair_start": " -> 正在巡查术式薄弱处 (逐片段 VMAF，阈值 {threshold:.1f})...", # 弱片段检测开始日志
+    "log.encoder.repair_none": " -> 未发现薄弱片段，术式完整", # 无弱片段日志
+    "log.encoder.repair_found": " -> 发现 {count} 处薄弱片段 ({frames}/{total} 帧)，以参数 {icq} 局部重铸...", # 发现弱片段日志
+    "log.encoder.repair_done": " -> 局部重铸完成: 已修复 {count} 处片段 [耗时: {duration:.1f}s]", # 弱片段修复完成日志
+    "log.encoder.repair_too_many": " -> 薄弱片段超过全片 {ratio:.0f}%，局部重铸不划算，保留原成果", # 弱片段过多日志
+    "log.encoder.repair_no_data": " -> 无法取得逐帧评分或关键帧信息，跳过局部重铸", # 弱片段无数据日志
+    "log.encoder.repair_failed": " -> 局部重铸失败，保留原成果", # 弱片段修复失败日志
+    "log.encoder.repair_failed_error": " -> 局部重铸异常: {error}，保留原成果", # 弱片段修复异常日志
+    "home.settings_card.nv_aq.label.cpu": "增强分析 (CPU 编码器不适用)", # CPU 编码器增强分析设置标签
+    "log.dependency.cpu_encoder_failed": ">>> CPU 编码器 {encoder} 检测失败: {error}", # CPU 编码器检测失败日志
+    "log.encoder.cpu_plan": "🧮 CPU 并行规划: {instances} 个实例 × {threads} 线程 (分辨率档位 {bucket}，可用 {cores} 个逻辑核心)", # CPU 并行规划日志
+    "log.encoder.cpu_plan_pinned": "    -> 各实例已绑定到互不重叠的处理器集合 (模式: {mode})", # CPU 绑定日志
+    "log.dependency.device_found": "    -> {encoder} 设备 #{index} 可用", # 检测到硬件设备日志
+    "log.encoder.multi_gpu": "🖧 多显卡协同: 任务将分配到 {count} 个设备 (分配方式: {mode})", # 多显卡分配日志
+    "log.encoder.mixed_pool": "⚖️ 混合池: {gpu} 个 GPU 槽位 + {cpu} 个 CPU 槽位同时工作 (长片/高分辨率优先交给 GPU，短片/低分辨率优先交给 CPU)", # 混合池日志
+    "log.encoder.hw_decode_enabled": " -> 启用硬件解码 ({hwaccel})，画面全程保留在显存中", # 硬件解码启用日志
+    "log.encoder.hw_decode_unsupported": " -> 源格式不支持硬件解码 ({codec} / {profile} / {pix_fmt})，使用软件解码", # 硬件解码不支持日志
+    "log.encoder.hw_decode_fallback": "⚠️ 硬件解码失败，回退到软件解码重新编码...", # 硬件解码回退日志
+    "log.encoder.rendition_search": "🪜 规格 {label}: 开始探测 (目标 VMAF {vmaf})...", # 多规格探测日志
+    "log.encoder.rendition_skip": " -> 规格 {label} 不低于源分辨率 ({height}p)，跳过", # 多规格跳过日志
+    "log.encoder.rendition_hw_decode_disabled": " -> 多规格输出需在内存中缩放，本文件不使用硬件解码", # 多规格禁用硬件解码日志
+    "log.encoder.rendition_done": "✅ 规格 {label} 完成 (参数 {icq}) -> {dest}", # 多规格完成日志
+    "log.encoder.rendition_failed": "❌ 规格 {label} 输出失败", # 多规格失败日志
+    "log.encoder.crop_detected": "✂️ 检测到黑边: {width}x{height} -> 裁剪为 {w}x{h} (偏移 {x},{y}，{agree}/{samples} 个采样点一致)", # 黑边检测结果日志
+    "log.encoder.crop_none": " -> 未检测到稳定的黑边，不裁剪", # 黑边检测无结果日志
+    "log.encoder.filter_hw_decode_disabled": " -> 视频滤镜 ({filter}) 需在内存中处理，本文件不使用硬件解码", # 滤镜禁用硬件解码日志
+    "log.encoder.decimate_enabled": "🎞️ 重复帧约占 {ratio:.1f}%，启用丢弃重复帧 (可变帧率输出)，预计省去 {frames}/{total} 帧", # 重复帧丢弃启用日志
+    "log.encoder.decimate_skipped": " -> 重复帧仅约 {ratio:.1f}%，不值得丢弃，保持恒定帧率", # 重复帧丢弃跳过日志
+    "log.encoder.repair_decimate_skipped": " -> 已丢弃重复帧，跳过弱片段修复", # 重复帧跳过修复日志
+    "log.encoder.status_quarantined": "⛔ 已隔离", # 状态：已隔离
+    "log.encoder.quarantine_skip": "⛔ {fname} 已连续失败 {failures} 次，已隔离并跳过 (最后错误: {error})", # 隔离跳过日志
+    "log.encoder.quarantined": "⛔ {fname} 已失败 {failures} 次，加入隔离列表，之后的批次将跳过 (删除缓存目录中的 quarantine.json 可解除)", # 加入隔离日志
+    "log.encoder.failure_retry": "🔁 编码失败，重试 ({attempt}/{retries})...", # 失败重试日志
+    "log.encoder.failure_fallback": "🔀 {encoder} 编码失败，改用 {fallback} 重新探测并编码...", # 失败回退日志
+    "log.encoder.circuit_tripped": "🧯 {encoder} 已连续崩溃 {count} 次，本批次停止使用该编码器", # 编码器熔断日志
+    "log.encoder.circuit_open": " -> {encoder} 已熔断，直接使用 {fallback}", # 熔断回退日志
+    "log.encoder.circuit_no_fallback": "❌ {encoder} 已熔断且没有可用的回退编码器，跳过该文件", # 熔断无回退日志
+    "log.encoder.watchdog_killed": "⏱️ 看门狗: {tool} 已 {seconds} 秒没有进展，判定为卡死并结束进程树", # 看门狗结束进程日志
+    "log.encoder.fast_lane": "⚡ 快速通道: {count} 个短片，{slots} 个槽位同时编码 (跳过探测与降温)", # 快速通道日志
+    "log.encoder.fast_lane_crf": "⚡ 快速通道: 使用{source}参数 {icq}，跳过探测", # 快速通道参数日志
+    "log.encoder.fast_lane_source_file": "该文件已缓存的", # 参数来源：文件缓存
+    "log.encoder.fast_lane_source_folder": "同文件夹的", # 参数来源：文件夹
+    "log.encoder.fast_lane_source_predicted": "同分辨率预测的", # 参数来源：预测
+    "log.encoder.fast_lane_no_crf": " -> 快速通道: 暂无可用的参数记录，执行探测", # 快速通道无记录日志
+    "log.encoder.deadline_mode": "⏰ 截止时间模式: 需在 {deadline} 前完成，按实测速度为每个文件选择 Preset", # 截止时间模式日志
+    "log.encoder.deadline_invalid": "⚠️ 无法解析截止时间 \"{value}\" (格式: HH:MM 或 YYYY-MM-DD HH:MM)，使用固定 Preset", # 截止时间无效日志
+    "log.encoder.deadline_plan": "⏰ 本文件使用 Preset {preset}，剩余 {remaining} 个文件预计 {finish} 完成 (可赶上截止时间)", # 截止时间规划日志
+    "log.encoder.deadline_unreachable": "⚠️ 即使使用最快的 Preset {preset}，剩余 {remaining} 个文件预计 {finish} 才能完成，无法赶上截止时间", # 截止时间无法达成日志
+    "home.action_card.queue_order.added": "按添加顺序", # 队列排序：添加顺序
+    "home.action_card.queue_order.shortest": "最短优先", # 队列排序：最短优先
+    "home.action_card.queue_order.savings": "节省最多优先", # 队列排序：节省优先
+    "home.action_card.queue_order.folder": "按文件夹/系列", # 队列排序：文件夹
+    "home.action_card.queue_order.disk": "各磁盘轮流", # 队列排序：磁盘轮流
+    "home.action_card.queue_order.tooltip": "编码队列的处理顺序", # 队列排序提示
+    "log.encoder.queue_order": "📋 队列排序: {mode}", # 队列排序日志
+    "log.encoder.temp_cross_volume": "⚠️ 目标磁盘不可写，临时文件放在 {dir}，完成后需跨盘复制", # 临时文件跨盘警告
+    "log.encoder.finalize_queued": "📦 输出将在后台复制到 {dest}，继续处理下一个文件", # 后台收尾日志
+    "log.encoder.status_copying": "复制中", # 状态：复制中
+    "log.encoder.finalize_wait": "⏳ 等待 {count} 个输出完成复制...", # 等待后台收尾日志
+    "log.encoder.disk_space_short": "💾 磁盘空间可能不足: {dir} 预计需要 {need}，剩余 {free}；空间不足时将暂停领取新文件", # 磁盘空间预检警告
+    "log.encoder.disk_space_paused": "⏸️ 磁盘空间不足 ({dir} 需要 {need}，剩余 {free})，暂停领取新文件，释放空间后自动继续", # 空间不足暂停日志
+    "log.encoder.disk_space_resumed": "▶️ 磁盘空间已释放，继续处理", # 空间恢复日志
+    "log.encoder.status_waiting_space": "等待磁盘空间", # 状态：等待空间
+    "log.encoder.staging_enabled": "📥 预读暂存已开启: 提前复制接下来 {count} 个源文件到本地缓存 (上限 {budget:g} GB)", # 预读暂存开启日志
+    "log.encoder.staging_used": "📥 使用本地暂存副本进行探测与编码", # 使用暂存副本日志
+    "log.encoder.scratch_enabled": "🧮 探测样本使用内存盘: {dir} (预算 {budget})", # 内存盘开启日志
+    "log.encoder.scratch_unavailable": "⚠️ 内存盘目录不可用 ({dir})，探测样本仍写入磁盘缓存", # 内存盘不可用日志
+    "log.encoder.scratch_usage": "    -> 探测临时空间峰值: {size} ({location})", # 探测临时空间日志
+    "log.encoder.scratch_ram": "内存盘", # 临时空间位置：内存盘
+    "log.encoder.scratch_disk": "磁盘", # 临时空间位置：磁盘
+    "log.cache.orphans_swept": "🧹 已清理上次运行遗留的 {count} 个缓存残渣 ({size})", # 缓存遗留清理日志
+    "log.cache.evicted": "🧹 缓存超出上限，已淘汰 {count} 个最久未使用的文件 ({size})", # 缓存淘汰日志
+    "log.encoder.integrity_start": "🩺 完整性预检: 检查 {count} 个源文件 ({mode})...", # 完整性预检开始日志
+    "log.encoder.integrity_mode_sample": "抽样解码", # 预检模式：抽样
+    "log.encoder.integrity_mode_full": "完整解码", # 预检模式：完整
+    "log.encoder.integrity_flagged": "⚠️ 源文件可能已损坏: {fname} ({count} 条解码错误: {error})，仍将尝试编码", # 源文件损坏标记日志
+    "log.encoder.integrity_skipped": "⛔ 源文件已损坏，跳过: {fname} ({count} 条解码错误: {error})", # 源文件损坏跳过日志
+    "log.encoder.integrity_done": "🩺 完整性预检完成: {ok} 个正常，{bad} 个异常", # 完整性预检完成日志
+    "log.encoder.integrity_none_left": "⛔ 所有源文件均未通过完整性预检，没有可编码的文件", # 无可编码文件日志
+    "log.encoder.status_corrupt": "源文件损坏", # 状态：源文件损坏
+    "home.action_card.governor.off": "资源调控: 关闭", # 资源调控：关闭
+    "home.action_card.governor.auto": "资源调控: 按时段", # 资源调控：按时段
+    "home.action_card.governor.interactive": "资源调控: 工作时段", # 资源调控：工作时段
+    "home.action_card.governor.offhours": "资源调控: 空闲时段", # 资源调控：空闲时段
+    "home.action_card.governor.tooltip": "子进程的 CPU / I/O 优先级、处理器与并发数限制，编码期间可随时切换", # 资源调控提示
+    "log.encoder.governor_profile": "🎛️ 资源调控: {profile}", # 资源配置日志
+    "log.encoder.governor_off": "🎛️ 资源调控已关闭，子进程恢复普通优先级", # 资源调控关闭日志
+    "log.encoder.status_waiting_governor": "等待资源名额", # 状态：等待资源名额
+    "log.encoder.memory_ceiling": "🧠 内存准入控制: 子进程内存上限 {ceiling}", # 内存上限日志
+    "log.encoder.memory_wait": "⏳ 内存不足，等待其他任务释放: 预计需要 {need}，已占用 {used} / {ceiling}", # 等待内存日志
+    "log.encoder.memory_usage": "🧠 峰值内存: {peak} (预估 {estimate})", # 峰值内存日志
+    "log.encoder.finalize_kept": "💾 编码输出已保留: {path}，可手动移动到目标位置", # 收尾失败保留输出日志
+    "log.encoder.slot_exception": "处理 {filename} 时发生意外错误，已跳过该文件：{error}", # 槽位处理文件时的意外异常
+    "log.encoder.disk_space_forced": "⚠️ 磁盘空间可能不足 ({dir} 预计需要 {need}，剩余 {free})，但没有其他文件占用空间，仍然开始处理", # 无其他占用时空间不足仍放行
 }
@@ -167,7 +167,7 @@ translation = {
     "dialog.clear_list.yes_button": "確定 (Void)", # 清空列表確認對話方塊「是」按鈕
     "dialog.clear_list.cancel_button": "取消 (Stay)", # 清空列表確認對話方塊「取消」按鈕
     "dialog.clear_cache.title": "確認要肅清魔力殘渣嗎？", # 清除快取確認對話方塊標題
-    "dialog.clear_cache.content": "這些是鍊成儀式中產生的混沌碎片 (*.temp.mkv)，繼續留存可能會干擾世界線的穩定。\n\n目標區域：{path}\n\n一旦執行肅清，這些碎片將徹底歸於虛無，無法找回。確定要發動淨化術式嗎？", # 清除快取確認對話方塊內容
+    "dialog.clear_cache.content": "這些是鍊成儀式中產生的混沌碎片 (*.temp.mkv、探測樣本、暫存副本等)，繼續留存可能會干擾世界線的穩定。\n\n目標區域：{path}\n\n一旦執行肅清，這些碎片將徹底歸於虛無，無法找回。確定要發動淨化術式嗎？", # 清除快取確認對話方塊內容
     "dialog.clear_cache.yes_button": "發動淨化 (Purify)", # 清除快取確認對話方塊「是」按鈕
     "dialog.clear_cache.cancel_button": "維持結界", # 清除快取確認對話方塊「取消」按鈕
     "dialog.error.skip_button": "跳過並繼續 (Skip)", # 錯誤對話方塊「跳過」按鈕
@@ -284,4 +284,108 @@ translation = {
     "log.encoder.info_multichannel": " -> 感知到多重聲場 ({channels}ch)，已保持原樣。", # 多聲道資訊日誌
     "log.encoder.info_loudnorm_enabled": " -> 聲場調和 (Loudnorm): 啟用 ({mode})", # 響度均衡啟用日誌
     "log.encoder.info_loudnorm_skipped": " -> 聲場調和 (Loudnorm): 跳過 ({mode})", # 響度均衡跳過日誌
+    "log.encoder.loudnorm_measure_start": " -> 聲場測繪 (Loudnorm 第一遍) 已與術式推演同步展開...", # 響度測量開始日誌
+    "log.encoder.loudnorm_measured": " -> 聲場測繪完成: {input_i} LUFS / TP {input_tp} dBTP / LRA {input_lra} LU，將以線性增益調和", # 響度測量完成日誌
+    "log.encoder.loudnorm_cached": " -> 聲場測繪記錄已存在 ({input_i} LUFS)，跳過測量", # 響度測量快取命中日誌
+    "log.encoder.loudnorm_measure_failed": " -> 聲場測繪失敗，回退為單遍動態調和", # 響度測量失敗日誌
+    "log.encoder.loudnorm_multi_stream": " -> 感知到 {count} 條音軌，使用單遍動態調和", # 多音軌響度資訊日誌
+    "log.encoder.verify_passed": " -> 成果驗收通過: VMAF {score:.2f} ≥ {target} (參數 {icq})", # VMAF 驗收通過日誌
+    "log.encoder.verify_flagged": " -> 成果驗收未達標: VMAF {score:.2f} < {target} (參數 {icq})，已標記該檔案", # VMAF 驗收未達標日誌
+    "log.encoder.verify_requeue": " -> 成果驗收未達標: VMAF {score:.2f} < {target}，以參數 {icq} -> {next_icq} 重新煉成", # VMAF 驗收重編碼日誌
+    "log.encoder.verify_no_score": " -> 成果驗收未能取得 VMAF 分數，跳過驗收", # VMAF 驗收無分數日誌
+    "log.encoder.verify_unsupported": " -> 目前 FFmpeg 不支援同步驗收 (需 7.1+ 且含 libvmaf)，本批次已關閉驗收並重新煉成", # VMAF 驗收不支援日誌
+    "log.encoder.repair_start": " -> 正在巡查術式薄弱處 (逐片段 VMAF，閾值 {threshold:.1f})...", # 弱片段檢測開始日誌
+    "log.encoder.repair_none": " -> 未發現薄弱片段，術式完整", # 無弱片段日誌
+    "log.encoder.repair_found": " -> 發現 {count} 處薄弱片段 ({frames}/{total} 幀)，以參數 {icq} 局部重鑄...", # 發現弱片段日誌
+    "log.encoder.repair_done": " -> 局部重鑄完成: 已修復 {count} 處片段 [耗時: {duration:.1f}s]", # 弱片段修復完成日誌
+    "log.encoder.repair_too_many": " -> 薄弱片段超過全片 {ratio:.0f}%，局部重鑄不划算，保留原成果", # 弱片段過多日誌
+    "log.encoder.repair_no_data": " -> 無法取得逐幀評分或關鍵幀資訊，跳過局部重鑄", # 弱片段無資料日誌
+    "log.encoder.repair_failed": " -> 局部重鑄失敗，保留原成果", # 弱片段修復失敗日誌
+    "log.encoder.repair_failed_error": " -> 局部重鑄異常: {error}，保留原成果", # 弱片段修復異常日誌
+    "home.settings_card.nv_aq.label.cpu": "增強分析 (CPU 編碼器不適用)", # CPU 編碼器增強分析設定標籤
+    "log.dependency.cpu_encoder_failed": ">>> CPU 編碼器 {encoder} 檢測失敗: {error}", # CPU 編碼器檢測失敗日誌
+    "log.encoder.cpu_plan": "🧮 CPU 並行規劃: {instances} 個實例 × {threads} 執行緒 (解析度檔位 {bucket}，可用 {cores} 個邏輯核心)", # CPU 並行規劃日誌
+    "log.encoder.cpu_plan_pinned": "    -> 各實例已綁定到互不重疊的處理器集合 (模式: {mode})", # CPU 綁定日誌
+    "log.dependency.device_found": "    -> {encoder} 裝置 #{index} 可用", # 檢測到硬體裝置日誌
+    "log.encoder.multi_gpu": "🖧 多顯卡協同: 任務將分配到 {count} 個裝置 (分配方式: {mode})", # 多顯卡分配日誌
+    "log.encoder.mixed_pool": "⚖️ 混合池: {gpu} 個 GPU 槽位 + {cpu} 個 CPU 槽位同時工作 (長片/高解析度優先交給 GPU，短片/低解析度優先交給 CPU)", # 混合池日誌
+    "log.encoder.hw_decode_enabled": " -> 啟用硬體解碼 ({hwaccel})，畫面全程保留在顯存中", # 硬體解碼啟用日誌
+    "log.encoder.hw_decode_unsupported": " -> 來源格式不支援硬體解碼 ({codec} / {profile} / {pix_fmt})，使用軟體解碼", # 硬體解碼不支援日誌
+    "log.encoder.hw_decode_fallback": "⚠️ 硬體解碼失敗，回退到軟體解碼重新編碼...", # 硬體解碼回退日誌
+    "log.encoder.rendition_search": "🪜 規格 {label}: 開始探測 (目標 VMAF {vmaf})...", # 多規格探測日誌
+    "log.encoder.rendition_skip": " -> 規格 {label} 不低於來源解析度 ({height}p)，跳過", # 多規格跳過日誌
+    "log.encoder.rendition_hw_decode_disabled": " -> 多規格輸出需在記憶體中縮放，本檔案不使用硬體解碼", # 多規格停用硬體解碼日誌
+    "log.encoder.rendition_done": "✅ 規格 {label} 完成 (參數 {icq}) -> {dest}", # 多規格完成日誌
+    "log.encoder.rendition_failed": "❌ 規格 {label} 輸出失敗", # 多規格失敗日誌
+    "log.encoder.crop_detected": "✂️ 偵測到黑邊: {width}x{height} -> 裁切為 {w}x{h} (偏移 {x},{y}，{agree}/{samples} 個取樣點一致)", # 黑邊偵測結果日誌
+    "log.encoder.crop_none": " -> 未偵測到穩定的黑邊，不裁切", # 黑邊偵測無結果日誌
+    "log.encoder.filter_hw_decode_disabled": " -> 視訊濾鏡 ({filter}) 需在記憶體中處理，本檔案不使用硬體解碼", # 濾鏡停用硬體解碼日誌
+    "log.encoder.decimate_enabled": "🎞️ 重複影格約佔 {ratio:.1f}%，啟用捨棄重複影格 (可變影格率輸出)，預計省去 {frames}/{total} 影格", # 重複影格捨棄啟用日誌
+    "log.encoder.decimate_skipped": " -> 重複影格僅約 {ratio:.1f}%，不值得捨棄，保持固定影格率", # 重複影格捨棄跳過日誌
+    "log.encoder.repair_decimate_skipped": " -> 已捨棄重複影格，跳過弱片段修復", # 重複影格跳過修復日誌
+    "log.encoder.status_quarantined": "⛔ 已隔離", # 狀態：已隔離
+    "log.encoder.quarantine_skip": "⛔ {fname} 已連續失敗 {failures} 次，已隔離並跳過 (最後錯誤: {error})", # 隔離跳過日誌
+    "log.encoder.quarantined": "⛔ {fname} 已失敗 {failures} 次，加入隔離清單，之後的批次將跳過 (刪除快取目錄中的 quarantine.json 可解除)", # 加入隔離日誌
+    "log.encoder.failure_retry": "🔁 編碼失敗，重試 ({attempt}/{retries})...", # 失敗重試日誌
+    "log.encoder.failure_fallback": "🔀 {encoder} 編碼失敗，改用 {fallback} 重新探測並編碼...", # 失敗回退日誌
+    "log.encoder.circuit_tripped": "🧯 {encoder} 已連續崩潰 {count} 次，本批次停止使用該編碼器", # 編碼器熔斷日誌
+    "log.encoder.circuit_open": " -> {encoder} 已熔斷，直接使用 {fallback}", # 熔斷回退日誌
+    "log.encoder.circuit_no_fallback": "❌ {encoder} 已熔斷且沒有可用的回退編碼器，跳過該檔案", # 熔斷無回退日誌
+    "log.encoder.watchdog_killed": "⏱️ 看門狗: {tool} 已 {seconds} 秒沒有進展，判定為卡死並結束處理程序樹", # 看門狗結束處理程序日誌
+    "log.encoder.fast_lane": "⚡ 快速通道: {count} 個短片，{slots} 個槽位同時編碼 (跳過探測與降溫)", # 快速通道日誌
+    "log.encoder.fast_lane_crf": "⚡ 快速通道: 使用{source}參數 {icq}，跳過探測", # 快速通道參數日誌
+    "log.encoder.fast_lane_source_file": "該檔案已快取的", # 參數來源：檔案快取
+    "log.encoder.fast_lane_source_folder": "同資料夾的", # 參數來源：資料夾
+    "log.encoder.fast_lane_source_predicted": "同解析度預測的", # 參數來源：預測
+    "log.encoder.fast_lane_no_crf": " -> 快速通道: 暫無可用的參數記錄，執行探測", # 快速通道無記錄日誌
+    "log.encoder.deadline_mode": "⏰ 截止時間模式: 需在 {deadline} 前完成，依實測速度為每個檔案選擇 Preset", # 截止時間模式日誌
+    "log.encoder.deadline_invalid": "⚠️ 無法解析截止時間 \"{value}\" (格式: HH:MM 或 YYYY-MM-DD HH:MM)，使用固定 Preset", # 截止時間無效日誌
+    "log.encoder.deadline_plan": "⏰ 本檔案使用 Preset {preset}，剩餘 {remaining} 個檔案預計 {finish} 完成 (可趕上截止時間)", # 截止時間規劃日誌
+    "log.encoder.deadline_unreachable": "⚠️ 即使使用最快的 Preset {preset}，剩餘 {remaining} 個檔案預計 {finish} 才能完成，無法趕上截止時間", # 截止時間無法達成日誌
+    "home.action_card.queue_order.added": "依加入順序", # 佇列排序：加入順序
+    "home.action_card.queue_order.shortest": "最短優先", # 佇列排序：最短優先
+    "home.action_card.queue_order.savings": "節省最多優先", # 佇列排序：節省優先
+    "home.action_card.queue_order.folder": "依資料夾/系列", # 佇列排序：資料夾
+    "home.action_card.queue_order.disk": "各磁碟輪流", # 佇列排序：磁碟輪流
+    "home.action_card.queue_order.tooltip": "編碼佇列的處理順序", # 佇列排序提示
+    "log.encoder.queue_order": "📋 佇列排序: {mode}", # 佇列排序日誌
+    "log.encoder.temp_cross_volume": "⚠️ 目標磁碟不可寫入，暫存檔放在 {dir}，完成後需跨磁碟複製", # 暫存檔跨磁碟警告
+    "log.encoder.finalize_queued": "📦 輸出將在背景複製到 {dest}，繼續處理下一個檔案", # 背景收尾日誌
+    "log.encoder.status_copying": "複製中", # 狀態：複製中
+    "log.encoder.finalize_wait": "⏳ 等待 {count} 個輸出完成複製...", # 等待背景收尾日誌
+    "log.encoder.disk_space_short": "💾 磁碟空間可能不足: {dir} 預計需要 {need}，剩餘 {free}；空間不足時將暫停領取新檔案", # 磁碟空間預檢警告
+    "log.encoder.disk_space_paused": "⏸️ 磁碟空間不足 ({dir} 需要 {need}，剩餘 {free})，暫停領取新檔案，釋放空間後自動繼續", # 空間不足暫停日誌
+    "log.encoder.disk_space_resumed": "▶️ 磁碟空間已釋放，繼續處理", # 空間恢復日誌
+    "log.encoder.status_waiting_space": "等待磁碟空間", # 狀態：等待空間
+    "log.encoder.staging_enabled": "📥 預讀暫存已開啟: 提前複製接下來 {count} 個來源檔案到本機快取 (上限 {budget:g} GB)", # 預讀暫存開啟日誌
+    "log.encoder.staging_used": "📥 使用本機暫存副本進行探測與編碼", # 使用暫存副本日誌
+    "log.encoder.scratch_enabled": "🧮 探測樣本使用記憶體磁碟: {dir} (預算 {budget})", # 記憶體磁碟開啟日誌
+    "log.encoder.scratch_unavailable": "⚠️ 記憶體磁碟目錄無法使用 ({dir})，探測樣本仍寫入磁碟快取", # 記憶體磁碟不可用日誌
+    "log.encoder.scratch_usage": "    -> 探測暫存空間峰值: {size} ({location})", # 探測暫存空間日誌
+    "log.encoder.scratch_ram": "記憶體磁碟", # 暫存空間位置：記憶體磁碟
+    "log.encoder.scratch_disk": "磁碟", # 暫存空間位置：磁碟
+    "log.cache.orphans_swept": "🧹 已清理上次執行遺留的 {count} 個快取殘渣 ({size})", # 快取遺留清理日誌
+    "log.cache.evicted": "🧹 快取超出上限，已淘汰 {count} 個最久未使用的檔案 ({size})", # 快取淘汰日誌
+    "log.encoder.integrity_start": "🩺 完整性預檢: 檢查 {count} 個來源檔案 ({mode})...", # 完整性預檢開始日誌
+    "log.encoder.integrity_mode_sample": "抽樣解碼", # 預檢模式：抽樣
+    "log.encoder.integrity_mode_full": "完整解碼", # 預檢模式：完整
+    "log.encoder.integrity_flagged": "⚠️ 來源檔案可能已損壞: {fname} ({count} 條解碼錯誤: {error})，仍將嘗試編碼", # 來源檔案損壞標記日誌
+    "log.encoder.integrity_skipped": "⛔ 來源檔案已損壞，略過: {fname} ({count} 條解碼錯誤: {error})", # 來源檔案損壞略過日誌
+    "log.encoder.integrity_done": "🩺 完整性預檢完成: {ok} 個正常，{bad} 個異常", # 完整性預檢完成日誌
+    "log.encoder.integrity_none_left": "⛔ 所有來源檔案均未通過完整性預檢，沒有可編碼的檔案", # 無可編碼檔案日誌
+    "log.encoder.status_corrupt": "來源檔案損壞", # 狀態：來源檔案損壞
+    "home.action_card.governor.off": "資源調控: 關閉", # 資源調控：關閉
+    "home.action_card.governor.auto": "資源調控: 依時段", # 資源調控：依時段
+    "home.action_card.governor.interactive": "資源調控: 工作時段", # 資源調控：工作時段
+    "home.action_card.governor.offhours": "資源調控: 閒置時段", # 資源調控：閒置時段
+    "home.action_card.governor.tooltip": "子行程的 CPU / I/O 優先順序、處理器與並行數限制，編碼期間可隨時切換", # 資源調控提示
+    "log.encoder.governor_profile": "🎛️ 資源調控: {profile}", # 資源設定日誌
+    "log.encoder.governor_off": "🎛️ 資源調控已關閉，子行程恢復一般優先順序", # 資源調控關閉日誌
+    "log.encoder.status_waiting_governor": "等待資源名額", # 狀態：等待資源名額
+    "log.encoder.memory_ceiling": "🧠 記憶體准入控制: 子行程記憶體上限 {ceiling}", # 記憶體上限日誌
+    "log.encoder.memory_wait": "⏳ 記憶體不足，等待其他任務釋放: 預計需要 {need}，已佔用 {used} / {ceiling}", # 等待記憶體日誌
+    "log.encoder.memory_usage": "🧠 峰值記憶體: {peak} (預估 {estimate})", # 峰值記憶體日誌
+    "log.encoder.finalize_kept": "💾 編碼輸出已保留: {path}，可手動移動到目標位置", # 收尾失敗保留輸出日誌
+    "log.encoder.slot_exception": "處理 {filename} 時發生意外錯誤，已略過該檔案：{error}", # 槽位處理檔案時的意外例外
+    "log.encoder.disk_space_forced": "⚠️ 磁碟空間可能不足 ({dir} 預計需要 {need}，剩餘 {free})，但沒有其他檔案佔用空間，仍然開始處理", # 無其他佔用時空間不足仍放行
 }
\ No newline at end of file
@@ -0,0 +1,65 @@
+import os
+import sys
+import json
+import shutil
+import tempfile
+import subprocess
+
+# 测试从仓库根目录导入 workers / config
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+FAKE_SCRIPT = """#!{python}
+import os, sys, json
+with open(os.environ["FAKE_FFMPEG_LOG"], "a", encoding="utf-8") as f:
+    f.write(json.dumps(sys.argv[1:]) + "\\n")
+# 模拟驱动不支持该流：带硬件解码参数时解码失败
+if os.environ.get("FAKE_FFMPEG_FAIL_HWACCEL") and "-hwaccel" in sys.argv:
+    sys.stderr.write("Failed to initialise hardware decoder\\n")
+    sys.exit(1)
+sys.exit(0)
+"""
+
+
+class FakeFFmpeg:
+    """
+    替身 FFmpeg：在临时目录中生成名为 ffmpeg 的脚本并加入 PATH，记录每次调用的参数。
+    fail_hwaccel 为 True 时，带 -hwaccel 的调用以非零返回码退出。
+    """
+    def __init__(self, fail_hwaccel=False):
+        self.fail_hwaccel = fail_hwaccel
+        self.dir = None
+        self.path = None
+        self._env = None
+
+    def __enter__(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "ffmpeg")
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(FAKE_SCRIPT.format(python=sys.executable))
+        os.chmod(self.path, 0o755)
+        self._env = dict(os.environ)
+        os.environ["PATH"] = self.dir + os.pathsep + os.environ.get("PATH", "")
+        os.environ["FAKE_FFMPEG_LOG"] = os.path.join(self.dir, "calls.jsonl")
+        if self.fail_hwaccel:
+            os.environ["FAKE_FFMPEG_FAIL_HWACCEL"] = "1"
+        return self
+
+    def __exit__(self, *exc):
+        os.environ.clear()
+        os.environ.update(self._env)
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def run(self, cmd):
+        """ 以 PATH 中的替身执行命令行 (cmd[0] 为 ffmpeg)，返回 (返回码, 输出行)。 """
+        proc = subprocess.run([shutil.which("ffmpeg")] + cmd[1:], capture_output=True, text=True)
+        return proc.returncode, proc.stderr.splitlines()
+
+    def calls(self):
+        """ 替身收到的每次调用的参数列表。 """
+        log = os.environ["FAKE_FFMPEG_LOG"]
+        if not os.path.exists(log):
+            return []
+        with open(log, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
@@ -0,0 +1,53 @@
+import time
+import unittest
+
+import fakes # noqa: F401 (将仓库根目录加入 sys.path)
+
+try:
+    from workers.commands import preset_for
+    from workers.deadline import DeadlinePlanner
+    from workers.planner import history_key
+    from workers.scheduler import EncodeSlot
+except ImportError: # 缺少 PySide6 等运行依赖
+    DeadlinePlanner = None
+
+
+@unittest.skipIf(DeadlinePlanner is None, "需要 PySide6")
+class DeadlinePlannerTest(unittest.TestCase):
+    """ 按本文件与其余文件的耗时估计逐个文件选择档位。 """
+
+    def setUp(self):
+        # 第 4 档实测 100 fps，其余档位按速度比换算；不计每个文件的固定开销
+        self.slot = EncodeSlot("GPU0", "av1_nvenc", preset_for("av1_nvenc", 4))
+        self.history = {history_key("av1_nvenc", preset_for("av1_nvenc", 4), "1080p", 0): 100.0}
+
+    def choose(self, seconds, work):
+        planner = DeadlinePlanner(time.time() + seconds, self.history, overhead=0)
+        return planner.choose(self.slot, work)
+
+    def test_slack_goes_to_current_file(self):
+        # 统一档位为 4 (110 秒)；短文件用第 3 档 (约 115 秒) 仍能按时完成，第 2 档 (约 122 秒) 不能
+        p_val, _, achievable = self.choose(120, [(1000, "1080p"), (10000, "1080p")])
+        self.assertEqual(p_val, 3)
+        self.assertTrue(achievable)
+
+    def test_tight_deadline_uses_uniform_preset(self):
+        # 长文件在前时余量不足以降一档
+        p_val, _, achievable = self.choose(120, [(10000, "1080p"), (1000, "1080p")])
+        self.assertEqual(p_val, 4)
+        self.assertTrue(achievable)
+
+    def test_ample_time_uses_slowest_preset(self):
+        p_val, _, achievable = self.choose(3600, [(1000, "1080p"), (10000, "1080p")])
+        self.assertEqual(p_val, 1)
+        self.assertTrue(achievable)
+
+    def test_unreachable_deadline_uses_fastest_preset(self):
+        p_val, finish, achievable = self.choose(10, [(1000, "1080p"), (10000, "1080p")])
+        self.assertEqual(p_val, 7)
+        self.assertFalse(achievable)
+        self.assertGreater(finish, time.time() + 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
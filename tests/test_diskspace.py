@@ -0,0 +1,63 @@
+import unittest
+from unittest import mock
+
+import fakes # noqa: F401 (将仓库根目录加入 sys.path)
+
+try:
+    from workers.diskspace import DiskSpaceGuard
+except ImportError: # 缺少 PySide6 等运行依赖
+    DiskSpaceGuard = None
+
+GB = 1024 ** 3
+
+
+class FakePlanner:
+    """ 每个文件在同一卷上需要固定的临时空间与保留空间。 """
+    reserve = 0
+
+    def __init__(self, need):
+        self.need = need
+
+    def file_needs(self, path):
+        return {"vol": ("/cache", self.need, 0)}
+
+
+@unittest.skipIf(DiskSpaceGuard is None, "需要 PySide6")
+class DiskSpaceGuardTest(unittest.TestCase):
+
+    def acquire(self, guard, free):
+        with mock.patch("workers.diskspace.free_space", return_value=free):
+            return guard.acquire("a.mkv")
+
+    def test_admits_when_space_is_enough(self):
+        guard = DiskSpaceGuard(FakePlanner(5 * GB))
+        needs, shortage, admitted = self.acquire(guard, 10 * GB)
+        self.assertTrue(admitted)
+        self.assertIsNone(shortage)
+
+    def test_waits_while_other_files_hold_space(self):
+        guard = DiskSpaceGuard(FakePlanner(6 * GB))
+        first, _, _ = self.acquire(guard, 10 * GB)
+        _, shortage, admitted = self.acquire(guard, 10 * GB)
+        self.assertFalse(admitted)
+        self.assertEqual(shortage[1], 12 * GB)
+        # 前一个文件释放后，仅剩本文件的需求即可放行
+        guard.release(first)
+        _, shortage, admitted = self.acquire(guard, 10 * GB)
+        self.assertTrue(admitted)
+        self.assertIsNone(shortage)
+
+    def test_oversized_file_is_admitted_when_nothing_else_runs(self):
+        guard = DiskSpaceGuard(FakePlanner(20 * GB))
+        needs, shortage, admitted = self.acquire(guard, 10 * GB)
+        self.assertTrue(admitted)
+        self.assertEqual(shortage, ("/cache", 20 * GB, 10 * GB))
+        # 放行后登记需求，之后的文件仍需等待
+        _, _, admitted = self.acquire(guard, 10 * GB)
+        self.assertFalse(admitted)
+        guard.release(needs)
+        self.assertFalse(any(guard._inflight.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
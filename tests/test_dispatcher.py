@@ -0,0 +1,45 @@
+import unittest
+
+import fakes # noqa: F401 (将仓库根目录加入 sys.path)
+
+try:
+    from config import GPU_ASSIGN_ROUND_ROBIN
+    from workers.scheduler import EncodeSlot, SlotDispatcher
+except ImportError: # 缺少 PySide6 等运行依赖
+    SlotDispatcher = None
+
+
+@unittest.skipIf(SlotDispatcher is None, "需要 PySide6")
+class SlotDispatcherTest(unittest.TestCase):
+    """ 槽位处理文件时抛出异常：报告该文件后继续处理该槽位的其余文件。 """
+
+    def run_dispatcher(self, slot_count, assignment=None):
+        slots = [EncodeSlot(f"S{n}", "libsvtav1", "4") for n in range(slot_count)]
+        dispatcher = SlotDispatcher(slots, [f"{n}.mkv" for n in range(6)], assignment)
+        handled, errors = [], []
+
+        def handler(slot, index, filepath):
+            if filepath == "0.mkv":
+                raise OSError("boom")
+            handled.append(filepath)
+            return True
+
+        dispatcher.run(handler, lambda slot, index, filepath, e: errors.append((filepath, str(e))))
+        return dispatcher, sorted(handled), errors
+
+    def test_single_slot_continues_after_exception(self):
+        dispatcher, handled, errors = self.run_dispatcher(1)
+        self.assertEqual(errors, [("0.mkv", "boom")])
+        self.assertEqual(handled, ["1.mkv", "2.mkv", "3.mkv", "4.mkv", "5.mkv"])
+        self.assertEqual(dispatcher.done, 6)
+
+    def test_round_robin_slot_keeps_its_files(self):
+        dispatcher, handled, errors = self.run_dispatcher(2, GPU_ASSIGN_ROUND_ROBIN)
+        self.assertEqual(errors, [("0.mkv", "boom")])
+        # 0 号槽位的其余文件 (2、4) 不被丢弃
+        self.assertEqual(handled, ["1.mkv", "2.mkv", "3.mkv", "4.mkv", "5.mkv"])
+        self.assertEqual(dispatcher.done, 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
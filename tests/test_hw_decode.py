@@ -0,0 +1,125 @@
+import os
+import unittest
+
+from fakes import FakeFFmpeg
+
+try:
+    from workers.commands import build_encode_cmd, build_hw_decode_args, encode_with_fallback
+except ImportError: # 缺少 PySide6 等运行依赖
+    build_encode_cmd = None
+
+AUDIO_ARGS = ["-c:a", "libopus", "-b:a", "96k"]
+
+
+def encode_cmd(enc_name, hw_decode=None, device=None):
+    return build_encode_cmd("ffmpeg", "in.mkv", "out.mkv", enc_name, "4", 30, AUDIO_ARGS, "copy",
+                            device=device, hw_decode=hw_decode)
+
+
+def index_of(args, *items):
+    """ 连续参数 items 在命令行中的位置。 """
+    for i in range(len(args) - len(items) + 1):
+        if args[i:i + len(items)] == list(items):
+            return i
+    raise AssertionError(f"{items} not in {args}")
+
+
+@unittest.skipIf(build_encode_cmd is None, "需要 PySide6")
+@unittest.skipIf(os.name == 'nt', "替身 FFmpeg 为 POSIX 脚本")
+class HwDecodeArgsTest(unittest.TestCase):
+    """ 硬件解码与编码设备参数的顺序：设备初始化 → 硬件解码 → 输入 → 编码参数。 """
+
+    def run_fake(self, cmd):
+        with FakeFFmpeg() as ffmpeg:
+            code, _ = ffmpeg.run(cmd)
+            self.assertEqual(code, 0)
+            return ffmpeg.calls()[0]
+
+    def test_qsv_reuses_init_device(self):
+        hw = build_hw_decode_args("av1_qsv", "hevc", "Main 10", "yuv420p10le")
+        args = self.run_fake(encode_cmd("av1_qsv", hw))
+        init = index_of(args, "-init_hw_device", "qsv=hw")
+        filter_dev = index_of(args, "-filter_hw_device", "hw")
+        hwaccel = index_of(args, "-hwaccel", "qsv", "-hwaccel_output_format", "qsv", "-hwaccel_device", "hw")
+        src = index_of(args, "-i", "in.mkv")
+        self.assertLess(init, filter_dev)
+        self.assertLess(filter_dev, hwaccel)
+        self.assertLess(hwaccel, src)
+        self.assertLess(src, index_of(args, "-c:v", "av1_qsv"))
+        # 显存中的帧由 GPU 滤镜转为 10bit，不再指定 -pix_fmt
+        self.assertEqual(args[index_of(args, "-vf") + 1], "vpp_qsv=format=p010")
+        self.assertNotIn("-pix_fmt", args[:index_of(args, "out.mkv")])
+
+    def test_qsv_parent_device_before_child(self):
+        hw = build_hw_decode_args("av1_qsv", "h264", "High", "yuv420p", device=1)
+        args = self.run_fake(encode_cmd("av1_qsv", hw, device=1))
+        parent = index_of(args, "-init_hw_device", "vaapi=va1:/dev/dri/renderD129")
+        child = index_of(args, "-init_hw_device", "qsv=hw@va1")
+        self.assertLess(parent, child)
+        self.assertLess(child, index_of(args, "-hwaccel", "qsv"))
+
+    def test_nvenc_decode_and_encode_on_same_gpu(self):
+        hw = build_hw_decode_args("av1_nvenc", "h264", "High", "yuv420p", device=1)
+        args = self.run_fake(encode_cmd("av1_nvenc", hw, device=1))
+        hwaccel = index_of(args, "-hwaccel", "cuda", "-hwaccel_output_format", "cuda", "-hwaccel_device", "1")
+        self.assertLess(hwaccel, index_of(args, "-i", "in.mkv"))
+        self.assertLess(index_of(args, "-i", "in.mkv"), index_of(args, "-gpu", "1"))
+        self.assertNotIn("-init_hw_device", args)
+        self.assertEqual(args[index_of(args, "-vf") + 1], "scale_cuda=format=p010le")
+
+    def test_amf_only_for_10bit_sources(self):
+        self.assertIsNone(build_hw_decode_args("av1_amf", "hevc", "Main 10", "yuv420p"))
+        hw = build_hw_decode_args("av1_amf", "hevc", "Main 10", "yuv420p10le")
+        args = self.run_fake(encode_cmd("av1_amf", hw))
+        self.assertLess(index_of(args, "-hwaccel", "d3d11va", "-hwaccel_output_format", "d3d11"), index_of(args, "-i", "in.mkv"))
+        self.assertNotIn("-vf", args)
+
+    def test_unsupported_sources_use_software_decode(self):
+        self.assertIsNone(build_hw_decode_args("av1_qsv", "hevc", "Main 4:2:2 10", "yuv422p10le"))
+        self.assertIsNone(build_hw_decode_args("av1_nvenc", "prores", "", "yuv420p"))
+        self.assertIsNone(build_hw_decode_args("libsvtav1", "h264", "High", "yuv420p"))
+
+
+@unittest.skipIf(build_encode_cmd is None, "需要 PySide6")
+@unittest.skipIf(os.name == 'nt', "替身 FFmpeg 为 POSIX 脚本")
+class DecodeFallbackTest(unittest.TestCase):
+    """ 硬件解码失败后去掉 -hwaccel 以软件解码重试。 """
+
+    def test_retry_without_hwaccel(self):
+        hw = build_hw_decode_args("av1_nvenc", "h264", "High", "yuv420p", device=0)
+        fallbacks = []
+        with FakeFFmpeg(fail_hwaccel=True) as ffmpeg:
+            result, used = encode_with_fallback(lambda h: encode_cmd("av1_nvenc", h, device=0), ffmpeg.run, hw,
+                                                lambda: fallbacks.append(True))
+            calls = ffmpeg.calls()
+        self.assertEqual(result[0], 0)
+        self.assertIsNone(used)
+        self.assertEqual(fallbacks, [True])
+        self.assertEqual(len(calls), 2)
+        self.assertIn("-hwaccel", calls[0])
+        self.assertNotIn("-hwaccel", calls[1])
+        # 软件解码时恢复 -pix_fmt，编码设备不变
+        self.assertIn("-pix_fmt", calls[1])
+        self.assertEqual(calls[1][index_of(calls[1], "-gpu") + 1], "0")
+
+    def test_no_retry_when_stopped(self):
+        hw = build_hw_decode_args("av1_qsv", "h264", "High", "yuv420p")
+        with FakeFFmpeg(fail_hwaccel=True) as ffmpeg:
+            result, used = encode_with_fallback(lambda h: encode_cmd("av1_qsv", h), ffmpeg.run, hw, lambda: False)
+            calls = ffmpeg.calls()
+        self.assertNotEqual(result[0], 0)
+        self.assertIs(used, hw)
+        self.assertEqual(len(calls), 1)
+
+    def test_software_failure_is_not_retried(self):
+        with FakeFFmpeg() as ffmpeg:
+            result, used = encode_with_fallback(lambda h: encode_cmd("av1_qsv", h), lambda cmd: (1,) + ffmpeg.run(cmd)[1:], None,
+                                                lambda: self.fail("软件解码失败不应重试"))
+            calls = ffmpeg.calls()
+        self.assertEqual(result[0], 1)
+        self.assertIsNone(used)
+        self.assertEqual(len(calls), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+
+import fakes # noqa: F401 (将仓库根目录加入 sys.path)
+
+try:
+    from workers.loudnorm import measurement_key
+except ImportError: # 缺少 PySide6 等运行依赖
+    measurement_key = None
+
+MEASURED = {"input_i": "-20.1", "input_tp": "-1.2", "input_lra": "6.0", "input_thresh": "-30.4", "target_offset": "0.3"}
+
+
+@unittest.skipIf(measurement_key is None, "需要 PySide6")
+class MeasurementKeyTest(unittest.TestCase):
+    """ 响度测量缓存键：前置滤镜或目标参数改变时不得复用旧的测量值。 """
+
+    def test_changed_pre_filters_miss_cache(self):
+        cache = {measurement_key("fp", "loudnorm=I=-16:TP=-1.5"): MEASURED}
+        for chain in ("volume=2.0,loudnorm=I=-16:TP=-1.5", "pan=stereo|c0=c0|c1=c1,loudnorm=I=-16:TP=-1.5"):
+            self.assertIsNone(cache.get(measurement_key("fp", chain)), chain)
+
+    def test_changed_target_misses_cache(self):
+        self.assertNotEqual(measurement_key("fp", "volume=2.0,loudnorm=I=-16"), measurement_key("fp", "volume=2.0,loudnorm=I=-23"))
+
+    def test_same_chain_hits_cache(self):
+        cache = {measurement_key("fp", "volume=2.0,loudnorm=I=-16"): MEASURED}
+        # 第二遍写入的 measured_* 参数与后置滤镜不影响测量值
+        self.assertIs(cache.get(measurement_key("fp", "volume=2.0,loudnorm=I=-16:measured_I=-20:linear=true,aresample=48000")), MEASURED)
+
+    def test_no_key_without_fingerprint_or_loudnorm(self):
+        self.assertIsNone(measurement_key("", "loudnorm=I=-16"))
+        self.assertIsNone(measurement_key("fp", "volume=2.0"))
+
+
+if __name__ == "__main__":
+    unittest.main()
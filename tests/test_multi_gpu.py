@@ -0,0 +1,57 @@
+import os
+import unittest
+
+from fakes import FakeFFmpeg
+from test_hw_decode import encode_cmd, index_of
+
+try:
+    from workers.commands import build_hw_init_args
+except ImportError: # 缺少 PySide6 等运行依赖
+    build_hw_init_args = None
+
+
+@unittest.skipIf(build_hw_init_args is None, "需要 PySide6")
+@unittest.skipIf(os.name == 'nt', "替身 FFmpeg 为 POSIX 脚本")
+class DeviceArgsTest(unittest.TestCase):
+    """ 多显卡时各槽位的设备参数：QSV 由 -init_hw_device 选择适配器，NVENC 由 -gpu 选择。 """
+
+    def run_fake(self, cmd):
+        with FakeFFmpeg() as ffmpeg:
+            code, _ = ffmpeg.run(cmd)
+            self.assertEqual(code, 0)
+            return ffmpeg.calls()[0]
+
+    def test_qsv_render_node_per_device(self):
+        for device in (0, 1):
+            args = self.run_fake(encode_cmd("av1_qsv", device=device))
+            parent = index_of(args, "-init_hw_device", f"vaapi=va{device}:/dev/dri/renderD{128 + device}")
+            child = index_of(args, "-init_hw_device", f"qsv=hw@va{device}")
+            self.assertLess(parent, child)
+            self.assertLess(child, index_of(args, "-filter_hw_device", "hw"))
+            self.assertLess(index_of(args, "-filter_hw_device", "hw"), index_of(args, "-i", "in.mkv"))
+            self.assertNotIn("-gpu", args)
+
+    def test_qsv_d3d11_adapter_per_device_on_windows(self):
+        for device in (0, 1):
+            args = build_hw_init_args("av1_qsv", device, os_name='nt')
+            self.assertEqual(args, ["-init_hw_device", f"d3d11va=dx{device}:{device}",
+                                    "-init_hw_device", f"qsv=hw@dx{device}", "-filter_hw_device", "hw"])
+
+    def test_qsv_without_device_uses_default_adapter(self):
+        args = self.run_fake(encode_cmd("av1_qsv"))
+        self.assertEqual(args[index_of(args, "-init_hw_device") + 1], "qsv=hw")
+        self.assertEqual(args.count("-init_hw_device"), 1)
+
+    def test_nvenc_gpu_per_device(self):
+        for device in (0, 1):
+            args = self.run_fake(encode_cmd("av1_nvenc", device=device))
+            self.assertLess(index_of(args, "-i", "in.mkv"), index_of(args, "-gpu", str(device)))
+            self.assertEqual(args.count("-gpu"), 1)
+            self.assertNotIn("-init_hw_device", args)
+
+    def test_nvenc_without_device_omits_gpu(self):
+        self.assertNotIn("-gpu", self.run_fake(encode_cmd("av1_nvenc")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -20,18 +20,22 @@ from qfluentwidgets import (FluentWindow, SubtitleLabel, StrongBodyLabel, BodyLa
                             IconWidget, MessageBoxBase)
 
 from config import (
-    APP_TITLE, ENC_QSV, ENC_NVENC, ENC_AMF,
+    APP_TITLE, ENC_QSV, ENC_NVENC, ENC_AMF, ENC_SVT, ENC_AOM, ALL_ENCODERS, CPU_ENCODERS,
     MAX_DURATION_WORKERS, MAX_THUMBNAIL_WORKERS, MAX_THUMBNAIL_CACHE_SIZE,
-    LOG_UPDATE_INTERVAL, LOG_MAX_BLOCKS, DEPENDENCY_CHECK_DELAY,
+    LOG_UPDATE_INTERVAL, LOG_MAX_BLOCKS, DEPENDENCY_CHECK_DELAY, CACHE_SWEEP_DELAY, CACHE_SWEEP_INTERVAL,
     MIN_WINDOW_SIZE, NAV_EXPAND_WIDTH, THEMES,
     VIDEO_EXTS, SAVE_MODE_SAVE_AS, SAVE_MODE_OVERWRITE, SAVE_MODE_REMAIN,
     LOUDNORM_MODE_ALWAYS, LOUDNORM_MODE_DISABLE, LOUDNORM_MODE_AUTO,
-    DEFAULT_SETTINGS, ENCODER_CONFIGS
+    DEFAULT_SETTINGS, ENCODER_CONFIGS, ADVANCED_SETTINGS,
+    QUEUE_ORDER_ADDED, QUEUE_ORDER_SHORTEST, QUEUE_ORDER_SAVINGS, QUEUE_ORDER_FOLDER, QUEUE_ORDER_DISK, QUEUE_ORDERS,
+    GOVERNOR_OFF, GOVERNOR_AUTO, GOVERNOR_INTERACTIVE, GOVERNOR_OFFHOURS, GOVERNOR_MODES
 )
 from utils import (
-    resource_path, get_default_cache_dir, get_config_path
+    resource_path, get_default_cache_dir, get_config_path, parse_setting
 )
-from workers import DurationWorker, ThumbnailWorker, DependencyWorker, EncoderWorker
+from workers import DurationWorker, ThumbnailWorker, DependencyWorker, EncoderWorker, CacheWorker
+from workers.cache import CacheManager
+from workers.scratch import default_ram_dir
 from ui.interfaces import MediaInfoInterface, ProfileInterface, CreditsInterface
 from i18n.translator import tr, translator
 from ui.common import ClickableBodyLabel, DroppableBodyLabel, DroppableListWidget
@@ -165,6 +169,8 @@ class MainWindow(FluentWindow):
         
         self.save_modes = [SAVE_MODE_SAVE_AS, SAVE_MODE_OVERWRITE, SAVE_MODE_REMAIN]
         self.loudnorm_modes = [LOUDNORM_MODE_AUTO, LOUDNORM_MODE_ALWAYS, LOUDNORM_MODE_DISABLE]
+        self.queue_orders = list(QUEUE_ORDERS)
+        self.governor_modes = list(GOVERNOR_MODES)
 
         # [Fix] 缩减侧边栏展开宽度，避免留白过多，视觉更紧凑
         self.navigationInterface.setExpandWidth(NAV_EXPAND_WIDTH)
@@ -187,6 +193,8 @@ class MainWindow(FluentWindow):
         self._drag_over_source_zone = False # 拖拽状态标志
         self._auto_save_blocked = False # 自动保存状态标志
         self.dep_worker = None # 依赖检查工作线程
+        self.cache_worker = None # 缓存维护工作线程
+        self.task_start_time = None # 当前编码任务的开始时间 (缓存维护不清理此后使用过的文件)
         self.active_dur_workers = {}   # 正在运行的时长线程
         self.pending_dur_tasks = []    # 等待中的时长任务
         self.active_thumb_workers = {} # 正在运行的缩略图线程
@@ -203,10 +211,19 @@ class MainWindow(FluentWindow):
         self.log_timer = QTimer(self)
         self.log_timer.timeout.connect(self.process_log_queue)
         self.log_timer.start(LOG_UPDATE_INTERVAL)
+
+        # 定期按大小上限淘汰缓存
+        self.cache_timer = QTimer(self)
+        self.cache_timer.timeout.connect(self.run_cache_maintenance)
+        self.cache_timer.start(CACHE_SWEEP_INTERVAL)
         
         # 编码器配置管理
         self.last_encoder_name = "Intel QSV"
         self.encoder_settings = copy.deepcopy(ENCODER_CONFIGS)
+        self.advanced_settings = dict(ADVANCED_SETTINGS) # 高级设置 (仅 config.ini)
+        self.encoder_devices = {} # 编码器名称 -> 可用设备序号列表
+        self.rendition_progress = {} # 文件路径 -> {规格: 进度}
+        self.available_encoders = [] # 依赖检查确认可用的编码器 (混合池需要 SVT-AV1)
         
         # 初始化 UI
         self.init_ui()
@@ -233,6 +250,8 @@ class MainWindow(FluentWindow):
         
         # 启动后延迟检查依赖
         QTimer.singleShot(DEPENDENCY_CHECK_DELAY, self.check_dependencies)
+        # 启动后清理上次运行遗留的临时文件
+        QTimer.singleShot(CACHE_SWEEP_DELAY, lambda: self.run_cache_maintenance(sweep=True))
 
     def _populate_combo(self, combo: ComboBox, items: list):
         """ 使用可翻译的文本填充组合框，并将原始键存储在userData中。 """
@@ -248,6 +267,15 @@ class MainWindow(FluentWindow):
             LOUDNORM_MODE_AUTO: "home.settings_card.loudnorm_mode.auto",
             LOUDNORM_MODE_ALWAYS: "home.settings_card.loudnorm_mode.always",
             LOUDNORM_MODE_DISABLE: "home.settings_card.loudnorm_mode.disable",
+            QUEUE_ORDER_ADDED: "home.action_card.queue_order.added",
+            QUEUE_ORDER_SHORTEST: "home.action_card.queue_order.shortest",
+            QUEUE_ORDER_SAVINGS: "home.action_card.queue_order.savings",
+            QUEUE_ORDER_FOLDER: "home.action_card.queue_order.folder",
+            QUEUE_ORDER_DISK: "home.action_card.queue_order.disk",
+            GOVERNOR_OFF: "home.action_card.governor.off",
+            GOVERNOR_AUTO: "home.action_card.governor.auto",
+            GOVERNOR_INTERACTIVE: "home.action_card.governor.interactive",
+            GOVERNOR_OFFHOURS: "home.action_card.governor.offhours",
         }
 
         for key in items:
@@ -292,6 +320,8 @@ class MainWindow(FluentWindow):
             self.lbl_aq.setText(tr("home.settings_card.nv_aq.label.nvidia"))
         elif ENC_AMF in current_enc:
             self.lbl_aq.setText(tr("home.settings_card.nv_aq.label.amd"))
+        elif current_enc in CPU_ENCODERS:
+            self.lbl_aq.setText(tr("home.settings_card.nv_aq.label.cpu"))
         else:
             self.lbl_aq.setText(tr("home.settings_card.nv_aq.label.intel"))
 
@@ -301,6 +331,10 @@ class MainWindow(FluentWindow):
 
         # 操作卡片
         self._populate_combo(self.combo_save_mode, self.save_modes)
+        self._populate_combo(self.combo_queue_order, self.queue_orders)
+        self.combo_queue_order.setToolTip(tr("home.action_card.queue_order.tooltip"))
+        self._populate_combo(self.combo_governor, self.governor_modes)
+        self.combo_governor.setToolTip(tr("home.action_card.governor.tooltip"))
         self.line_export.setPlaceholderText(tr("home.action_card.export_path_placeholder"))
         self.btn_export.setText(tr("home.action_card.choose_button"))
         self.btn_start.setText(tr("home.action_card.start_button"))
@@ -504,7 +538,7 @@ class MainWindow(FluentWindow):
         self.settings_card_encoder_label = StrongBodyLabel("魔力核心 (Encoder)", self.card_settings)
         v1.addWidget(self.settings_card_encoder_label)
         self.combo_encoder = ComboBox(self.card_settings)
-        self.combo_encoder.addItems(["Intel QSV", "NVIDIA NVENC", "AMD AMF"])
+        self.combo_encoder.addItems(list(ALL_ENCODERS))
         self.combo_encoder.setMinimumWidth(140)
         self.combo_encoder.setMinimumHeight(36)
         v1.addWidget(self.combo_encoder)
@@ -621,6 +655,16 @@ class MainWindow(FluentWindow):
         self.combo_save_mode.setMinimumHeight(36)
         self.combo_save_mode.currentIndexChanged.connect(self.toggle_export_ui)
         h_mode_combo.addWidget(self.combo_save_mode)
+        self.combo_queue_order = ComboBox(self.card_action)
+        self._populate_combo(self.combo_queue_order, self.queue_orders)
+        self.combo_queue_order.setMinimumHeight(36)
+        h_mode_combo.addWidget(self.combo_queue_order)
+        # 资源调控模式在编码期间也可切换，立即作用于正在运行的子进程
+        self.combo_governor = ComboBox(self.card_action)
+        self._populate_combo(self.combo_governor, self.governor_modes)
+        self.combo_governor.setMinimumHeight(36)
+        self.combo_governor.currentIndexChanged.connect(self.on_governor_changed)
+        h_mode_combo.addWidget(self.combo_governor)
         
         mode_layout.addLayout(h_mode_combo)
 
@@ -931,6 +975,8 @@ class MainWindow(FluentWindow):
                     raw_save_mode = sect.get("save_mode", DEFAULT_SETTINGS["save_mode"])
                     data["save_mode"] = self.OLD_VALUE_MAP.get(raw_save_mode, raw_save_mode)
                     data["export_dir"] = sect.get("export_dir", DEFAULT_SETTINGS["export_dir"])
+                    data["queue_order"] = sect.get("queue_order", DEFAULT_SETTINGS["queue_order"])
+                    data["governor_mode"] = sect.get("governor_mode", DEFAULT_SETTINGS["governor_mode"])
                 
                 for enc_name in self.encoder_settings:
                     if enc_name in config:
@@ -946,17 +992,22 @@ class MainWindow(FluentWindow):
                             "nv_aq": sect.get("nv_aq", defaults["nv_aq"]),
                             "amf_offset": sect.get("amf_offset", defaults.get("amf_offset", "0"))
                         }
+
+                advanced_sect = config["Advanced"] if "Advanced" in config else {}
+                for key, default in ADVANCED_SETTINGS.items():
+                    self.advanced_settings[key] = parse_setting(advanced_sect.get(key), default)
+                # 补写缺失的高级设置项，方便用户在 config.ini 中查找和修改
+                if any(key not in advanced_sect for key in ADVANCED_SETTINGS):
+                    self.save_settings_file({}, advanced_settings=self.advanced_settings)
             except Exception:
                 pass
         else:
             self.is_first_run = True
-            self.save_settings_file(DEFAULT_SETTINGS, self.encoder_settings)
+            self.save_settings_file(DEFAULT_SETTINGS, self.encoder_settings, self.advanced_settings)
         
-        enc_idx = 0
-        if ENC_NVENC in data["encoder"]:
-            enc_idx = 1
-        elif ENC_AMF in data["encoder"]:
-            enc_idx = 2
+        enc_idx = self.combo_encoder.findText(data["encoder"])
+        if enc_idx < 0:
+            enc_idx = 0
         
         self.last_encoder_name = self.combo_encoder.itemText(enc_idx)
         self.combo_encoder.setCurrentIndex(enc_idx)
@@ -971,6 +1022,12 @@ class MainWindow(FluentWindow):
         save_mode_index = self.combo_save_mode.findData(data["save_mode"])
         if save_mode_index > -1:
             self.combo_save_mode.setCurrentIndex(save_mode_index)
+        queue_order_index = self.combo_queue_order.findData(data.get("queue_order", QUEUE_ORDER_ADDED))
+        if queue_order_index > -1:
+            self.combo_queue_order.setCurrentIndex(queue_order_index)
+        governor_index = self.combo_governor.findData(data.get("governor_mode", GOVERNOR_OFF))
+        if governor_index > -1:
+            self.combo_governor.setCurrentIndex(governor_index)
         self.line_export.setText(data.get("export_dir", ""))
         self.toggle_export_ui()
 
@@ -998,13 +1055,17 @@ class MainWindow(FluentWindow):
         
         self.block_signals_for_settings(False)
         
+        is_cpu = enc_name in CPU_ENCODERS
         if ENC_NVENC in enc_name:
             self.lbl_aq.setText(tr("home.settings_card.nv_aq.label.nvidia"))
         elif ENC_AMF in enc_name:
             self.lbl_aq.setText(tr("home.settings_card.nv_aq.label.amd"))
+        elif is_cpu:
+            self.lbl_aq.setText(tr("home.settings_card.nv_aq.label.cpu"))
         else:
             self.lbl_aq.setText(tr("home.settings_card.nv_aq.label.intel"))
-        self.sw_nv_aq.setEnabled(True)
+        # CPU 编码器自带心理视觉优化，没有对应的 AQ 开关
+        self.sw_nv_aq.setEnabled(not is_cpu)
 
         is_hw = (ENC_AMF in enc_name) or (ENC_NVENC in enc_name) or (ENC_QSV in enc_name)
         self.lbl_offset.setEnabled(is_hw)
@@ -1044,6 +1105,8 @@ class MainWindow(FluentWindow):
         self.combo_preset.currentIndexChanged.connect(lambda _: self.auto_save_settings())
         self.combo_theme.currentIndexChanged.connect(lambda _: self.auto_save_settings())
         self.combo_save_mode.currentIndexChanged.connect(lambda _: self.auto_save_settings())
+        self.combo_queue_order.currentIndexChanged.connect(lambda _: self.auto_save_settings())
+        self.combo_governor.currentIndexChanged.connect(lambda _: self.auto_save_settings())
         self.sw_nv_aq.checkedChanged.connect(lambda _: self.auto_save_settings())
         self.combo_loudnorm.currentIndexChanged.connect(lambda _: self.auto_save_settings())
         self.line_vmaf.textChanged.connect(lambda _: self.auto_save_settings())
@@ -1059,7 +1122,7 @@ class MainWindow(FluentWindow):
             return
         self.save_current_settings(show_tip=False)
 
-    def save_settings_file(self, settings_dict, encoder_settings=None):
+    def save_settings_file(self, settings_dict, encoder_settings=None, advanced_settings=None):
         """ 将设置字典写入配置文件。 """
         config = configparser.ConfigParser()
         
@@ -1078,6 +1141,12 @@ class MainWindow(FluentWindow):
                     config[enc_name] = {}
                 for key, value in enc_conf.items():
                     config[enc_name][key] = str(value)
+
+        if advanced_settings:
+            if "Advanced" not in config:
+                config["Advanced"] = {}
+            for key, value in advanced_settings.items():
+                config["Advanced"][key] = str(value)
                 
         with open(get_config_path(), 'w', encoding='utf-8') as f:
             config.write(f)
@@ -1100,10 +1169,12 @@ class MainWindow(FluentWindow):
             "encoder": curr_enc,
             "theme": THEMES[self.combo_theme.currentIndex()],
             "save_mode": self.combo_save_mode.currentData(),
+            "queue_order": self.combo_queue_order.currentData(),
+            "governor_mode": self.combo_governor.currentData(),
             "export_dir": self.line_export.text().strip(),
             "language": translator.current_lang
         }
-        self.save_settings_file(settings, self.encoder_settings)
+        self.save_settings_file(settings, self.encoder_settings, self.advanced_settings)
         if show_tip:
             orig_text = self.btn_save_conf.text()
             self.btn_save_conf.setText(tr("button.save.saved"))
@@ -1120,13 +1191,14 @@ class MainWindow(FluentWindow):
         
         widgets_to_block = [
             self.combo_encoder, self.combo_preset, self.combo_theme,
-            self.combo_save_mode, self.combo_loudnorm, self.sw_nv_aq,
+            self.combo_save_mode, self.combo_queue_order, self.combo_governor, self.combo_loudnorm, self.sw_nv_aq,
             self.line_vmaf, self.line_audio, self.line_loudnorm, self.line_export, self.spin_offset
         ]
         for w in widgets_to_block:
             w.blockSignals(True)
         
         self.encoder_settings = copy.deepcopy(ENCODER_CONFIGS)
+        self.advanced_settings = dict(ADVANCED_SETTINGS)
         
         current_enc = self.combo_encoder.currentText()
         self.load_encoder_settings_to_ui(current_enc)
@@ -1135,6 +1207,8 @@ class MainWindow(FluentWindow):
         self.on_theme_changed(0)
         
         self.combo_save_mode.setCurrentIndex(self.combo_save_mode.findData(SAVE_MODE_OVERWRITE))
+        self.combo_queue_order.setCurrentIndex(self.combo_queue_order.findData(QUEUE_ORDER_ADDED))
+        self.combo_governor.setCurrentIndex(self.combo_governor.findData(GOVERNOR_OFF))
         self.line_export.clear()
         
         for w in widgets_to_block:
@@ -1702,6 +1776,18 @@ class MainWindow(FluentWindow):
                 lbl.setText(f"{speed} | {eta}")
             if pbar and pbar.isHidden(): pbar.show()
 
+    def update_rendition_progress(self, filepath, label, percent):
+        """ 在进度条提示中显示各规格输出的独立进度。 """
+        progress = self.rendition_progress.setdefault(filepath, {})
+        progress[label] = percent
+        item = self.path_to_item.get(filepath)
+        if not item: return
+        widget = self.list_selected_files.itemWidget(item)
+        if widget:
+            pbar = widget.findChild(ProgressBar, "pbar")
+            if pbar:
+                pbar.setToolTip("\n".join(f"{name}: {value}%" for name, value in progress.items()))
+
     def update_file_status(self, filepath, status):
         """ 更新指定文件的状态图标。 """
         item = self.path_to_item.get(filepath)
@@ -1721,6 +1807,12 @@ class MainWindow(FluentWindow):
                     if lbl_stats: 
                         lbl_stats.setStyleSheet("font-size: 11px; font-weight: bold; color: #55E555;")
                         lbl_stats.show()
+                elif status == "warning":
+                    icon_w.setIcon(FluentIcon.INFO)
+                    if pbar: pbar.hide()
+                    if lbl_stats:
+                        lbl_stats.setStyleSheet("font-size: 11px; font-weight: bold; color: #F39C12;")
+                        lbl_stats.show()
                 elif status == "error":
                     icon_w.setIcon(FluentIcon.CANCEL)
                     if pbar: pbar.hide()
@@ -1814,6 +1906,35 @@ class MainWindow(FluentWindow):
         except Exception as e:
             print(f"Log UI update error: {e}")
 
+    def _ram_scratch_dir(self):
+        return self.advanced_settings.get('ram_scratch_dir', '') or default_ram_dir()
+
+    def run_cache_maintenance(self, sweep=False):
+        """ 在后台维护缓存目录：启动时清理遗留的临时文件，之后定期按大小上限淘汰最久未使用的文件。 """
+        if self.cache_worker:
+            try:
+                if self.cache_worker.isRunning():
+                    return
+            except RuntimeError:
+                self.cache_worker = None
+
+        cache_path = self.line_cache.text().strip() or get_default_cache_dir()
+        max_bytes = float(self.advanced_settings.get('cache_max_gb', 0)) * 1024 ** 3
+        self.cache_worker = CacheWorker(cache_path, max_bytes, self._ram_scratch_dir(), sweep, self.task_start_time)
+        self.cache_worker.result_signal.connect(self.on_cache_maintained)
+        self.cache_worker.finished.connect(self.cache_worker.deleteLater)
+        self.cache_worker.finished.connect(self.on_cache_worker_finished)
+        self.cache_worker.start()
+
+    def on_cache_worker_finished(self):
+        self.cache_worker = None
+
+    def on_cache_maintained(self, swept, freed, evicted, evicted_bytes):
+        if swept:
+            self.log(tr("log.cache.orphans_swept", count=swept, size=f"{freed / 1024 ** 2:.1f} MB"), "info")
+        if evicted:
+            self.log(tr("log.cache.evicted", count=evicted, size=f"{evicted_bytes / 1024 ** 2:.1f} MB"), "info")
+
     def clear_cache_files(self):
         """ 清除ab-av1生成的临时缓存文件。 """
         cache_path = self.line_cache.text().strip() or get_default_cache_dir()
@@ -1831,11 +1952,8 @@ class MainWindow(FluentWindow):
             return
 
         try:
-            count = 0
-            for f in os.listdir(cache_path):
-                if f.endswith(".temp.mkv"):
-                    os.remove(os.path.join(cache_path, f))
-                    count += 1
+            # 编码进行中时不清理当前任务正在使用的文件
+            count, _ = CacheManager(cache_path, 0, self._ram_scratch_dir()).sweep(self.task_start_time)
             InfoBar.success(tr("infobar.success.cache_cleared.title"), tr("infobar.success.cache_cleared.content", count=count), parent=self, position=InfoBarPosition.TOP)
         except Exception as e:
             InfoBar.error(tr("infobar.error.cache_clear_failed.title"), str(e), parent=self, position=InfoBarPosition.TOP)
@@ -1863,6 +1981,8 @@ class MainWindow(FluentWindow):
             'encoder': self.combo_encoder.currentText(),
             'export_dir': export_dir,
             'save_mode': self.combo_save_mode.currentData(),
+            'queue_order': self.combo_queue_order.currentData(),
+            'governor_mode': self.combo_governor.currentData(),
             'cache_dir': self.line_cache.text().strip() or get_default_cache_dir(),
             'preset': self.combo_preset.text(),
             'vmaf': vmaf_val,
@@ -1871,16 +1991,22 @@ class MainWindow(FluentWindow):
             'loudnorm': self.line_loudnorm.text(),
             'nv_aq': self.sw_nv_aq.isChecked(),
             'amf_offset': self.spin_offset.value(),
-            'loudnorm_mode': self.combo_loudnorm.currentData()
+            'loudnorm_mode': self.combo_loudnorm.currentData(),
+            'devices': list(self.encoder_devices.get(self.combo_encoder.currentText(), [])),
+            'available_encoders': self.available_encoders[:]
         }
+        config.update(self.advanced_settings)
         os.makedirs(config['cache_dir'], exist_ok=True)
 
+        self.rendition_progress = {}
+        self.task_start_time = time.time()
         self.worker = EncoderWorker(config)
         self.worker.log_signal.connect(self.log)
         self.worker.progress_total_signal.connect(self.pbar_total.setValue)
         self.worker.progress_current_signal.connect(self.pbar_current.setValue)
         self.worker.file_progress_signal.connect(self.update_file_progress)
         self.worker.file_stats_signal.connect(self.update_file_stats)
+        self.worker.rendition_progress_signal.connect(self.update_rendition_progress)
         self.worker.file_status_signal.connect(self.update_file_status)
         self.worker.finished_signal.connect(self.on_finished)
         self.worker.ask_error_decision.connect(self.on_worker_error)
@@ -1894,6 +2020,7 @@ class MainWindow(FluentWindow):
         self.btn_pause.setEnabled(True)
         self.combo_encoder.setEnabled(False)
         self.combo_save_mode.setEnabled(False)
+        self.combo_queue_order.setEnabled(False)
         self.btn_pause.setText(tr("home.action_card.pause_button"))
         self.btn_stop.setEnabled(True)
         self.pbar_total.setValue(0)
@@ -1946,6 +2073,11 @@ class MainWindow(FluentWindow):
                 self.btn_pause.setText(tr("home.action_card.pause_button"))
                 self.log(tr("log.task_pause"), "info")
 
+    def on_governor_changed(self, _index):
+        """ 编码期间切换资源调控模式时通知工作线程，无需重启批次。 """
+        if self.worker:
+            self.worker.set_governor_mode(self.combo_governor.currentData())
+
     def on_finished(self):
         """ 当编码任务完成时调用，恢复UI状态。 """
         self.btn_start.setEnabled(True)
@@ -1955,11 +2087,15 @@ class MainWindow(FluentWindow):
         self.btn_stop.setEnabled(False)
         self.combo_encoder.setEnabled(True)
         self.combo_save_mode.setEnabled(True)
+        self.combo_queue_order.setEnabled(True)
         self.worker = None
+        self.task_start_time = None
 
-    def apply_encoder_availability(self, has_qsv, has_nvenc, has_amf):
+    def apply_encoder_availability(self, has_qsv, has_nvenc, has_amf, has_svt=False, has_aom=False):
         """ 根据可用的编码器更新编码器选择下拉框。 """
-        mapping = [(ENC_QSV, 0, has_qsv), (ENC_NVENC, 1, has_nvenc), (ENC_AMF, 2, has_amf)]
+        flags = {ENC_QSV: has_qsv, ENC_NVENC: has_nvenc, ENC_AMF: has_amf, ENC_SVT: has_svt, ENC_AOM: has_aom}
+        self.available_encoders = [name for name in ALL_ENCODERS if flags[name]]
+        mapping = [(name, self.combo_encoder.findText(name), flags[name]) for name in ALL_ENCODERS]
 
         for _, idx, enabled in mapping:
             self.combo_encoder.setItemEnabled(idx, enabled)
@@ -1997,6 +2133,7 @@ class MainWindow(FluentWindow):
         self.dep_worker.finished.connect(self.dep_worker.deleteLater)
         self.dep_worker.finished.connect(self.on_dependency_worker_finished)
         self.dep_worker.result_signal.connect(self.on_dependency_check_finished)
+        self.dep_worker.devices_signal.connect(self.on_devices_detected)
         self.dep_worker.start()
 
     def on_dependency_worker_finished(self):
@@ -2022,11 +2159,15 @@ class MainWindow(FluentWindow):
         self.btn_start.setText(tr("button.start.missing_components"))
         self.apply_encoder_availability(False, False, False)
 
-    def on_dependency_check_finished(self, has_qsv, has_nvenc, has_amf):
+    def on_devices_detected(self, devices):
+        """ 记录各硬件编码器可用的设备序号 (多显卡时用于分配任务)。 """
+        self.encoder_devices = devices
+
+    def on_dependency_check_finished(self, has_qsv, has_nvenc, has_amf, has_svt=False, has_aom=False):
         """ 当依赖检查完成时调用，更新编码器可用性并记录日志。 """
-        switched_to = self.apply_encoder_availability(has_qsv, has_nvenc, has_amf)
+        switched_to = self.apply_encoder_availability(has_qsv, has_nvenc, has_amf, has_svt, has_aom)
 
-        if not has_qsv and not has_nvenc and not has_amf:
+        if not any((has_qsv, has_nvenc, has_amf, has_svt, has_aom)):
             self.log(tr("log.dependency_check_finished.fail"), "error")
             InfoBar.warning(tr("infobar.warning.hardware_unsupported.title"), tr("infobar.warning.hardware_unsupported.content"), parent=self, position=InfoBarPosition.TOP)
         else:
@@ -2034,6 +2175,8 @@ class MainWindow(FluentWindow):
             if has_qsv: msg += f" [{ENC_QSV}]"
             if has_nvenc: msg += f" [{ENC_NVENC}]"
             if has_amf: msg += f" [{ENC_AMF}]"
+            if has_svt: msg += f" [{ENC_SVT}]"
+            if has_aom: msg += f" [{ENC_AOM}]"
             self.log(msg + " (Ready)", "success")
             if switched_to:
                 self.log(tr("log.autoselect_encoder", encoder=switched_to), "info")
@@ -2050,7 +2193,11 @@ class MainWindow(FluentWindow):
         if self.worker and self.worker.isRunning():
             self.worker.stop()
             self.worker.wait(500)
-        
+
+        if self.cache_worker:
+            try: self.cache_worker.stop()
+            except RuntimeError: pass
+
         self.pending_dur_tasks.clear()
         self.pending_thumb_tasks.clear()
         
@@ -2,10 +2,59 @@
 import sys
 import os
 import subprocess
+import hashlib
+import shutil
+import signal
 
 def get_subprocess_flags():
     return subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
 
+def get_startupinfo():
+    """ 隐藏子进程窗口 (仅 Windows，其他平台返回 None) """
+    if os.name != 'nt':
+        return None
+    startupinfo = subprocess.STARTUPINFO()
+    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    return startupinfo
+
+def _descendant_pids(pid):
+    """ 通过 /proc 收集某进程的全部后代进程 (Linux) """
+    children = {}
+    try:
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f'/proc/{entry}/stat', 'r') as f:
+                    # 进程名可能包含空格，从最后一个 ')' 之后解析
+                    ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+                children.setdefault(ppid, []).append(int(entry))
+            except (OSError, ValueError, IndexError):
+                continue
+    except OSError:
+        return []
+    result, stack = [], [pid]
+    while stack:
+        for child in children.get(stack.pop(), []):
+            result.append(child)
+            stack.append(child)
+    return result
+
+def kill_process_tree(proc):
+    """ 结束子进程及其派生的所有进程 (ab-av1 会再启动 ffmpeg) """
+    if os.name == 'nt':
+        # 使用 Popen 异步执行 taskkill，避免阻塞 UI 线程导致假死
+        subprocess.Popen(["taskkill", "/F", "/T", "/PID", str(proc.pid)],
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                         creationflags=get_subprocess_flags())
+        return
+    for pid in reversed(_descendant_pids(proc.pid)):
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except OSError:
+            pass
+    proc.kill()
+
 def resource_path(relative_path):
     """ 获取资源绝对路径 """
     # 1. 优先检查 EXE 同级目录 (支持用户自定义/外部工具)
@@ -31,7 +80,15 @@ def resource_path(relative_path):
 
 def tool_path(filename):
     """ 获取 tools 目录下工具的绝对路径 """
-    return resource_path(os.path.join("tools", filename))
+    path = resource_path(os.path.join("tools", filename))
+    # 非 Windows 平台 (如 Linux 渲染节点) 使用无 .exe 后缀的工具，找不到时回退到 PATH
+    if os.name != 'nt' and filename.endswith('.exe'):
+        name = filename[:-4]
+        native_path = resource_path(os.path.join("tools", name))
+        if os.path.exists(native_path):
+            return native_path
+        return shutil.which(name) or native_path
+    return path
 
 def safe_decode(bytes_data):
     if not bytes_data:
@@ -51,6 +108,15 @@ def time_str_to_seconds(time_str):
     except Exception:
         return 0.0
 
+def parse_frame_rate(rate_str):
+    """ 解析 ffprobe 的帧率字符串 (例如 "24000/1001")，无效时返回 0.0 """
+    try:
+        num, _, den = str(rate_str).partition('/')
+        value = float(num) / float(den) if den else float(num)
+        return value if value > 0 else 0.0
+    except (ValueError, ZeroDivisionError):
+        return 0.0
+
 def to_long_path(path):
     """ 转换路径以支持 Windows 长路径 (超过 260 字符) """
     if os.name == 'nt':
@@ -68,3 +134,27 @@ def get_config_path():
     """ 获取配置文件路径 (exe同级) """
     base_path = os.path.dirname(sys.executable) if getattr(sys, 'frozen', False) else os.path.abspath(".")
     return os.path.join(base_path, "config.ini")
+
+def file_fingerprint(path):
+    """ 根据路径、大小和修改时间生成文件指纹 (用于跨批次缓存测量结果) """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return ""
+    raw = f"{os.path.normcase(os.path.abspath(path))}|{st.st_size}|{int(st.st_mtime)}"
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+def parse_setting(raw, default):
+    """ 按默认值的类型解析 config.ini 中的字符串配置 """
+    if raw is None:
+        return default
+    try:
+        if isinstance(default, bool):
+            return str(raw).strip().lower() in ("true", "1", "yes", "on")
+        if isinstance(default, int):
+            return int(float(raw))
+        if isinstance(default, float):
+            return float(raw)
+    except (ValueError, TypeError):
+        return default
+    return str(raw).strip()
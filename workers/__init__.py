@@ -1,4 +1,5 @@
 from .base import BaseWorker
 from .dependency import DependencyWorker
 from .encoder import EncoderWorker
-from .analyzer import AnalysisWorker, DurationWorker, ThumbnailWorker
\ No newline at end of file
+from .analyzer import AnalysisWorker, DurationWorker, ThumbnailWorker
+from .maintenance import CacheWorker
\ No newline at end of file
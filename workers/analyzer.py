@@ -6,7 +6,7 @@ from PySide6.QtGui import QImage
 from qfluentwidgets import isDarkTheme
 
 from i18n.translator import tr
-from utils import tool_path, get_subprocess_flags, safe_decode
+from utils import tool_path, get_subprocess_flags, get_startupinfo, safe_decode, parse_frame_rate
 from config import PIX_FMT_10BIT
 from .base import BaseWorker
 
@@ -49,20 +49,31 @@ class DurationWorker(BaseWorker):
             duration_sec = float(data.get('format', {}).get('duration', 0))
             codec = ""
             channels = None
+            audio_streams = 0
+            width = height = 0
+            frame_rate = 0.0
+            profile = pix_fmt = ""
             for s in data.get('streams', []):
                 if s.get('codec_type') == 'video' and not codec:
                     # 排除封面图等干扰流，确保识别到真正的视频编码
                     if s.get('codec_name', '').lower() not in ['mjpeg', 'png', 'bmp']:
                         codec = s.get('codec_name', '').lower()
-                elif s.get('codec_type') == 'audio' and channels is None:
-                    channels = int(s.get('channels', 2))
+                        width, height = int(s.get('width') or 0), int(s.get('height') or 0)
+                        frame_rate = parse_frame_rate(s.get('avg_frame_rate') or s.get('r_frame_rate'))
+                        profile, pix_fmt = s.get('profile', ''), s.get('pix_fmt', '')
+                elif s.get('codec_type') == 'audio':
+                    audio_streams += 1
+                    if channels is None:
+                        channels = int(s.get('channels', 2))
             if channels is None: channels = 2
 
             m, s = divmod(int(duration_sec), 60)
             h, m = divmod(m, 60)
             dur_str = f"{h:02d}:{m:02d}:{s:02d}" if h > 0 else f"{m:02d}:{s:02d}"
             # 发送完整元数据包
-            self.result.emit(self.filepath, dur_str, duration_sec, {"codec": codec, "channels": channels})
+            self.result.emit(self.filepath, dur_str, duration_sec, {"codec": codec, "channels": channels, "audio_streams": audio_streams,
+                                                               "width": width, "height": height, "frame_rate": frame_rate,
+                                                               "profile": profile, "pix_fmt": pix_fmt})
         except Exception:
             self.result.emit(self.filepath, "N/A", 0.0, {})
 
@@ -157,8 +168,7 @@ class AnalysisWorker(BaseWorker):
                 "-show_format", "-show_streams", "-show_chapters",
                 self.filepath
             ]
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+            startupinfo = get_startupinfo()
             
             with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, startupinfo=startupinfo, creationflags=get_subprocess_flags()) as proc:
                 self.proc = proc
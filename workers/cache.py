@@ -0,0 +1,187 @@
+import os
+import re
+import json
+import shutil
+import threading
+
+from config import (
+    LOUDNORM_CACHE_FILE, CPU_SPEED_CACHE_FILE, QUARANTINE_CACHE_FILE, CRF_CACHE_FILE, INTEGRITY_CACHE_FILE, MEMORY_CACHE_FILE,
+    STAGING_DIR_NAME
+)
+from .process import pid_alive
+
+
+class JsonCache:
+    """
+    以 JSON 文件持久化的键值缓存，按文件指纹保存各类测量结果。
+    路径为空时仅在内存中缓存 (例如缓存目录不可用)。
+    """
+    def __init__(self, path):
+        self.path = path
+        self._data = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._data is not None:
+            return
+        self._data = {}
+        if self.path and os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    self._data = data
+            except Exception:
+                pass
+
+    def get(self, key, default=None):
+        with self._lock:
+            self._load()
+            return self._data.get(key, default)
+
+    def set(self, key, value):
+        with self._lock:
+            self._load()
+            self._data[key] = value
+            self._save()
+
+    def pop(self, key, default=None):
+        with self._lock:
+            self._load()
+            value = self._data.pop(key, default)
+            self._save()
+            return value
+
+    def _save(self):
+        if not self.path:
+            return
+        try:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            pass
+
+
+# 持久化的测量记录 (体积很小)，不参与淘汰
+PERSISTENT_FILES = (LOUDNORM_CACHE_FILE, CPU_SPEED_CACHE_FILE, QUARANTINE_CACHE_FILE, CRF_CACHE_FILE, INTEGRITY_CACHE_FILE,
+                    MEMORY_CACHE_FILE)
+SCRATCH_PATTERN = re.compile(r"^magicworkshop_scratch_(\d+)_\d+$")
+TEMP_SUFFIXES = (".temp.mkv", ".partial", ".vmaf.json", ".stats.txt", ".repair", ".tmp")
+SAMPLE_PATTERN = re.compile(r"(^\.ab-av1-|\.sample\d+.*\.(mkv|mp4)$)")
+
+
+def _entry_size(path):
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+class CacheManager:
+    """
+    缓存目录管理：识别缓存目录中的各类产物 (临时输出、ab-av1 样本、预读暂存副本、探测临时目录)，
+    按总大小上限以最近使用时间 (LRU) 淘汰，并清理崩溃后遗留的孤立文件。
+    持久化的测量记录与无法识别的文件不会被删除。
+    """
+    def __init__(self, cache_dir, max_bytes=0, ram_dir=""):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.ram_dir = ram_dir
+
+    @staticmethod
+    def _kind(name):
+        if name in PERSISTENT_FILES:
+            return "persistent"
+        match = SCRATCH_PATTERN.match(name)
+        if match:
+            return "scratch"
+        if name.endswith(TEMP_SUFFIXES):
+            return "temp"
+        if SAMPLE_PATTERN.search(name):
+            return "sample"
+        return None
+
+    def scan(self):
+        """ 返回缓存产物列表 [(路径, 类别, 大小, 最近使用时间)]。 """
+        entries = []
+        def add(path, kind):
+            try:
+                st = os.stat(path)
+                entries.append((path, kind, _entry_size(path), max(st.st_atime, st.st_mtime, st.st_ctime)))
+            except OSError:
+                pass
+        if self.cache_dir and os.path.isdir(self.cache_dir):
+            for name in os.listdir(self.cache_dir):
+                path = os.path.join(self.cache_dir, name)
+                if name == STAGING_DIR_NAME and os.path.isdir(path):
+                    for staged in os.listdir(path):
+                        add(os.path.join(path, staged), "staging")
+                    continue
+                kind = self._kind(name)
+                if kind:
+                    add(path, kind)
+        if self.ram_dir and os.path.isdir(self.ram_dir):
+            for name in os.listdir(self.ram_dir):
+                if SCRATCH_PATTERN.match(name):
+                    add(os.path.join(self.ram_dir, name), "scratch")
+        return entries
+
+    @staticmethod
+    def _remove(path):
+        try:
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+            return True
+        except OSError:
+            return False
+
+    def _in_use(self, path, kind, last_used, protect_after):
+        """ 探测临时目录按进程号判断；其他产物在 protect_after 之后使用过的视为当前任务正在使用。 """
+        if kind == "scratch":
+            pid = int(SCRATCH_PATTERN.match(os.path.basename(path)).group(1))
+            if pid == os.getpid():
+                return protect_after is not None
+            return pid_alive(pid)
+        return protect_after is not None and last_used >= protect_after
+
+    def sweep(self, protect_after=None):
+        """
+        清理所有临时产物 (启动时即为上次运行崩溃后遗留的孤立文件)，返回 (数量, 字节数)。
+        protect_after 为当前编码任务的开始时间，之后使用过的产物不会被清理。
+        """
+        count = freed = 0
+        for path, kind, size, last_used in self.scan():
+            if kind == "persistent" or self._in_use(path, kind, last_used, protect_after):
+                continue
+            if self._remove(path):
+                count += 1
+                freed += size
+        return count, freed
+
+    def evict(self, protect_after=None):
+        """ 缓存总大小超过上限时，按最近使用时间从旧到新淘汰，返回 (数量, 字节数)。 """
+        if self.max_bytes <= 0:
+            return 0, 0
+        entries = self.scan()
+        total = sum(size for _, _, size, _ in entries)
+        count = freed = 0
+        for path, kind, size, last_used in sorted(entries, key=lambda e: e[3]):
+            if total <= self.max_bytes:
+                break
+            if kind == "persistent" or self._in_use(path, kind, last_used, protect_after):
+                continue
+            if self._remove(path):
+                total -= size
+                count += 1
+                freed += size
+        return count, freed
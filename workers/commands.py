@@ -0,0 +1,229 @@
+import os
+
+from config import PIX_FMT_10BIT, PIX_FMT_AB_AV1, SVT_PRESET_MAP, AOM_CPU_USED_MAP
+from .vmaf import build_verify_args
+
+
+CPU_ENCODER_NAMES = ("libsvtav1", "libaom-av1")
+
+# 硬件解码支持表: 编码器 -> (hwaccel, hwaccel_output_format, GPU 上转换为 10bit 的滤镜, {源编码: 支持的 profile})
+# profile 为 None 表示该编码的所有 profile 均可；仅支持 4:2:0 采样
+HW_DECODE_SUPPORT = {
+    "av1_qsv": ("qsv", "qsv", "vpp_qsv=format=p010", {
+        "h264": ("constrained baseline", "baseline", "main", "high"),
+        "hevc": ("main", "main 10"),
+        "vp9": ("profile 0", "profile 2"),
+        "av1": ("main",),
+        "mpeg2video": None,
+    }),
+    "av1_nvenc": ("cuda", "cuda", "scale_cuda=format=p010le", {
+        "h264": ("constrained baseline", "baseline", "main", "high"),
+        "hevc": ("main", "main 10"),
+        "vp9": ("profile 0", "profile 2"),
+        "av1": ("main",),
+        "mpeg2video": None,
+        "vc1": None,
+    }),
+    # AMF 无 GPU 端格式转换滤镜，仅在源本身为 10bit 时直接使用解码出的 P010 帧
+    "av1_amf": ("d3d11va", "d3d11", "", {
+        "hevc": ("main 10",),
+        "vp9": ("profile 2",),
+        "av1": ("main",),
+    }),
+}
+
+
+def preset_for(enc_name, p_val):
+    """ 将 1-7 档 Preset (1 最慢/画质最好) 转换为各编码器自身的预设参数。 """
+    p_val = max(1, min(7, int(p_val)))
+    if enc_name == "libsvtav1":
+        return str(SVT_PRESET_MAP[p_val])
+    if enc_name == "libaom-av1":
+        return str(AOM_CPU_USED_MAP[p_val])
+    if enc_name == "av1_nvenc":
+        return f"p{8 - p_val}"
+    if enc_name == "av1_amf":
+        if p_val <= 2: return "quality"
+        if p_val <= 5: return "balanced"
+        return "speed"
+    return str(p_val)
+
+
+def build_hw_decode_args(enc_name, codec, profile, pix_fmt, device=None):
+    """
+    生成硬件解码参数，使帧从解码到编码全程留在显存中。
+    返回 {"input": 输入前参数, "filter": GPU 上的格式转换滤镜, "sw_format": 下载到内存时的像素格式}；
+    编码器、源编码、profile 或像素格式不受支持时返回 None (使用软件解码)。
+    """
+    support = HW_DECODE_SUPPORT.get(enc_name)
+    if not support or not codec:
+        return None
+    hwaccel, output_format, upload_filter, codecs = support
+    if codec not in codecs:
+        return None
+    profiles = codecs[codec]
+    if profiles is not None and (profile or "").strip().lower() not in profiles:
+        return None
+    pix_fmt = (pix_fmt or "").lower()
+    if pix_fmt and not (pix_fmt.startswith(("yuv420p", "yuvj420p")) or pix_fmt in ("nv12", "p010le")):
+        return None
+    is_10bit = "10" in pix_fmt
+    if enc_name == "av1_amf" and not is_10bit:
+        return None
+
+    args = ["-hwaccel", hwaccel, "-hwaccel_output_format", output_format]
+    if enc_name == "av1_qsv":
+        # 复用 build_hw_init_args 创建的 QSV 设备
+        args.extend(["-hwaccel_device", "hw"])
+    elif device is not None:
+        args.extend(["-hwaccel_device", str(device)])
+    return {"input": args, "filter": upload_filter, "sw_format": "p010le" if is_10bit else "nv12"}
+
+
+def build_video_args(enc_name, enc_preset, icq, nv_aq=True, cpu_opts=None, device=None, hw_frames=False):
+    """
+    生成视频编码器参数 (不含输入/输出)。
+    device 为多显卡时的设备序号 (NVENC 通过 -gpu 选择，QSV 见 build_hw_init_args)。
+    hw_frames 为 True 时输入为显存中的帧，不再指定 -pix_fmt (格式转换由 GPU 滤镜完成)。
+    cpu_opts 仅用于 CPU 编码器: {"threads": 线程数, "lp": SVT 并行度, "tiles": aom tile 列数 (log2)}，0 表示由编码器自动决定。
+    """
+    cpu_opts = cpu_opts or {}
+    if enc_name in CPU_ENCODER_NAMES:
+        # CPU 编码器直接使用 ab-av1 探测出的 CRF，无需偏移
+        args = ["-c:v", enc_name, "-pix_fmt", PIX_FMT_AB_AV1, "-crf", str(icq)]
+        threads = int(cpu_opts.get("threads") or 0)
+        if enc_name == "libsvtav1":
+            args.extend(["-preset", enc_preset])
+            lp = int(cpu_opts.get("lp") or threads)
+            if lp > 0:
+                args.extend(["-svtav1-params", f"lp={lp}"])
+        else:
+            args.extend(["-b:v", "0", "-cpu-used", enc_preset, "-row-mt", "1"])
+            if threads > 0:
+                args.extend(["-threads", str(threads)])
+            tiles = int(cpu_opts.get("tiles") or 0)
+            if tiles > 0:
+                args.extend(["-tile-columns", str(tiles)])
+        return args
+
+    args = ["-c:v", enc_name] if hw_frames else ["-c:v", enc_name, "-pix_fmt", PIX_FMT_10BIT]
+    if enc_name == "av1_qsv":
+        args.extend(["-global_quality:v", str(icq), "-preset", enc_preset, "-look_ahead", "1"])
+    elif enc_name == "av1_nvenc":
+        args.extend(["-cq", str(icq), "-preset", enc_preset, "-b:v", "0"])
+        if device is not None:
+            args.extend(["-gpu", str(device)])
+        if nv_aq:
+            args.extend(["-spatial-aq", "1", "-temporal-aq", "1"])
+    elif enc_name == "av1_amf":
+        args.extend(["-usage", "transcoding", "-quality", enc_preset, "-rc", "vbr_latency", "-qvbr_quality_level", str(icq)])
+        if nv_aq: # 复用 nv_aq 开关作为 AMD PreAnalysis
+            args.extend(["-preanalysis", "true"])
+    return args
+
+
+def build_hw_init_args(enc_name, device=None, os_name=os.name):
+    """
+    生成输入之前的硬件设备初始化参数。
+    指定 device 时，QSV 从对应的 D3D11 适配器 (Windows) 或 DRM 渲染节点 (Linux) 派生会话。
+    """
+    if enc_name != "av1_qsv":
+        return []
+    if device is None:
+        return ["-init_hw_device", "qsv=hw", "-filter_hw_device", "hw"]
+    if os_name == 'nt':
+        parent = ["-init_hw_device", f"d3d11va=dx{device}:{device}"]
+        child = f"qsv=hw@dx{device}"
+    else:
+        parent = ["-init_hw_device", f"vaapi=va{device}:/dev/dri/renderD{128 + int(device)}"]
+        child = f"qsv=hw@va{device}"
+    return parent + ["-init_hw_device", child, "-filter_hw_device", "hw"]
+
+
+def encode_with_fallback(build, run, hw_decode, on_fallback=None):
+    """
+    运行最终编码：build(hw_decode) 构建命令行，run(cmd) 执行并返回 (返回码, ...)。
+    使用硬件解码且失败时 (驱动不支持该流等) 调用 on_fallback()，改用软件解码重新运行一次；
+    on_fallback 返回 False 时不再重试 (例如任务已停止)。返回 (run 的结果, 最终使用的 hw_decode)。
+    """
+    result = run(build(hw_decode))
+    if result[0] != 0 and hw_decode:
+        if on_fallback and on_fallback() is False:
+            return result, hw_decode
+        hw_decode = None
+        result = run(build(None))
+    return result, hw_decode
+
+
+def build_encode_cmd(ffmpeg, src, output, enc_name, enc_preset, icq, audio_args, sub_codec,
+                     nv_aq=True, verify_log=None, verify_subsample=1, cpu_opts=None, device=None, hw_decode=None,
+                     renditions=None, video_filter="", vfr=False):
+    """
+    构建最终编码的 FFmpeg 命令行。hw_decode 为 build_hw_decode_args 的结果 (None 表示软件解码)。
+    video_filter 为编码前的软件视频滤镜 (例如裁剪黑边)，同时作用于验收的参考帧，不可与 hw_decode 同时使用。
+    vfr 为 True 时各输出使用可变帧率 (滤镜丢弃重复帧后不再补帧)。
+    renditions 为附加输出列表 [{"output", "filter", "icq", "stats_path"}]：源只解码一次，
+    经 split 滤镜分发给主输出与各附加输出，各自使用独立的编码参数与保存路径。
+    """
+    cmd = [ffmpeg, "-y", "-hide_banner"]
+
+    # 硬件设备初始化 (如果适用)
+    cmd.extend(build_hw_init_args(enc_name, device))
+    cmd.extend(["-v", "verbose"])
+
+    # 硬件解码 (帧保留在显存中)
+    if hw_decode:
+        cmd.extend(hw_decode["input"])
+    cmd.extend(["-i", src])
+
+    # 多规格输出：一次解码后 split 分发
+    renditions = renditions or []
+    video_map = "0:v:0"
+    if renditions:
+        graph = f"[0:v:0]{video_filter + ',' if video_filter else ''}split={len(renditions) + 1}[vmain]" + "".join(f"[vsplit{k}]" for k in range(len(renditions)))
+        for k, rendition in enumerate(renditions):
+            graph += f";[vsplit{k}]{rendition['filter']}[vrend{k}]"
+        cmd.extend(["-filter_complex", graph])
+        video_map = "[vmain]"
+
+    # 视频编码参数
+    cmd.extend(build_video_args(enc_name, enc_preset, icq, nv_aq, cpu_opts, device, hw_frames=bool(hw_decode)))
+    if hw_decode and hw_decode["filter"]:
+        cmd.extend(["-vf", hw_decode["filter"]])
+    elif video_filter and not renditions:
+        cmd.extend(["-vf", video_filter])
+
+    # 音频和字幕
+    cmd.extend(audio_args)
+    cmd.extend(["-c:s", sub_codec])
+
+    # 映射所有流
+    cmd.extend(["-map", video_map, "-map", "0:a", "-map", "0:s?"])
+    if vfr:
+        cmd.extend(["-fps_mode:v:0", "vfr"])
+
+    # 输出文件
+    cmd.append(output)
+
+    # 附加规格输出 (进度通过 -stats_enc_post 按输出分别记录)
+    for k, rendition in enumerate(renditions):
+        cmd.extend(build_video_args(enc_name, enc_preset, rendition["icq"], nv_aq, cpu_opts, device))
+        cmd.extend(audio_args)
+        cmd.extend(["-c:s", sub_codec])
+        cmd.extend(["-map", f"[vrend{k}]", "-map", "0:a", "-map", "0:s?"])
+        if vfr:
+            cmd.extend(["-fps_mode:v:0", "vfr"])
+        if rendition.get("stats_path"):
+            cmd.extend(["-stats_enc_post:v:0", rendition["stats_path"], "-stats_enc_post_fmt:v:0", "{t}"])
+        cmd.append(rendition["output"])
+
+    # 同一次解码内的 VMAF 验收 (第二个输出为 null)
+    if verify_log:
+        # 硬件解码时参考帧需先下载到内存
+        ref_prefix = f"hwdownload,format={hw_decode['sw_format']}," if hw_decode else ""
+        if video_filter:
+            ref_prefix += video_filter + ","
+        cmd.extend(build_verify_args(verify_log, verify_subsample, ref_prefix=ref_prefix))
+
+    # [Fix] WinError 87 修复：过滤掉 cmd 中的空字符串和非字符串对象
+    return [str(arg) for arg in cmd if str(arg).strip()]
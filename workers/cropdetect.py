@@ -0,0 +1,139 @@
+import re
+import subprocess
+import threading
+from collections import Counter
+
+from config import CROP_SAMPLE_COUNT, CROP_SAMPLE_FRAMES, CROP_MIN_RATIO, CROP_LIMIT
+from utils import get_subprocess_flags, safe_decode
+
+
+def sample_timestamps(duration_sec, count):
+    """ 在 10%~90% 区间内均匀取样 (避开片头片尾的黑场)，时长未知时只取开头。 """
+    if duration_sec <= 0 or count <= 1:
+        return [0.0]
+    return [duration_sec * (0.1 + 0.8 * (k + 0.5) / count) for k in range(count)]
+
+
+def parse_crop(output):
+    """ 取 cropdetect 输出的最后一个裁剪结果 (w, h, x, y)；全黑画面等无效结果返回 None。 """
+    matches = re.findall(r"crop=(-?\d+):(-?\d+):(-?\d+):(-?\d+)", output)
+    if not matches:
+        return None
+    w, h, x, y = (int(v) for v in matches[-1])
+    if w <= 0 or h <= 0 or x < 0 or y < 0:
+        return None
+    return w, h, x, y
+
+
+def crop_consensus(crops, width, height):
+    """
+    由各采样点的结果得出裁剪区域：多数 (≥60%) 一致时直接采用，
+    否则取所有结果的外接矩形 (不会裁掉任何采样中出现过的画面)。
+    有效采样不足一半、或裁掉的面积不足 CROP_MIN_RATIO 时返回 None。
+    返回 (w, h, x, y, 一致的采样数)。
+    """
+    valid = [c for c in crops if c]
+    if not valid or len(valid) * 2 < len(crops):
+        return None
+    crop, agree = Counter(valid).most_common(1)[0]
+    if agree * 5 < len(valid) * 3:
+        x = min(c[2] for c in valid)
+        y = min(c[3] for c in valid)
+        w = max(c[2] + c[0] for c in valid) - x
+        h = max(c[3] + c[1] for c in valid) - y
+        crop = (w - w % 2, h - h % 2, x, y)
+    w, h, x, y = crop
+    if width and height:
+        w, h = min(w, int(width) - x), min(h, int(height) - y)
+        if w * h >= int(width) * int(height) * (1.0 - CROP_MIN_RATIO):
+            return None
+    return w, h, x, y, agree
+
+
+class SampledDecoder:
+    """
+    在多个时间点并行解码一小段并解析 FFmpeg 输出的分析任务基类。
+    子类实现 _command(ts) 与 _parse(output)。
+    """
+    def __init__(self, ffmpeg, src, duration_sec, samples):
+        self.ffmpeg = ffmpeg
+        self.src = src
+        self.timestamps = sample_timestamps(duration_sec, samples)
+        self.procs = []
+        self.cancelled = False
+        self._lock = threading.Lock()
+
+    def _command(self, ts):
+        raise NotImplementedError
+
+    def _parse(self, output):
+        raise NotImplementedError
+
+    def _sample(self, ts, results, idx):
+        try:
+            with self._lock:
+                if self.cancelled:
+                    return
+                proc = subprocess.Popen(self._command(ts), stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                        creationflags=get_subprocess_flags())
+                self.procs.append(proc)
+            _, stderr = proc.communicate()
+            if proc.returncode == 0:
+                results[idx] = self._parse(safe_decode(stderr))
+        except Exception:
+            pass
+
+    def run_samples(self):
+        """ 并行运行所有采样点，返回各采样点的解析结果 (失败为 None)。 """
+        results = [None] * len(self.timestamps)
+        threads = [threading.Thread(target=self._sample, args=(ts, results, idx), daemon=True)
+                   for idx, ts in enumerate(self.timestamps)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return results
+
+    def cancel(self):
+        with self._lock:
+            self.cancelled = True
+            procs = list(self.procs)
+        for proc in procs:
+            if proc.poll() is None:
+                try:
+                    proc.kill()
+                except Exception:
+                    pass
+
+
+class CropDetector(SampledDecoder):
+    """
+    黑边检测预处理：在多个时间点并行解码少量帧运行 cropdetect，取一致的裁剪区域。
+    每个采样点只解码 CROP_SAMPLE_FRAMES 帧，总开销约为几秒钟的解码。
+    阈值使用 0~1 的归一化值，由 cropdetect 按源的位深缩放 (10bit 源的黑色电平约为 64)。
+    """
+    def __init__(self, ffmpeg, src, duration_sec, samples=CROP_SAMPLE_COUNT, frames=CROP_SAMPLE_FRAMES, limit=CROP_LIMIT):
+        super().__init__(ffmpeg, src, duration_sec, samples)
+        self.frames = frames
+        self.limit = limit
+
+    def _command(self, ts):
+        return [self.ffmpeg, "-hide_banner", "-nostats", "-ss", f"{ts:.3f}", "-i", self.src,
+                "-map", "0:v:0", "-frames:v", str(self.frames), "-vf", f"cropdetect=limit={self.limit}:round=2:reset=0",
+                "-an", "-sn", "-dn", "-f", "null", "-"]
+
+    def _parse(self, output):
+        return parse_crop(output)
+
+    def detect(self, width, height):
+        """ 运行所有采样点并返回 crop_consensus 的结果。 """
+        results = self.run_samples()
+        if self.cancelled:
+            return None
+        return crop_consensus(results, width, height)
+
+
+def crop_filter(crop):
+    """ 将裁剪区域转换为 FFmpeg 滤镜。 """
+    w, h, x, y = crop[:4]
+    return f"crop={w}:{h}:{x}:{y}"
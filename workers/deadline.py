@@ -0,0 +1,82 @@
+import time
+import datetime
+
+from config import PRESET_SPEED_FACTOR, DEADLINE_FILE_OVERHEAD
+from .commands import preset_for
+from .planner import history_key, instance_speed, gpu_speed
+
+
+def parse_deadline(text, now=None):
+    """
+    解析截止时间：支持 "HH:MM" (今天，已过则为明天) 与 "YYYY-MM-DD HH:MM"。
+    返回时间戳，无法解析或为空时返回 None。
+    """
+    text = (text or "").strip()
+    if not text:
+        return None
+    now = now or datetime.datetime.now()
+    for fmt in ("%Y-%m-%d %H:%M", "%Y-%m-%dT%H:%M", "%Y-%m-%d %H:%M:%S"):
+        try:
+            return datetime.datetime.strptime(text, fmt).timestamp()
+        except ValueError:
+            pass
+    try:
+        clock = datetime.datetime.strptime(text, "%H:%M").time()
+    except ValueError:
+        return None
+    target = datetime.datetime.combine(now.date(), clock)
+    if target <= now:
+        target += datetime.timedelta(days=1)
+    return target.timestamp()
+
+
+class DeadlinePlanner:
+    """
+    截止时间驱动的预设选择：每个文件开始前，按实测速度估计剩余文件 (含本文件) 在各档 Preset 下的总耗时，
+    先求出全部剩余文件能按时完成的最慢 (画质最好) 的统一档位，再为本文件单独选择：
+    在其余文件仍按该档位完成的前提下，本文件使用能放进剩余时间的最慢一档。
+    档位之间的余量因此按文件逐个分配 (耗时短的文件更容易用上更慢的档位)，时间宽裕时更慢，紧张时更快。
+    速度记录随每个文件完成而更新，因此之后的选择会自动按真实速度重新规划。
+    """
+    def __init__(self, deadline, history, overhead=DEADLINE_FILE_OVERHEAD):
+        self.deadline = deadline
+        self.history = history
+        self.overhead = overhead
+
+    def fps(self, slot, p_val, bucket):
+        """ 估计槽位在指定档位下的帧率：优先按最接近的实测档位换算，否则按先验值换算。 """
+        threads = int(slot.cpu_opts.get("threads") or 0) if slot.is_cpu else 0
+        nearest = None
+        for q in range(1, 8):
+            value = self.history.get(history_key(slot.enc_name, preset_for(slot.enc_name, q), bucket, threads))
+            if value and (nearest is None or abs(q - p_val) < abs(nearest[0] - p_val)):
+                nearest = (q, float(value))
+        if nearest:
+            q, value = nearest
+        else:
+            # 先验帧率对应中等预设 (第 4 档)
+            q = 4
+            if slot.is_cpu:
+                value = instance_speed(slot.enc_name, preset_for(slot.enc_name, q), bucket, max(1, threads))
+            else:
+                value = gpu_speed(slot.enc_name, preset_for(slot.enc_name, q), bucket)
+        return value * PRESET_SPEED_FACTOR[p_val] / PRESET_SPEED_FACTOR[q]
+
+    def estimate(self, slot, p_val, work, slot_count=1):
+        """ 估计 work ([(帧数, 分辨率档位)]) 在 slot_count 个同类槽位上以指定档位完成所需的秒数。 """
+        total = sum(frames / max(self.fps(slot, p_val, bucket), 0.01) + self.overhead for frames, bucket in work)
+        return total / max(1, slot_count)
+
+    def choose(self, slot, work, slot_count=1):
+        """ 为 work 中的第一个文件 (本文件) 选择档位，返回 (档位, 预计完成时间戳, 是否能在截止前完成)。 """
+        now = time.time()
+        budget = self.deadline - now
+        uniform = next((p for p in range(1, 8) if self.estimate(slot, p, work, slot_count) <= budget), None)
+        if uniform is None:
+            return 7, now + self.estimate(slot, 7, work, slot_count), False
+        rest = self.estimate(slot, uniform, work[1:], slot_count)
+        for p_val in range(1, uniform):
+            seconds = self.estimate(slot, p_val, work[:1], slot_count) + rest
+            if seconds <= budget:
+                return p_val, now + seconds, True
+        return uniform, now + self.estimate(slot, uniform, work, slot_count), True
@@ -0,0 +1,47 @@
+import re
+
+from config import DECIMATE_SAMPLE_COUNT, DECIMATE_SAMPLE_SECONDS, DECIMATE_FILTER
+from .cropdetect import SampledDecoder
+
+
+def parse_decimate(output):
+    """ 统计 mpdecimate 调试输出中的保留/丢弃帧数，返回 (丢弃数, 总帧数)。 """
+    decisions = re.findall(r"\b(keep|drop) pts:", output)
+    if not decisions:
+        return None
+    return decisions.count("drop"), len(decisions)
+
+
+def decimate_ratio(results):
+    """ 汇总各采样区间的结果，返回重复帧比例；有效采样不足一半时返回 None。 """
+    valid = [r for r in results if r]
+    if not valid or len(valid) * 2 < len(results):
+        return None
+    total = sum(t for _, t in valid)
+    return sum(d for d, _ in valid) / total if total else None
+
+
+class DecimateAnalyzer(SampledDecoder):
+    """
+    重复帧分析：在多个时间点并行解码一小段 (DECIMATE_SAMPLE_SECONDS 秒)，统计 mpdecimate 会丢弃的帧比例。
+    vfilter 为其前的滤镜 (例如裁剪)，与最终编码保持一致。
+    """
+    def __init__(self, ffmpeg, src, duration_sec, vfilter="", samples=DECIMATE_SAMPLE_COUNT, seconds=DECIMATE_SAMPLE_SECONDS):
+        super().__init__(ffmpeg, src, duration_sec, samples)
+        self.seconds = seconds
+        self.filter = ",".join(f for f in (vfilter, DECIMATE_FILTER) if f)
+
+    def _command(self, ts):
+        return [self.ffmpeg, "-hide_banner", "-nostats", "-loglevel", "debug",
+                "-ss", f"{ts:.3f}", "-t", str(self.seconds), "-i", self.src,
+                "-map", "0:v:0", "-vf", self.filter, "-an", "-sn", "-dn", "-f", "null", "-"]
+
+    def _parse(self, output):
+        return parse_decimate(output)
+
+    def analyze(self):
+        """ 返回整片的重复帧比例估计 (0~1)，失败时返回 None。 """
+        results = self.run_samples()
+        if self.cancelled:
+            return None
+        return decimate_ratio(results)
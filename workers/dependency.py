@@ -4,8 +4,9 @@ from PySide6.QtCore import Signal
 
 from i18n.translator import tr
 from utils import tool_path, get_subprocess_flags, safe_decode
-from config import PIX_FMT_10BIT, PIX_FMT_8BIT
+from config import PIX_FMT_10BIT, PIX_FMT_8BIT, PIX_FMT_AB_AV1, ENC_QSV, ENC_NVENC, MAX_GPU_DEVICES
 from .base import BaseWorker
+from .commands import build_hw_init_args
 
 # --- 依赖检查线程 (启动优化) ---
 class DependencyWorker(BaseWorker):
@@ -14,7 +15,8 @@ class DependencyWorker(BaseWorker):
     它会检查所需的.exe文件是否存在，并尝试探测可用的硬件编码器。
     """
     log_signal = Signal(str, str)
-    result_signal = Signal(bool, bool, bool) # has_qsv, has_nvenc, has_amf
+    result_signal = Signal(bool, bool, bool, bool, bool) # has_qsv, has_nvenc, has_amf, has_svt, has_aom
+    devices_signal = Signal(dict) # 编码器名称 -> 可用设备序号列表 (多显卡)
     missing_signal = Signal(list)
 
     def run(self):
@@ -136,9 +138,72 @@ class DependencyWorker(BaseWorker):
                                 self.log_signal.emit(tr("log.dependency.amf_failed", error=short_err), "error")
                 except Exception as e:
                     self.log_signal.emit(tr("log.dependency.amf_exception", error=e), "error")
-            
-            # 6. 发送最终探测结果
-            self.result_signal.emit(has_qsv, has_nvenc, has_amf)
+
+            if not self.is_running: return
+
+            # 6. 探测 CPU 编码器 (无 GPU 的机器仍可使用 SVT-AV1 / libaom 完成最终编码)
+            has_svt = self._probe_cpu_encoder(ffmpeg_path, enc_str, "libsvtav1", ["-preset", "12"])
+            has_aom = self._probe_cpu_encoder(ffmpeg_path, enc_str, "libaom-av1", ["-cpu-used", "8", "-b:v", "0", "-crf", "40"])
+
+            # 7. 逐个枚举多显卡设备 (默认设备可用时才继续)
+            devices = {}
+            if has_qsv:
+                devices[ENC_QSV] = self._probe_devices(ffmpeg_path, "av1_qsv", ENC_QSV)
+            if has_nvenc:
+                devices[ENC_NVENC] = self._probe_devices(ffmpeg_path, "av1_nvenc", ENC_NVENC)
+            self.devices_signal.emit(devices)
+
+            # 8. 发送最终探测结果
+            self.result_signal.emit(has_qsv, has_nvenc, has_amf, has_svt, has_aom)
                 
         except Exception as e:
-            self.log_signal.emit(tr("log.dependency.check_exception", error=e), "error")
\ No newline at end of file
+            self.log_signal.emit(tr("log.dependency.check_exception", error=e), "error")
+
+    def _probe_devices(self, ffmpeg_path, codec, enc_label):
+        """ 按设备序号逐个尝试编码一帧，返回可用的设备序号列表。 """
+        devices = []
+        for idx in range(MAX_GPU_DEVICES):
+            if not self.is_running:
+                break
+            device_args = ["-gpu", str(idx)] if codec == "av1_nvenc" else []
+            try:
+                with subprocess.Popen(
+                    [ffmpeg_path, "-v", "error"] + build_hw_init_args(codec, idx) +
+                    ["-f", "lavfi", "-i", "color=black:s=1280x720",
+                     "-pix_fmt", PIX_FMT_10BIT,
+                     "-c:v", codec] + device_args + ["-frames:v", "1", "-f", "null", "-"],
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE, creationflags=get_subprocess_flags()
+                ) as proc:
+                    proc.communicate(timeout=5)
+                    ok = proc.returncode == 0
+            except Exception:
+                ok = False
+            if ok:
+                devices.append(idx)
+                self.log_signal.emit(tr("log.dependency.device_found", encoder=enc_label, index=idx), "info")
+            elif codec == "av1_nvenc":
+                # CUDA 设备序号连续，遇到第一个失败即可停止
+                break
+        return devices
+
+    def _probe_cpu_encoder(self, ffmpeg_path, enc_str, codec, extra_args):
+        """ 以一帧小分辨率画面测试 CPU 编码器是否可用。 """
+        if codec not in enc_str or not self.is_running:
+            return False
+        try:
+            with subprocess.Popen(
+                [ffmpeg_path, "-v", "error",
+                 "-f", "lavfi", "-i", "color=black:s=320x240",
+                 "-pix_fmt", PIX_FMT_AB_AV1,
+                 "-c:v", codec] + extra_args + ["-frames:v", "1", "-f", "null", "-"],
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE, creationflags=get_subprocess_flags()
+            ) as proc:
+                _, stderr = proc.communicate(timeout=10)
+                if proc.returncode == 0:
+                    return True
+                err_msg = safe_decode(stderr)
+                if err_msg:
+                    self.log_signal.emit(tr("log.dependency.cpu_encoder_failed", encoder=codec, error=err_msg.splitlines()[0]), "error")
+        except Exception as e:
+            self.log_signal.emit(tr("log.dependency.cpu_encoder_failed", encoder=codec, error=e), "error")
+        return False
@@ -0,0 +1,147 @@
+import os
+import shutil
+import threading
+
+from config import SAVE_MODE_OVERWRITE, SAVE_MODE_REMAIN, DISK_SAMPLE_RATIO, DISK_RESERVE_BYTES
+from .finalize import volume_id, pick_temp_dir
+from .ordering import estimate_savings
+
+
+def final_destination(filepath, save_mode, export_dir):
+    """ 按保存模式计算最终输出路径。 """
+    base_name = os.path.splitext(os.path.basename(filepath))[0]
+    if save_mode == SAVE_MODE_OVERWRITE:
+        return os.path.join(os.path.dirname(filepath), base_name + ".mkv")
+    if save_mode == SAVE_MODE_REMAIN:
+        return os.path.join(os.path.dirname(filepath), base_name + "_opt.mkv")
+    return os.path.join(export_dir or os.path.dirname(filepath), base_name + ".mkv")
+
+
+def _existing(path):
+    """ 路径本身或最近的已存在上级目录。 """
+    path = os.path.abspath(path)
+    while not os.path.exists(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return path
+
+
+def free_space(path):
+    """ 路径所在卷的剩余空间 (字节)，无法获取时返回 None。 """
+    try:
+        return shutil.disk_usage(_existing(path)).free
+    except OSError:
+        return None
+
+
+def format_size(size):
+    return f"{size / 1024 ** 3:.1f} GB"
+
+
+class DiskSpacePlanner:
+    """
+    磁盘空间规划：按探测元数据估计每个文件在各卷上需要的空间。
+    transient 为编码期间临时占用的空间 (临时输出、ab-av1 样本；覆盖模式下源文件与输出同时存在)，
+    persistent 为完成后保留下来的空间 (另存为/保留原文件时的输出)。
+    """
+    def __init__(self, cache_dir, save_mode, export_dir, temp_on_destination, metadata, reserve=DISK_RESERVE_BYTES):
+        self.cache_dir = cache_dir
+        self.save_mode = save_mode
+        self.export_dir = export_dir
+        self.temp_on_destination = temp_on_destination
+        self.metadata = metadata or {}
+        self.reserve = reserve
+
+    def file_needs(self, path):
+        """ 返回 {卷: [目录, transient, persistent]}。 """
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            size = 0
+        output = max(0, size - estimate_savings(path, self.metadata.get(path) or {}))
+        dest = final_destination(path, self.save_mode, self.export_dir)
+        src_dir = os.path.dirname(os.path.abspath(path))
+        temp_dir = self.cache_dir if self.cache_dir and os.path.isdir(self.cache_dir) else src_dir
+        if self.temp_on_destination:
+            temp_dir = pick_temp_dir(dest, temp_dir)
+
+        needs = {}
+        def add(directory, transient=0, persistent=0):
+            entry = needs.setdefault(volume_id(directory), [directory, 0, 0])
+            entry[1] += transient
+            entry[2] += persistent
+
+        add(temp_dir, transient=output)
+        add(self.cache_dir or src_dir, transient=int(size * DISK_SAMPLE_RATIO))
+        if self.save_mode != SAVE_MODE_OVERWRITE:
+            add(os.path.dirname(os.path.abspath(dest)), persistent=output)
+        return needs
+
+    def plan(self, tasks, concurrency=1):
+        """
+        估计整个批次在各卷上的峰值需求：所有输出的保留空间之和，加上同时进行的
+        concurrency 个最大文件的临时空间。返回 {卷: (目录, 需求字节)}。
+        """
+        persistent, transients = {}, {}
+        for path in tasks:
+            for vol, (directory, transient, kept) in self.file_needs(path).items():
+                persistent.setdefault(vol, [directory, 0])[1] += kept
+                transients.setdefault(vol, []).append(transient)
+                persistent[vol][0] = directory
+        result = {}
+        for vol, (directory, kept) in persistent.items():
+            peak = sum(sorted(transients[vol], reverse=True)[:max(1, concurrency)])
+            result[vol] = (directory, kept + peak)
+        return result
+
+    def shortfalls(self, plan):
+        """ 返回剩余空间 (扣除保留空间后) 不足的卷：[(目录, 需求, 剩余)]。 """
+        short = []
+        for directory, need in plan.values():
+            free = free_space(directory)
+            if free is not None and free - self.reserve < need:
+                short.append((directory, need, free))
+        return short
+
+
+class DiskSpaceGuard:
+    """
+    运行期磁盘空间监控：每个文件开始前检查各卷剩余空间是否足够容纳本文件与正在进行的文件，
+    不足时暂停领取新文件，直到空间释放或任务停止。
+    没有其他文件登记需求时总是放行 (预估可能偏大)，避免需求超过磁盘剩余空间的文件永远等待。
+    """
+    def __init__(self, planner):
+        self.planner = planner
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def _shortage(self, needs):
+        for vol, (directory, transient, kept) in needs.items():
+            free = free_space(directory)
+            if free is None:
+                continue
+            need = transient + kept + self._inflight.get(vol, 0)
+            if free - self.planner.reserve < need:
+                return directory, need, free
+        return None
+
+    def acquire(self, path):
+        """
+        登记本文件的需求，返回 (needs, shortage, 是否放行)；shortage 为 None 或 (目录, 需求, 剩余)。
+        空间不足但没有其他文件登记需求时仍然放行，此时 shortage 不为 None。
+        """
+        needs = self.planner.file_needs(path)
+        with self._lock:
+            shortage = self._shortage(needs)
+            admitted = shortage is None or not any(self._inflight.values())
+            if admitted:
+                for vol, (_, transient, kept) in needs.items():
+                    self._inflight[vol] = self._inflight.get(vol, 0) + transient + kept
+            return needs, shortage, admitted
+
+    def release(self, needs):
+        with self._lock:
+            for vol, (_, transient, kept) in needs.items():
+                self._inflight[vol] = max(0, self._inflight.get(vol, 0) - transient - kept)
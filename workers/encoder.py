@@ -4,22 +4,54 @@ import time
 import re
 import ctypes
 import json
-import shutil
+import threading
+from functools import partial
 from PySide6.QtCore import Signal
 
 from i18n.translator import tr
 from utils import (
-    get_subprocess_flags, tool_path, safe_decode,
-    time_str_to_seconds, to_long_path, get_default_cache_dir
+    get_subprocess_flags, get_startupinfo, tool_path, safe_decode,
+    time_str_to_seconds, to_long_path, get_default_cache_dir, file_fingerprint, parse_frame_rate
 )
 from config import (
     VIDEO_EXTS, SAVE_MODE_OVERWRITE, SAVE_MODE_REMAIN,
     SUBTITLE_CODEC_SRT, AUDIO_CODEC, SAMPLE_RATE,
     LOUDNORM_MODE_ALWAYS, LOUDNORM_MODE_AUTO,
-    ENC_NVENC, ENC_AMF, PIX_FMT_AB_AV1, PIX_FMT_10BIT, PIX_FMT_8BIT,
-    GPU_COOLING_TIME
+    ENC_NVENC, ENC_AMF, ENC_SVT, ENC_AOM, SVT_PRESET_MAP, AOM_CPU_USED_MAP, PIX_FMT_AB_AV1,
+    GPU_COOLING_TIME, LOUDNORM_CACHE_FILE, VERIFY_ACTION_REQUEUE,
+    CPU_SPEED_CACHE_FILE, CPU_PINNING_OFF, CPU_PINNING_CORES, CPU_PINNING_NUMA, GPU_ASSIGN_LEAST_LOADED,
+    MIXED_POOL_RESERVED_CPUS, MIXED_POOL_DEFAULT_DURATION, DECIMATE_FILTER, QUARANTINE_CACHE_FILE,
+    CRF_CACHE_FILE, QUEUE_ORDER_ADDED, DISK_MONITOR_INTERVAL, STAGING_DIR_NAME,
+    INTEGRITY_CACHE_FILE, INTEGRITY_SCAN_SAMPLE, INTEGRITY_SCAN_FULL, INTEGRITY_ACTION_FLAG, INTEGRITY_ACTION_SKIP,
+    GOVERNOR_OFF, GOVERNOR_INTERACTIVE, GOVERNOR_OFFHOURS, PRIORITY_IDLE, PRIORITY_BELOW_NORMAL, MEMORY_CACHE_FILE
 )
 from .base import BaseWorker
+from .cache import JsonCache
+from .loudnorm import LoudnormMeasurement, split_filter_chain, build_linear_filter, measurement_key
+from .commands import (build_encode_cmd, build_hw_init_args, build_video_args, build_hw_decode_args, preset_for,
+                       encode_with_fallback, CPU_ENCODER_NAMES)
+from .vmaf import read_vmaf_score, read_vmaf_log
+from .repair import SegmentRepairer, find_weak_segments
+from .process import ProcessRegistry, Watchdog, available_cpus, split_cpu_sets, watchdog_timeout
+from .planner import plan_cpu_encodes, resolution_bucket, median_bucket, history_key, min_threads, estimate_seconds
+from .scheduler import EncodeSlot, SlotDispatcher, MixedPlacement
+from .ladder import parse_renditions, scale_filter, RenditionProgress
+from .cropdetect import CropDetector, crop_filter
+from .decimate import DecimateAnalyzer
+from .failure import CircuitBreaker, fallback_slot, slot_key
+from .fastlane import CrfCache, build_fast_slots
+from .deadline import DeadlinePlanner, parse_deadline
+from .ordering import order_tasks
+from .finalize import FinalizeQueue, pick_temp_dir, move_file, same_volume
+from .diskspace import DiskSpacePlanner, DiskSpaceGuard, final_destination, format_size
+from .staging import SourceStager
+from .scratch import ScratchManager, default_ram_dir
+from .integrity import IntegrityScanner
+from .governor import ResourceGovernor, GovernorProfile
+from .memory import MemoryAdmission, memory_key, PHASE_SEARCH, PHASE_ENCODE, PHASE_ENCODE_VMAF
+
+# _process_file 的返回值：最终编码崩溃，由失败策略决定重试、回退或放弃
+ENCODE_FAILED = "failed"
 
 # --- 工作线程 (负责耗时的转码任务) ---
 class EncoderWorker(BaseWorker):
@@ -33,7 +65,8 @@ class EncoderWorker(BaseWorker):
     progress_current_signal = Signal(int)
     file_progress_signal = Signal(str, int) # filepath, percent
     file_stats_signal = Signal(str, str, str) # filepath, speed, eta
-    file_status_signal = Signal(str, str)   # filepath, status (processing, success, error)
+    file_status_signal = Signal(str, str)   # filepath, status (processing, success, warning, error)
+    rendition_progress_signal = Signal(str, str, int) # filepath, rendition label, percent
     finished_signal = Signal()
     ask_error_decision = Signal(str, str)
     
@@ -41,24 +74,60 @@ class EncoderWorker(BaseWorker):
         super().__init__()
         self.config = config
         self.is_paused = False
-        self.current_proc = None
+        self.procs = ProcessRegistry()
+        self.dispatcher = None
+        self.stager = None
+        self.governor = None
+        self.governor_mode = config.get('governor_mode', GOVERNOR_OFF)
+        self.completed = 0 # 之前阶段已完成的任务数
+        self.later_tasks = [] # 之后阶段才处理的任务 (截止时间模式估算剩余工作量)
+        self.parallel = False
+        self._slot_ctx = threading.local()
+        self._decision_lock = threading.Lock()
+        self.finalizer = FinalizeQueue(self._on_finalize_progress, config.get('finalize_verify', True))
 
     def stop(self):
-        """ 强制停止当前正在运行的子进程（ffmpeg 或 ab-av1）。 """
-        if self.current_proc:
-            try:
-                # 使用 Popen 异步执行 taskkill，避免阻塞 UI 线程导致假死
-                subprocess.Popen(["taskkill", "/F", "/T", "/PID", str(self.current_proc.pid)], 
-                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
-                               creationflags=get_subprocess_flags())
-            except Exception:
-                pass
+        """ 强制停止所有槽位正在运行的子进程（ffmpeg、ab-av1 及后台测量/修复任务）。 """
+        if self.dispatcher:
+            self.dispatcher.stop()
+        self.procs.terminate_all()
+        self.finalizer.cancel()
+        if self.stager:
+            self.stager.cancel()
         super().stop()
 
+    def _log(self, msg, level):
+        """ 发送日志；并行编码时附加当前槽位前缀以区分来源。 """
+        self.log_signal.emit(getattr(self._slot_ctx, 'prefix', '') + msg, level)
+
     def set_paused(self, paused):
         """ 设置或取消暂停状态。 """
         self.is_paused = paused
 
+    def set_governor_mode(self, mode):
+        """ 运行中切换资源调控模式 (界面线程调用)，无需重启批次。 """
+        self.governor_mode = mode
+        if self.governor:
+            self.governor.set_mode(mode)
+
+    def _build_governor(self):
+        """ 按高级设置创建两套资源配置并启动资源调控 (模式为 off 时同样启动，便于运行中切换)。 """
+        profiles = {}
+        for name, priority, io, cpu, jobs in ((GOVERNOR_INTERACTIVE, PRIORITY_IDLE, PRIORITY_IDLE, 50, 1),
+                                              (GOVERNOR_OFFHOURS, PRIORITY_BELOW_NORMAL, PRIORITY_BELOW_NORMAL, 100, 0)):
+            profiles[name] = GovernorProfile(name, self.config.get(f'{name}_priority', priority), self.config.get(f'{name}_io', io),
+                                             self.config.get(f'{name}_cpu_percent', cpu), self.config.get(f'{name}_max_jobs', jobs))
+        self.governor = ResourceGovernor(self.governor_mode, profiles, self.config.get('interactive_hours', ''), self.procs)
+        self.governor.on_change = self._on_governor_change
+        self.procs.governor = self.governor.start()
+        self._on_governor_change(self.governor.profile(), initial=True)
+
+    def _on_governor_change(self, profile, initial=False):
+        if profile is not None:
+            self.log_signal.emit(tr("log.encoder.governor_profile", profile=profile.describe()), "info")
+        elif not initial:
+            self.log_signal.emit(tr("log.encoder.governor_off"), "info")
+
     def set_system_awake(self, keep_awake=True):
         """ 防止或允许系统在编码期间进入休眠状态。 """
         try:
@@ -74,6 +143,1134 @@ class EncoderWorker(BaseWorker):
         self.decision = decision
         self.waiting_decision = False
 
+    def _remove_quietly(self, path):
+        """ 删除临时文件，忽略不存在或被占用的情况。 """
+        if not path:
+            return
+        try:
+            lp_path = to_long_path(path)
+            if os.path.exists(lp_path): os.remove(lp_path)
+        except Exception:
+            pass
+
+    def _run_ffmpeg(self, cmd, filepath, duration_sec, startupinfo, cpus=None, renditions=None, timeout=0, memory=None):
+        """
+        运行 FFmpeg 并解析进度，返回 (返回码, 最近的非进度输出, 暂停耗时)。cpus 为绑定的处理器集合。
+        renditions 为附加规格输出，其进度从各自的 -stats_enc_post 文件中读取。
+        timeout 为看门狗超时：编码时间戳超过该秒数没有前进时结束进程树 (0 表示不启用)。
+        memory 为内存准入的登记，用于采样进程的实际内存占用。
+        """
+        paused_time = 0.0
+        trackers = [(r["label"], RenditionProgress(r["stats_path"], duration_sec)) for r in (renditions or [])]
+        last_poll = 0.0
+        # [Fix] 使用 text=True (universal_newlines) 让 Python 处理 \r 换行符，解决进度条不更新问题
+        # 同时指定 encoding='utf-8' errors='replace' 防止编码报错
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, 
+                              startupinfo=startupinfo, creationflags=get_subprocess_flags(),
+                              text=True, encoding='utf-8', errors='replace') as proc:
+            self.procs.add(proc, cpus)
+            if memory:
+                memory.track(proc.pid)
+            watchdog = Watchdog(proc, timeout, lambda: self.is_paused).start()
+            err_log = []
+            max_percent = 0
+            max_sec = -1.0
+            while True:
+                if not self.is_running:
+                    try: proc.kill()
+                    except: pass
+                    break
+                if self.is_paused:
+                    p_start = time.time()
+                    while self.is_paused:
+                        if not self.is_running: break
+                        time.sleep(0.1)
+                    paused_time += time.time() - p_start
+
+                line = proc.stdout.readline()
+                if not line and proc.poll() is not None: break
+                if line:
+                    d = line.strip() # 已经是字符串，无需 safe_decode
+                    
+                    # [Fix] 尝试从输出中补获时长 (防止元数据获取失败导致进度条不走)
+                    if duration_sec <= 0 and "Duration:" in d:
+                        dur_match = re.search(r"Duration:\s*(\d+:\d+:\d+(?:\.\d+)?)", d)
+                        if dur_match:
+                            duration_sec = time_str_to_seconds(dur_match.group(1))
+
+                    t_match = re.search(r"time=\s*(\d+:\d+:\d+(?:\.\d+)?)", d) if "time=" in d else None
+                    if t_match:
+                        # FFmpeg 在编码停滞时仍会定期输出状态行，只有时间戳前进才算作进展
+                        current_sec = time_str_to_seconds(t_match.group(1))
+                        if current_sec > max_sec:
+                            max_sec = current_sec
+                            watchdog.feed()
+                    elif "frame=" not in d:
+                        watchdog.feed()
+
+                    if t_match and duration_sec > 0:
+                        percent = min(100, int((current_sec / duration_sec) * 100))
+                        if percent > max_percent:
+                            max_percent = percent
+                            self.progress_current_signal.emit(percent)
+                            self.file_progress_signal.emit(filepath, percent)
+                        
+                        s_match = re.search(r"speed=\s*([\d.]+)x", d)
+                        if s_match:
+                            try:
+                                speed_val = float(s_match.group(1))
+                                if speed_val > 0:
+                                    remaining = (duration_sec - current_sec) / speed_val
+                                    m, s = divmod(int(remaining), 60)
+                                    h, m = divmod(m, 60)
+                                    eta = f"ETA: {h:02d}:{m:02d}:{s:02d}"
+                                    self.file_stats_signal.emit(filepath, f"{speed_val:.2f}x", eta)
+                            except Exception: pass
+
+                    if "frame=" not in d:
+                        err_log.append(d)
+                        if len(err_log) > 20: err_log.pop(0)
+
+                if trackers and time.time() - last_poll >= 1.0:
+                    last_poll = time.time()
+                    for label, tracker in trackers:
+                        tracker.duration_sec = duration_sec
+                        self.rendition_progress_signal.emit(filepath, label, tracker.poll())
+            watchdog.stop()
+            return_code = proc.returncode
+        if watchdog.fired:
+            self._log(tr("log.encoder.watchdog_killed", tool="FFmpeg", seconds=int(timeout)), "error")
+            err_log.append(f"watchdog: no progress for {int(timeout)}s")
+        self.procs.remove(proc)
+        return return_code, err_log, paused_time
+
+    def _repair_weak_segments(self, ffmpeg, ffprobe, src, temp_file, verify_log, enc_name, enc_preset, icq, target_vmaf, cpu_opts=None, device=None, vfilter=""):
+        """ 对已完成的编码逐片段评分，仅重新编码低于阈值的关键帧区间并拼接回原输出。 """
+        threshold = target_vmaf - float(self.config.get('repair_vmaf_margin', 2.0))
+        repair_icq = max(1, icq - max(1, int(self.config.get('repair_crf_step', 4))))
+        max_ratio = float(self.config.get('repair_max_ratio', 0.3))
+        work_dir = os.path.splitext(temp_file)[0] + ".repair"
+        repair_start_time = time.time()
+
+        repairer = self.procs.add(SegmentRepairer(ffmpeg, ffprobe, src, to_long_path(temp_file), work_dir, vfilter))
+        try:
+            os.makedirs(work_dir, exist_ok=True)
+            self._log(tr("log.encoder.repair_start", threshold=threshold), "info")
+            frame_times, keyframes = repairer.probe_frames()
+            # 开启同步验收时直接复用逐帧日志，否则单独评分
+            _, frame_scores = read_vmaf_log(verify_log) if verify_log and os.path.exists(verify_log) else (None, [])
+            if not frame_scores:
+                frame_scores = repairer.score_frames(max(1, int(self.config.get('repair_subsample', 3))))
+            if not self.is_running:
+                return
+            if not frame_times or not frame_scores:
+                self._log(tr("log.encoder.repair_no_data"), "warning")
+                return
+
+            segments = find_weak_segments(frame_times, keyframes, frame_scores, threshold, max_ratio)
+            if segments is None:
+                self._log(tr("log.encoder.repair_too_many", ratio=max_ratio * 100), "warning")
+                return
+            if not segments:
+                self._log(tr("log.encoder.repair_none"), "info")
+                return
+
+            weak_frames = sum(end - start for start, end, _ in segments)
+            self._log(tr("log.encoder.repair_found", count=len(segments), frames=weak_frames, total=len(frame_times), icq=repair_icq), "info")
+            for start, end, mean in segments:
+                self._log(f"    [{frame_times[start]:.2f}s - {frame_times[end - 1]:.2f}s] VMAF {mean:.2f}", "info")
+
+            if repairer.repair(frame_times, segments, build_hw_init_args(enc_name, device),
+                               build_video_args(enc_name, enc_preset, repair_icq, self.config.get('nv_aq', True), cpu_opts, device)):
+                self._log(tr("log.encoder.repair_done", count=len(segments), duration=time.time() - repair_start_time), "success")
+            elif self.is_running:
+                self._log(tr("log.encoder.repair_failed"), "warning")
+        except Exception as e:
+            self._log(tr("log.encoder.repair_failed_error", error=e), "warning")
+        finally:
+            repairer.cleanup()
+            self.procs.remove(repairer)
+
+    def _finalize_renditions(self, renditions, success):
+        """ 主输出完成后移动各规格输出到目标位置；失败或中止时清理临时文件。 """
+        for r in renditions:
+            self._remove_quietly(r.get("stats_path"))
+            if not r.get("output"):
+                continue
+            lp_out = to_long_path(r["output"])
+            if not success:
+                self._remove_quietly(r["output"])
+                continue
+            moved = False
+            if os.path.exists(lp_out) and os.path.getsize(lp_out) > 1024:
+                for _ in range(3):
+                    try:
+                        lp_dest = to_long_path(r["dest"])
+                        if os.path.exists(lp_dest): os.remove(lp_dest)
+                        move_file(lp_out, lp_dest, self.finalizer.verify)
+                        moved = True
+                        break
+                    except Exception:
+                        time.sleep(1)
+            if moved:
+                self._log(tr("log.encoder.rendition_done", label=r["label"], icq=r["icq"], dest=os.path.basename(r["dest"])), "success")
+            else:
+                self._log(tr("log.encoder.rendition_failed", label=r["label"]), "error")
+                self._remove_quietly(r["output"])
+
+    def _on_finalize_progress(self, filepath, percent):
+        self.file_progress_signal.emit(filepath, percent)
+
+    def _on_finalized(self, prefix, filepath, final_dest, save_mode, encode_duration, total_duration, final_status, ok, error, kept=None):
+        """
+        主输出移动到目标位置后的收尾 (可能在后台收尾线程中调用，因此显式传入槽位前缀)。
+        复制失败时 kept 为保留下来的编码输出路径。
+        """
+        if not ok:
+            self.log_signal.emit(prefix + tr("log.encoder.error_move", error=error), "error")
+            if kept:
+                self.log_signal.emit(prefix + tr("log.encoder.finalize_kept", path=kept), "warning")
+            self.file_status_signal.emit(filepath, "error")
+            return
+        if save_mode == SAVE_MODE_OVERWRITE:
+            # 覆盖模式下输出扩展名与源文件不同时 (如 .mp4 -> .mkv)，写入成功后删除源文件
+            abs_src = os.path.normcase(os.path.abspath(filepath))
+            if abs_src != os.path.normcase(os.path.abspath(final_dest)):
+                self._remove_quietly(filepath)
+            self.log_signal.emit(prefix + tr("log.encoder.success_overwrite", encode_duration=encode_duration, total_duration=total_duration), "success")
+        elif save_mode == SAVE_MODE_REMAIN:
+            self.log_signal.emit(prefix + tr("log.encoder.success_remain", encode_duration=encode_duration, total_duration=total_duration), "success")
+        else:
+            self.log_signal.emit(prefix + tr("log.encoder.success_save_as", encode_duration=encode_duration, total_duration=total_duration), "success")
+        self.file_stats_signal.emit(filepath, tr("log.encoder.status_done"), tr("log.encoder.status_duration", total_duration=total_duration))
+        self.file_status_signal.emit(filepath, final_status)
+
+    def _plan_slots(self, tasks, enc_name, enc_preset, cpu_opts, speed_history, mixed_preset):
+        """
+        规划编码槽位：硬件编码器每个设备一个槽位；CPU 编码器按 _plan_cpu_slots 规划并行实例。
+        开启混合池时，硬件槽位之外再用剩余核心增加 SVT-AV1 槽位。
+        """
+        if enc_name in CPU_ENCODER_NAMES:
+            return self._plan_cpu_slots(tasks, enc_name, enc_preset, cpu_opts, speed_history)
+
+        devices = self.config.get('devices') or []
+        if self.config.get('multi_gpu', True) and len(devices) > 1:
+            self.log_signal.emit(tr("log.encoder.multi_gpu", count=len(devices), mode=self.config.get('gpu_assignment', GPU_ASSIGN_LEAST_LOADED)), "info")
+            slots = [EncodeSlot(f"GPU{d}", enc_name, enc_preset, device=d) for d in devices]
+        else:
+            slots = [EncodeSlot("GPU", enc_name, enc_preset)]
+
+        if self.config.get('mixed_pool', False) and ENC_SVT in (self.config.get('available_encoders') or []):
+            # 每个 GPU 槽位预留处理器用于解码、封装与 ab-av1 探测
+            reserve = MIXED_POOL_RESERVED_CPUS * len(slots)
+            slots += self._plan_cpu_slots(tasks, "libsvtav1", mixed_preset, cpu_opts, speed_history, reserve)
+        return slots
+
+    def _plan_cpu_slots(self, tasks, enc_name, enc_preset, cpu_opts, speed_history, reserve=0):
+        """
+        根据核心数、批次分辨率与实测吞吐决定 CPU 并行实例数及每实例线程数，
+        并可选绑定到互不重叠的核心或 NUMA 节点。reserve 为预留给 GPU 槽位的处理器数。
+        """
+        metadata = self.config.get('metadata', {})
+        bucket = median_bucket([resolution_bucket((metadata.get(p) or {}).get('width'), (metadata.get(p) or {}).get('height')) for p in tasks])
+        cores = len(available_cpus()) - reserve
+        if reserve and cores < min_threads(bucket):
+            return []
+        plan = plan_cpu_encodes(enc_name, enc_preset, cores, bucket, len(tasks), speed_history,
+                                max(0, int(self.config.get('cpu_instances', 0))))
+        opts = plan.cpu_opts(enc_name)
+        # 手动指定的线程数优先于规划结果
+        if int(cpu_opts.get("threads") or 0) > 0:
+            opts["threads"] = int(cpu_opts["threads"])
+        if int(cpu_opts.get("lp") or 0) > 0:
+            opts["lp"] = int(cpu_opts["lp"])
+
+        pin_mode = self.config.get('cpu_pinning', CPU_PINNING_OFF)
+        cpu_sets = None
+        if (plan.instances > 1 or reserve) and pin_mode in (CPU_PINNING_CORES, CPU_PINNING_NUMA):
+            cpu_sets = split_cpu_sets(plan.instances, pin_mode, reserve)
+
+        self._log(tr("log.encoder.cpu_plan", instances=plan.instances, threads=opts["threads"], bucket=bucket, cores=cores), "info")
+        if cpu_sets:
+            self._log(tr("log.encoder.cpu_plan_pinned", mode=pin_mode), "info")
+        return [EncodeSlot(f"CPU{k + 1}", enc_name, enc_preset, dict(opts), cpu_sets[k] if cpu_sets else None)
+                for k in range(plan.instances)]
+
+    def _build_placement(self, slots, tasks, speed_history, start=0):
+        """ 混合池时按文件工作量 (帧数) 与各后端的实测吞吐放置任务。start 为任务序号的起始值。 """
+        if all(s.is_cpu for s in slots) or not any(s.is_cpu for s in slots):
+            return None
+        work = {idx: self._file_work(path) for idx, path in enumerate(tasks, start)}
+        self._log(tr("log.encoder.mixed_pool", gpu=sum(1 for s in slots if not s.is_cpu), cpu=sum(1 for s in slots if s.is_cpu)), "info")
+        return MixedPlacement(work, lambda slot, frames, bucket: estimate_seconds(slot, frames, bucket, speed_history))
+
+    def _file_work(self, path):
+        """ 按缓存的元数据估计文件的工作量，返回 (帧数, 分辨率档位)；时长未知时按默认值估算。 """
+        meta = self.config.get('metadata', {}).get(path) or {}
+        duration = meta.get('duration') or MIXED_POOL_DEFAULT_DURATION
+        return duration * (meta.get('frame_rate') or 24.0), resolution_bucket(meta.get('width'), meta.get('height'))
+
+    def _deadline_slot(self, ctx, slot, filepath):
+        """ 截止时间模式：按剩余工作量为本文件选择档位，返回使用该档位的槽位副本。 """
+        pending = [path for _, path in list(self.dispatcher.pending)] + self.later_tasks
+        work = [self._file_work(path) for path in [filepath] + pending]
+        p_val, finish, achievable = ctx['deadline'].choose(slot, work, len(self.dispatcher.slots))
+        finish_str = time.strftime("%m-%d %H:%M", time.localtime(finish))
+        if achievable:
+            self._log(tr("log.encoder.deadline_plan", preset=p_val, finish=finish_str, remaining=len(work)), "info")
+        else:
+            self._log(tr("log.encoder.deadline_unreachable", preset=p_val, finish=finish_str, remaining=len(work)), "warning")
+        return EncodeSlot(slot.name, slot.enc_name, preset_for(slot.enc_name, p_val), slot.cpu_opts, slot.cpus, slot.device, slot.fast_lane)
+
+    def _integrity_prescan(self, tasks, ffmpeg, cache_dir):
+        """
+        编码前以有限的并行度解码检查源文件，结果按文件指纹缓存。
+        损坏的文件按 integrity_action 仅标记 (仍然编码) 或跳过，返回需要编码的文件。
+        """
+        mode = self.config.get('integrity_scan', '')
+        if mode not in (INTEGRITY_SCAN_SAMPLE, INTEGRITY_SCAN_FULL):
+            return tasks
+        cache = JsonCache(os.path.join(cache_dir, INTEGRITY_CACHE_FILE) if cache_dir else "")
+        scanner = self.procs.add(IntegrityScanner(ffmpeg, mode, self.config.get('integrity_workers', 4), cache,
+                                                  self.config.get('metadata', {}), self.config.get('integrity_tolerance', 0)))
+        self.log_signal.emit(tr("log.encoder.integrity_start", count=len(tasks), mode=tr(f"log.encoder.integrity_mode_{mode}")), "info")
+        done = []
+        def on_result(path, result, cached):
+            done.append(path)
+            self.progress_current_signal.emit(int(len(done) * 100 / len(tasks)))
+        try:
+            results = scanner.scan(tasks, on_result)
+        finally:
+            self.procs.remove(scanner)
+        if not self.is_running:
+            return tasks
+
+        skip = self.config.get('integrity_action', INTEGRITY_ACTION_FLAG) == INTEGRITY_ACTION_SKIP
+        kept, bad = [], 0
+        for path in tasks:
+            result = results.get(path)
+            if result is None or scanner.is_ok(result):
+                kept.append(path)
+                continue
+            bad += 1
+            fname = os.path.basename(path)
+            error = result['errors'][0] if result['errors'] else ""
+            self.file_stats_signal.emit(path, tr("log.encoder.status_corrupt"), "")
+            if skip:
+                self.log_signal.emit(tr("log.encoder.integrity_skipped", fname=fname, count=result['count'], error=error), "error")
+                self.file_status_signal.emit(path, "error")
+            else:
+                self.log_signal.emit(tr("log.encoder.integrity_flagged", fname=fname, count=result['count'], error=error), "warning")
+                self.file_status_signal.emit(path, "warning")
+                kept.append(path)
+        self.log_signal.emit(tr("log.encoder.integrity_done", ok=len(tasks) - bad, bad=bad), "success" if not bad else "warning")
+        self.progress_current_signal.emit(0)
+        return kept
+
+    def _upcoming(self):
+        """ 尚未开始处理的文件 (预读暂存按此顺序复制)。 """
+        pending = [path for _, path in list(self.dispatcher.pending)] if self.dispatcher else []
+        return pending + self.later_tasks
+
+    def _split_fast_lane(self, tasks):
+        """ 按缓存的元数据将时长低于 fast_lane_duration 的文件分入快速通道，返回 (快速通道, 常规)。 """
+        limit = float(self.config.get('fast_lane_duration', 0) or 0)
+        if limit <= 0:
+            return [], tasks
+        metadata = self.config.get('metadata', {})
+        fast = [p for p in tasks if 0 < (metadata.get(p) or {}).get('duration', 0) < limit]
+        fast_set = set(fast)
+        return fast, [p for p in tasks if p not in fast_set]
+
+    def _record_speed(self, ctx, slot, width, height, frames, seconds):
+        """ 以指数平滑记录槽位的实测帧率 (CPU 按线程数区分，硬件编码以线程数 0 记录)。 """
+        threads = int(slot.cpu_opts.get("threads") or 0) if slot.is_cpu else 0
+        if (slot.is_cpu and threads <= 0) or frames <= 0 or seconds <= 0:
+            return
+        key = history_key(slot.enc_name, slot.enc_preset, resolution_bucket(width, height), threads)
+        fps = frames / seconds
+        previous = ctx['speed_history'].get(key)
+        ctx['speed_history'].set(key, round(previous * 0.7 + fps * 0.3 if previous else fps, 3))
+
+    def _run_slot_task(self, ctx, slot, i, filepath):
+        """ 槽位线程的入口：并行时为该线程的日志加上槽位前缀；资源调控限制任务数时先等待名额。 """
+        self._slot_ctx.prefix = f"[{slot.name}] " if self.parallel else ""
+        on_wait = lambda: self.file_stats_signal.emit(filepath, tr("log.encoder.status_waiting_governor"), "")
+        if self.governor and not self.governor.admit(lambda: self.is_running, on_wait):
+            return False
+        try:
+            return self._run_admitted(ctx, slot, i, filepath)
+        finally:
+            if self.governor:
+                self.governor.leave()
+
+    def _on_slot_error(self, slot, i, filepath, error):
+        """ 处理文件时出现意外异常：记录日志并将该文件标记为失败，槽位继续处理后续文件。 """
+        self._log(tr("log.encoder.slot_exception", filename=os.path.basename(filepath), error=f"{type(error).__name__}: {error}"), "error")
+        self.file_status_signal.emit(filepath, "error")
+
+    def _run_admitted(self, ctx, slot, i, filepath):
+        """ 占用资源调控名额后处理文件：磁盘空间不足时先等待空间释放，再领取预读暂存的副本。 """
+        needs = self._wait_for_space(ctx, filepath) if ctx['disk_guard'] else {}
+        if needs is None:
+            return False
+        self._slot_ctx.input_path = None
+        if self.stager:
+            staged = self.stager.acquire(filepath)
+            if staged != filepath:
+                self._slot_ctx.input_path = staged
+                self._log(tr("log.encoder.staging_used"), "info")
+        try:
+            return self._run_with_policy(ctx, slot, i, filepath)
+        finally:
+            if needs:
+                ctx['disk_guard'].release(needs)
+            if self.stager:
+                self.stager.release(filepath)
+
+    def _admit_memory(self, ctx, encoder, bucket, phase, threads=0, renditions=0):
+        """ 按内存上限等待并登记即将启动的子进程，返回 MemoryTicket；未启用内存准入或任务停止时返回 None。 """
+        admission = ctx['memory']
+        if not admission:
+            return None
+        key = memory_key(encoder, bucket, phase, threads, renditions)
+        estimate = admission.estimate(key, bucket, phase, encoder in CPU_ENCODER_NAMES, renditions)
+        def on_wait(used, need):
+            self._log(tr("log.encoder.memory_wait", need=format_size(need), used=format_size(used),
+                         ceiling=format_size(admission.ceiling)), "info")
+        return admission.admit(key, estimate, lambda: self.is_running, on_wait)
+
+    def _release_memory(self, ticket):
+        """ 释放内存准入的登记，并记录实测峰值用于修正之后的预估。 """
+        if not ticket:
+            return
+        peak = ticket.release()
+        if peak > 0:
+            self._log(tr("log.encoder.memory_usage", peak=format_size(peak), estimate=format_size(ticket.estimate)), "info")
+
+    def _wait_for_space(self, ctx, filepath):
+        """
+        登记本文件的磁盘空间需求；空间不足时暂停领取新文件，直到空间释放。任务停止时返回 None。
+        没有其他文件占用空间时即使预估不足也开始处理 (等待不会释放更多空间)。
+        """
+        paused = False
+        while self.is_running:
+            needs, shortage, admitted = ctx['disk_guard'].acquire(filepath)
+            if admitted:
+                if shortage is not None:
+                    directory, need, free = shortage
+                    self._log(tr("log.encoder.disk_space_forced", dir=directory, need=format_size(need), free=format_size(free)), "warning")
+                elif paused:
+                    self._log(tr("log.encoder.disk_space_resumed"), "info")
+                return needs
+            if not paused:
+                paused = True
+                directory, need, free = shortage
+                self._log(tr("log.encoder.disk_space_paused", dir=directory, need=format_size(need), free=format_size(free)), "warning")
+                self.file_stats_signal.emit(filepath, tr("log.encoder.status_waiting_space"), "")
+            for _ in range(int(DISK_MONITOR_INTERVAL * 10)):
+                if not self.is_running: break
+                time.sleep(0.1)
+        return None
+
+    def _run_with_policy(self, ctx, slot, i, filepath):
+        """
+        最终编码崩溃时按失败策略处理：先在原编码器上重试，再回退到 SVT-AV1，仍失败则记录到隔离列表；
+        多次失败的文件在之后的批次中直接跳过。仅在开启交互模式时弹出错误对话框。
+        """
+        fname = os.path.basename(filepath)
+        quarantine, breaker = ctx['quarantine'], ctx['breaker']
+        q_key = file_fingerprint(os.path.abspath(filepath))
+        record = (quarantine.get(q_key) or {}) if q_key else {}
+        if ctx['quarantine_after'] > 0 and record.get('failures', 0) >= ctx['quarantine_after']:
+            self._log(tr("log.encoder.quarantine_skip", fname=fname, failures=record['failures'], error=record.get('error', '')), "warning")
+            self.file_stats_signal.emit(filepath, tr("log.encoder.status_quarantined"), "")
+            self.file_status_signal.emit(filepath, "error")
+            return True
+
+        if ctx['deadline']:
+            slot = self._deadline_slot(ctx, slot, filepath)
+        current = slot
+        retries = 0
+        self._slot_ctx.last_error = ""
+        while self.is_running:
+            if breaker.is_open(current):
+                fallback = self._fallback_slot(ctx, current)
+                if not fallback:
+                    self._log(tr("log.encoder.circuit_no_fallback", encoder=slot_key(current)), "error")
+                    self.file_status_signal.emit(filepath, "error")
+                    return True
+                self._log(tr("log.encoder.circuit_open", encoder=slot_key(current), fallback=fallback.enc_name), "warning")
+                current = fallback
+
+            result = self._process_file(ctx, current, i, filepath)
+            if result != ENCODE_FAILED:
+                if result is True:
+                    breaker.record_success(current)
+                    if record:
+                        quarantine.pop(q_key)
+                return result
+
+            if breaker.record_failure(current):
+                self._log(tr("log.encoder.circuit_tripped", encoder=slot_key(current), count=breaker.threshold), "error")
+            if not self.is_running:
+                return False
+            if retries < ctx['failure_retries'] and not breaker.is_open(current):
+                retries += 1
+                self._log(tr("log.encoder.failure_retry", attempt=retries, retries=ctx['failure_retries']), "warning")
+                continue
+            fallback = self._fallback_slot(ctx, current)
+            if fallback:
+                self._log(tr("log.encoder.failure_fallback", encoder=current.enc_name, fallback=fallback.enc_name), "warning")
+                current, retries = fallback, 0
+                continue
+            break
+
+        if not self.is_running:
+            return False
+
+        # 所有尝试均失败：记录到隔离列表
+        failures = record.get('failures', 0) + 1
+        if q_key:
+            quarantine.set(q_key, {"failures": failures, "path": filepath, "error": self._slot_ctx.last_error})
+        if ctx['quarantine_after'] > 0 and failures >= ctx['quarantine_after']:
+            self._log(tr("log.encoder.quarantined", fname=fname, failures=failures), "error")
+
+        if ctx['interactive_errors']:
+            return self._ask_error_decision(fname) != 'stop'
+        return True
+
+    def _fallback_slot(self, ctx, slot):
+        """ 失败策略的回退槽位；未开启回退、SVT-AV1 不可用或已熔断时返回 None。 """
+        if not ctx['failure_fallback']:
+            return None
+        fallback = fallback_slot(slot, ctx['p_val'])
+        available = self.config.get('available_encoders') or []
+        if not fallback or (available and ENC_SVT not in available) or ctx['breaker'].is_open(fallback):
+            return None
+        return fallback
+
+    def _ask_error_decision(self, fname):
+        """ 弹出错误对话框并等待用户选择 (跳过或停止)。并行槽位同时出错时逐个询问。 """
+        with self._decision_lock:
+            self.waiting_decision = True
+            self.decision = None
+            self.ask_error_decision.emit(tr("dialog.encoder.crash_title"), tr("dialog.encoder.crash_content", fname=fname))
+            while self.waiting_decision and self.is_running:
+                time.sleep(0.1)
+            return self.decision
+
+    def _crf_search(self, ctx, slot, std_filepath, target_vmaf, vfilter="", ref_vfilter="", bucket="1080p"):
+        """
+        使用 ab-av1 按探测策略依次搜索满足目标 VMAF 的参数。
+        vfilter 为编码前的视频滤镜 (例如裁剪、缩放)，探测与最终编码需保持一致；
+        ref_vfilter 为计算 VMAF 前作用于参考帧的滤镜 (裁剪后参考帧也需裁剪)。
+        bucket 为源的分辨率档位，用于计算看门狗超时；超时的探测按失败处理并进入下一个策略。
+        返回 {"icq", "success", "strategy", "log", "duration", "paused"}。
+        """
+        enc_name, enc_preset, cpu_opts = slot.enc_name, slot.enc_preset, slot.cpu_opts
+        p_val, enc_pix_fmt, cache_dir, ab_av1 = ctx['p_val'], ctx['enc_pix_fmt'], ctx['cache_dir'], ctx['ab_av1']
+        search_strategies = []
+        if slot.is_cpu:
+            # CPU 编码器：直接以最终编码的编码器与预设探测，CRF 无需换算
+            search_strategies.append({"encoder": enc_name, "preset": enc_preset, "desc": "CPU 探测 (SVT-AV1)" if enc_name == "libsvtav1" else "CPU 探测 (AOM-AV1)"})
+            if enc_name == "libsvtav1":
+                search_strategies.append({"encoder": "libaom-av1", "preset": str(AOM_CPU_USED_MAP[p_val]), "desc": "CPU 探测 (AOM-AV1)"})
+            else:
+                search_strategies.append({"encoder": "libsvtav1", "preset": str(SVT_PRESET_MAP[p_val]), "desc": "CPU 探测 (SVT-AV1)"})
+        else:
+            if enc_name != "av1_amf":
+                search_strategies.append({"encoder": enc_name, "preset": enc_preset, "desc": "硬件探测"})
+            svt_preset = str(min(12, p_val + 5))
+            search_strategies.append({"encoder": "libsvtav1", "preset": svt_preset, "desc": "CPU 探测 (SVT-AV1)"})
+            search_strategies.append({"encoder": "libaom-av1", "preset": "6", "desc": "CPU 探测 (AOM-AV1)"})
+        
+        best_icq = 24
+        search_success = False
+        ab_av1_log = []
+        final_strategy = None
+        search_start_time = time.time()
+        search_paused_time = 0.0
+
+        for strategy in search_strategies:
+            if not self.is_running: break
+            s_enc, s_preset, s_desc = strategy["encoder"], strategy["preset"], strategy["desc"]
+            if strategy != search_strategies[0]:
+                 self._log(tr("log.encoder.ab_av1_fallback", desc=s_desc), "warning")
+            else:
+                 self._log(tr("log.encoder.ab_av1_start"), "info")
+
+            search_max_crf = "63" if s_enc in ["libsvtav1", "libaom-av1"] else "51"
+            cmd_search = [ab_av1, "crf-search", "-i", std_filepath, "--encoder", s_enc, "--pix-format", enc_pix_fmt, "--min-vmaf", str(target_vmaf), "--preset", s_preset, "--max-crf", search_max_crf]
+            # 样本写入本次探测独立的临时目录 (内存盘预算内优先)，结束后整体删除
+            scratch = ctx['scratch'].reserve(std_filepath) if ctx['scratch'] else None
+            if scratch:
+                cmd_search.extend(["--temp-dir", scratch.path])
+            elif cache_dir and os.path.isdir(cache_dir):
+                cmd_search.extend(["--temp-dir", cache_dir])
+            if vfilter:
+                cmd_search.extend(["--vfilter", vfilter])
+            if ref_vfilter:
+                cmd_search.extend(["--reference-vfilter", ref_vfilter])
+            
+            # CPU 槽位按计划限制探测编码的线程数
+            s_threads = int(cpu_opts.get("threads") or 0)
+            if s_enc == enc_name and s_threads > 0:
+                if s_enc == "libsvtav1":
+                    cmd_search.extend(["--svt", f"lp={s_threads}"])
+                else:
+                    cmd_search.extend(["--enc", f"threads={s_threads}"])
+            # 多显卡时 NVENC 探测也在槽位所属的显卡上进行
+            if s_enc == enc_name == "av1_nvenc" and slot.device is not None:
+                cmd_search.extend(["--enc", f"gpu={slot.device}"])
+
+            current_log = []
+            last_vmaf_log = None
+            attempt_success = False
+            proc = None
+            
+            timeout = watchdog_timeout(self.config.get('watchdog_timeout', 0), s_enc, bucket, search=True)
+            watchdog = None
+            # 内存不足以再启动一个探测时等待其他子进程结束
+            memory = self._admit_memory(ctx, s_enc, bucket, PHASE_SEARCH, s_threads if s_enc == enc_name else 0)
+            if not self.is_running:
+                self._release_memory(memory)
+                if scratch:
+                    scratch.release()
+                break
+            try:
+                with subprocess.Popen(cmd_search, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0, creationflags=get_subprocess_flags()) as proc:
+                    self.procs.add(proc, slot.cpus)
+                    if memory:
+                        memory.track(proc.pid)
+                    watchdog = Watchdog(proc, timeout, lambda: self.is_paused).start()
+                    while True:
+                        if not self.is_running:
+                            try: proc.kill()
+                            except: pass
+                            break
+                        if self.is_paused:
+                            p_start = time.time()
+                            while self.is_paused:
+                                if not self.is_running: break
+                                time.sleep(0.1)
+                            p_dt = time.time() - p_start
+                            search_paused_time += p_dt
+
+                        line = proc.stdout.readline()
+                        if not line and proc.poll() is not None: break
+                        if line:
+                            watchdog.feed()
+                            decoded = safe_decode(line)
+                            current_log.append(decoded)
+                            match = re.search(r"(?:crf|cq|qp)\s+(\d+)", decoded, re.IGNORECASE)
+                            vmaf_match = re.search(r"VMAF\s+([\d.]+)", decoded, re.IGNORECASE)
+                            if match and vmaf_match:
+                                vmaf_val = vmaf_match.group(1)
+                                if vmaf_val != last_vmaf_log:
+                                    self._log(tr("log.encoder.ab_av1_probing", probe_crf=match.group(0).upper(), vmaf_val=vmaf_val), "info")
+                                    last_vmaf_log = vmaf_val
+                                best_icq = int(match.group(1))
+                                attempt_success = True
+                    
+                    if proc.returncode != 0:
+                        if attempt_success and not watchdog.fired:
+                            # [Fix] 如果已经成功探测到 VMAF 数据，即使进程异常退出（如驱动不稳定），也优先使用已获取的参数，避免回退到慢速 CPU 探测
+                            self._log(f"⚠️ 探测术式异常中止 (Code {proc.returncode})，但已截获有效魔力参数 ({best_icq})，将强行采用。", "warning")
+                        else:
+                            if current_log:
+                                self._log(f"    -> 探测失败: {current_log[-1].strip()}", "error")
+                            attempt_success = False
+            except Exception as e:
+                self._log(f"⚠️ 探测执行异常: {e}", "warning")
+                attempt_success = False
+            finally:
+                if watchdog is not None:
+                    watchdog.stop()
+                if proc is not None:
+                    self.procs.remove(proc)
+                self._release_memory(memory)
+                if scratch:
+                    peak = scratch.release()
+                    self._log(tr("log.encoder.scratch_usage", size=f"{peak / 1024 ** 2:.0f} MB",
+                                 location=tr("log.encoder.scratch_ram" if scratch.on_ram else "log.encoder.scratch_disk")), "info")
+            if watchdog is not None and watchdog.fired:
+                self._log(tr("log.encoder.watchdog_killed", tool="ab-av1", seconds=int(timeout)), "error")
+                for log_line in current_log[-3:]:
+                    self._log(f"    {log_line.strip()}", "error")
+            
+            if attempt_success:
+                search_success = True
+                final_strategy = strategy
+                break
+            else:
+                ab_av1_log.extend(current_log)
+
+        return {"icq": best_icq, "success": search_success, "strategy": final_strategy, "log": ab_av1_log,
+                "duration": time.time() - search_start_time - search_paused_time, "paused": search_paused_time}
+
+    def _search_icq(self, ctx, slot, std_filepath, target_vmaf, vfilter="", ref_vfilter="", bucket="1080p", input_path=None):
+        """
+        获取最终编码参数，返回 (参数, 暂停耗时)；中途停止时参数为 None。
+        快速通道槽位优先使用缓存或预测的参数而不探测；探测成功的结果都会记录，供之后的快速通道使用。
+        input_path 为实际读取的文件 (预读暂存的本地副本)，缓存仍按原路径记录。
+        """
+        crf_cache = ctx['crf_cache']
+        fingerprint = file_fingerprint(std_filepath)
+        if slot.fast_lane:
+            icq, source = crf_cache.lookup(fingerprint, std_filepath, slot, target_vmaf, vfilter, bucket)
+            if icq is not None:
+                self._log(tr("log.encoder.fast_lane_crf", icq=icq, source=tr(f"log.encoder.fast_lane_source_{source}")), "success")
+                return icq, 0.0
+            self._log(tr("log.encoder.fast_lane_no_crf"), "info")
+
+        search = self._crf_search(ctx, slot, input_path or std_filepath, target_vmaf, vfilter, ref_vfilter, bucket)
+        if not self.is_running:
+            return None, search["paused"]
+        icq = self._resolve_icq(slot, search)
+        if search["success"]:
+            crf_cache.record(fingerprint, std_filepath, slot, target_vmaf, vfilter, bucket, icq)
+        return icq, search["paused"]
+
+    def _resolve_icq(self, slot, search):
+        """ 根据探测结果得出最终编码参数 (CPU 探测结果换算到硬件编码器时叠加偏移)，并记录日志。 """
+        enc_name = slot.enc_name
+        best_icq = search["icq"]
+        if search["success"]:
+            is_cpu_detect = (search['strategy']["encoder"] in ["libsvtav1", "libaom-av1"])
+            is_hw_target = (enc_name in ["av1_amf", "av1_nvenc", "av1_qsv"])
+            
+            if is_cpu_detect and is_hw_target:
+                offset = int(self.config.get('amf_offset', 0))
+                cpu_crf = best_icq
+                raw_icq = cpu_crf + offset
+                best_icq = max(1, min(51, raw_icq))
+
+                if best_icq != raw_icq:
+                    reason = "最小" if raw_icq < 1 else "最大"
+                    self._log(tr("log.encoder.ab_av1_success_offset_corrected", desc=search['strategy']['desc'], cpu_crf=cpu_crf, offset=offset, raw_icq=raw_icq, reason=reason, best_icq=best_icq, search_duration=search["duration"]), "warning")
+                else:
+                    self._log(tr("log.encoder.ab_av1_success_offset", desc=search['strategy']['desc'], cpu_crf=cpu_crf, offset=offset, best_icq=best_icq, search_duration=search["duration"]), "success")
+            else:
+                self._log(tr("log.encoder.ab_av1_success", best_icq=best_icq, search_duration=search["duration"]), "success")
+        else:
+            self._log(tr("log.encoder.ab_av1_failed", best_icq=best_icq), "error")
+            if search["log"]:
+                self._log(tr("log.encoder.ab_av1_error_log_header"), "error")
+                for log_line in search["log"][-5:]:
+                    self._log(f"    {log_line}", "error")
+
+        if best_icq > 51 and not slot.is_cpu:
+            self._log(tr("log.encoder.icq_corrected", icq=best_icq), "warning")
+            best_icq = 51
+
+        return best_icq
+
+    def _process_file(self, ctx, slot, i, filepath):
+        """ 在指定槽位上处理单个文件。返回 False 表示应停止整个批次。 """
+        total_tasks = ctx['total_tasks']
+        export_dir = ctx['export_dir']
+        cache_dir = ctx['cache_dir']
+        save_mode = ctx['save_mode']
+        target_vmaf = ctx['target_vmaf']
+        audio_bitrate = ctx['audio_bitrate']
+        loudnorm = ctx['loudnorm']
+        loudnorm_mode = ctx['loudnorm_mode']
+        loudnorm_two_pass = ctx['loudnorm_two_pass']
+        loudnorm_cache = ctx['loudnorm_cache']
+        verify_vmaf = ctx['verify_vmaf']
+        verify_subsample = ctx['verify_subsample']
+        verify_action = ctx['verify_action']
+        verify_crf_step = ctx['verify_crf_step']
+        verify_max_retries = ctx['verify_max_retries']
+        repair_segments = ctx['repair_segments']
+        ffmpeg, ffprobe = ctx['ffmpeg'], ctx['ffprobe']
+        startupinfo = ctx['startupinfo']
+        enc_name, enc_preset, cpu_opts = slot.enc_name, slot.enc_preset, slot.cpu_opts
+
+        if not self.is_running:
+            return False
+
+        task_start_time = time.time()
+        file_paused_time = 0.0
+
+        std_filepath = os.path.abspath(filepath)
+        # 探测与编码读取的文件：源文件已预读暂存时为本地副本，输出路径与缓存仍按原路径计算
+        input_path = getattr(self._slot_ctx, 'input_path', None) or std_filepath
+        fname = os.path.basename(filepath)
+        self._log(tr("log.encoder.task_start", i=i+1, total_tasks=total_tasks, fname=fname), "info")
+        self.file_status_signal.emit(filepath, "processing")
+        
+        self.progress_total_signal.emit(int(((self.completed + self.dispatcher.done) / total_tasks) * 100))
+        self.progress_current_signal.emit(0)
+
+        # --- 3.1 获取或补测媒体元数据 ---
+        meta = self.config.get('metadata', {}).get(filepath) or {}
+        codec = meta.get('codec', '')
+        duration_sec = meta.get('duration', 0.0)
+        source_audio_channels = meta.get('channels')
+        source_audio_streams = meta.get('audio_streams')
+        width, height = meta.get('width', 0), meta.get('height', 0)
+        frame_rate = meta.get('frame_rate', 0.0)
+        profile, pix_fmt = meta.get('profile', ''), meta.get('pix_fmt', '')
+
+        if not codec or duration_sec <= 0:
+            try:
+                cmd_probe = [ffprobe, "-v", "quiet", "-print_format", "json", "-show_format", "-show_streams", input_path]
+                raw_out = subprocess.check_output(cmd_probe, creationflags=get_subprocess_flags())
+                probe_data = json.loads(raw_out)
+                source_audio_streams = sum(1 for s in probe_data.get('streams', []) if s.get('codec_type') == 'audio')
+                for s in probe_data.get('streams', []):
+                    if s.get('codec_type') == 'video' and not codec:
+                        if s.get('codec_name', '').lower() not in ['mjpeg', 'png', 'bmp']:
+                            codec = s.get('codec_name', '').lower()
+                            width, height = int(s.get('width') or 0), int(s.get('height') or 0)
+                            frame_rate = parse_frame_rate(s.get('avg_frame_rate') or s.get('r_frame_rate'))
+                            profile, pix_fmt = s.get('profile', ''), s.get('pix_fmt', '')
+                    elif s.get('codec_type') == 'audio' and source_audio_channels is None:
+                        source_audio_channels = int(s.get('channels', 2))
+                if duration_sec <= 0:
+                    duration_sec = float(probe_data.get('format', {}).get('duration', 0))
+            except Exception:
+                pass
+        
+        # --- 3.2 如果已是AV1则跳过 ---
+        try:
+            if "av1" in codec:
+                self._log(tr("log.encoder.skip_av1"), "success")
+                total_duration = time.time() - task_start_time
+                self.file_stats_signal.emit(filepath, tr("log.encoder.status_skipped"), tr("log.encoder.status_duration", total_duration=total_duration))
+                self.file_status_signal.emit(filepath, "success")
+                return True
+        except Exception:
+            pass
+
+        # --- 3.3 响度测量 (loudnorm 第一遍，与 ab-av1 探测并行) ---
+        should_apply_loudnorm = (loudnorm_mode == LOUDNORM_MODE_ALWAYS) or (loudnorm_mode == LOUDNORM_MODE_AUTO and (source_audio_channels is None or source_audio_channels <= 2))
+        loudnorm_parts = split_filter_chain(loudnorm) if (should_apply_loudnorm and loudnorm_two_pass) else None
+        loudnorm_measured = None
+        loudnorm_key = None
+        loudnorm_job = None
+        if loudnorm_parts is not None:
+            if source_audio_streams == 1:
+                # 前置滤镜与目标参数都参与缓存键，修改后需重新测量
+                loudnorm_key = measurement_key(file_fingerprint(std_filepath), loudnorm)
+                loudnorm_measured = loudnorm_cache.get(loudnorm_key) if loudnorm_key else None
+                if loudnorm_measured:
+                    self._log(tr("log.encoder.loudnorm_cached", input_i=loudnorm_measured['input_i']), "info")
+                else:
+                    try:
+                        loudnorm_job = LoudnormMeasurement(ffmpeg, input_path, loudnorm)
+                        loudnorm_job.start()
+                        self.procs.add(loudnorm_job)
+                        self._log(tr("log.encoder.loudnorm_measure_start"), "info")
+                    except Exception:
+                        loudnorm_job = None
+            elif source_audio_streams:
+                self._log(tr("log.encoder.loudnorm_multi_stream", count=source_audio_streams), "info")
+
+        # 后续步骤出错时也要结束并注销测量进程，避免其脱离管理继续运行
+        try:
+            # --- 3.3.1 黑边检测 (多点并行采样，仅解码少量帧) ---
+            video_filter = ""
+            if self.config.get('crop_detect', False):
+                detector = self.procs.add(CropDetector(ffmpeg, input_path, duration_sec))
+                try:
+                    crop = detector.detect(width, height)
+                finally:
+                    self.procs.remove(detector)
+                if crop:
+                    video_filter = crop_filter(crop)
+                    self._log(tr("log.encoder.crop_detected", w=crop[0], h=crop[1], x=crop[2], y=crop[3], width=width, height=height, agree=crop[4], samples=len(detector.timestamps)), "info")
+                elif self.is_running:
+                    self._log(tr("log.encoder.crop_none"), "info")
+
+            # --- 3.3.2 重复帧分析 (动画的一拍二/一拍三与静止画面) ---
+            decimate_ratio = 0.0
+            if self.config.get('decimate', False) and self.is_running:
+                analyzer = self.procs.add(DecimateAnalyzer(ffmpeg, input_path, duration_sec, video_filter))
+                try:
+                    ratio = analyzer.analyze()
+                finally:
+                    self.procs.remove(analyzer)
+                total_frames = int(duration_sec * frame_rate)
+                if ratio is not None and ratio >= float(self.config.get('decimate_min_ratio', 0.15)):
+                    decimate_ratio = ratio
+                    video_filter = ",".join(f for f in (video_filter, DECIMATE_FILTER) if f)
+                    self._log(tr("log.encoder.decimate_enabled", ratio=ratio * 100, frames=int(total_frames * ratio), total=total_frames), "info")
+                elif ratio is not None:
+                    self._log(tr("log.encoder.decimate_skipped", ratio=ratio * 100), "info")
+
+            # --- 3.4 ab-av1 VMAF 探测 ---
+            bucket = resolution_bucket(width, height)
+            best_icq, p_dt = self._search_icq(ctx, slot, std_filepath, target_vmaf, video_filter, video_filter, bucket, input_path)
+            file_paused_time += p_dt
+
+            if loudnorm_job and self.is_running:
+                loudnorm_measured = loudnorm_job.result()
+                if loudnorm_measured:
+                    if loudnorm_key:
+                        loudnorm_cache.set(loudnorm_key, loudnorm_measured)
+                    self._log(tr("log.encoder.loudnorm_measured", **loudnorm_measured), "info")
+                else:
+                    self._log(tr("log.encoder.loudnorm_measure_failed"), "warning")
+        finally:
+            if loudnorm_job:
+                loudnorm_job.cancel()
+                self.procs.remove(loudnorm_job)
+
+        if not self.is_running: return False
+
+        # --- 3.4.1 多规格输出：逐个规格带缩放滤镜探测 ---
+        renditions = []
+        for r in parse_renditions(self.config.get('renditions', ''), target_vmaf):
+            if height and r["height"] >= height:
+                self._log(tr("log.encoder.rendition_skip", label=r["label"], height=height), "info")
+                continue
+            r["filter"] = scale_filter(r["height"])
+            self._log(tr("log.encoder.rendition_search", label=r["label"], vmaf=r["vmaf"]), "info")
+            r["icq"], p_dt = self._search_icq(ctx, slot, std_filepath, r["vmaf"], ",".join(f for f in (video_filter, r["filter"]) if f), video_filter,
+                                              resolution_bucket(r["height"] * 16 // 9, r["height"]), input_path)
+            file_paused_time += p_dt
+            if not self.is_running: return False
+            renditions.append(r)
+
+        # --- 3.5 FFmpeg 最终编码 ---
+        base_name = os.path.splitext(fname)[0]
+        final_dest = final_destination(std_filepath, save_mode, export_dir)
+        os.makedirs(os.path.dirname(final_dest), exist_ok=True)
+
+        # 临时输出尽量与目标位于同一磁盘，收尾时只需重命名，避免跨盘复制整个文件
+        temp_dir = cache_dir if cache_dir and os.path.isdir(cache_dir) else os.path.dirname(std_filepath)
+        if ctx['temp_on_destination'] and input_path == std_filepath:
+            # 源文件已暂存到本地时，输出也先写在本地缓存，之后由后台收尾队列写回
+            temp_dir = pick_temp_dir(final_dest, temp_dir)
+        temp_file = os.path.join(temp_dir, f"{base_name}_{int(time.time())}_{i}.temp.mkv")
+        if not same_volume(temp_dir, os.path.dirname(os.path.abspath(final_dest))):
+            self._log(tr("log.encoder.temp_cross_volume", dir=temp_dir), "warning")
+
+        temp_base = temp_file[:-len(".temp.mkv")]
+        for r in renditions:
+            r["output"] = temp_base + r["suffix"] + ".temp.mkv"
+            r["stats_path"] = temp_base + r["suffix"] + ".stats.txt"
+            r["dest"] = os.path.join(os.path.dirname(final_dest), base_name + r["suffix"] + ".mkv")
+
+        sub_codec = "copy"
+        if fname.lower().endswith(('.mp4', '.mov', '.m4v')):
+            sub_codec = SUBTITLE_CODEC_SRT
+
+        audio_args = ["-c:a", AUDIO_CODEC, "-b:a", audio_bitrate, "-ar", SAMPLE_RATE]
+        if source_audio_channels:
+            audio_args.extend(["-ac", str(source_audio_channels)])
+            if source_audio_channels > 2:
+                self._log(tr("log.encoder.info_multichannel", channels=source_audio_channels), "success")
+        
+        if should_apply_loudnorm and loudnorm:
+            audio_args.extend(["-af", build_linear_filter(loudnorm, loudnorm_measured)])
+            self._log(tr("log.encoder.info_loudnorm_enabled", mode=loudnorm_mode), "info")
+        else:
+            self._log(tr("log.encoder.info_loudnorm_skipped", mode=loudnorm_mode), "info")
+
+        # 开启验收时，VMAF 日志与临时文件放在一起，供后续阶段读取
+        verify_log = os.path.join(cache_dir if cache_dir and os.path.isdir(cache_dir) else temp_dir,
+                                  os.path.basename(temp_base) + ".vmaf.json") if verify_vmaf else ""
+        verify_score = None
+        verify_flagged = False
+        verify_retries = 0
+        encode_icq = best_icq
+        return_code = None
+        err_log = []
+
+        # 硬件解码：源编码/profile 不受支持时直接使用软件解码
+        hw_decode = None
+        if ctx['hw_decode'] and not slot.is_cpu and renditions:
+            # 多规格输出需在内存中 split/缩放，不使用硬件解码
+            self._log(tr("log.encoder.rendition_hw_decode_disabled"), "info")
+        elif ctx['hw_decode'] and not slot.is_cpu and video_filter:
+            # 裁剪等软件滤镜需在内存中处理，不使用硬件解码
+            self._log(tr("log.encoder.filter_hw_decode_disabled", filter=video_filter), "info")
+        elif ctx['hw_decode'] and not slot.is_cpu:
+            hw_decode = build_hw_decode_args(enc_name, codec, profile, pix_fmt, slot.device)
+            if hw_decode:
+                self._log(tr("log.encoder.hw_decode_enabled", hwaccel=hw_decode["input"][1]), "info")
+            else:
+                self._log(tr("log.encoder.hw_decode_unsupported", codec=codec or "?", profile=profile or "?", pix_fmt=pix_fmt or "?"), "info")
+
+        encode_start_time = time.time()
+        encode_paused_time = 0.0
+
+        def build(hw):
+            return build_encode_cmd(
+                ffmpeg, input_path, temp_file, enc_name, enc_preset, encode_icq, audio_args, sub_codec,
+                nv_aq=self.config.get('nv_aq', True),
+                verify_log=verify_log if verify_vmaf else None, verify_subsample=verify_subsample,
+                cpu_opts=cpu_opts, device=slot.device, hw_decode=hw, renditions=renditions, video_filter=video_filter,
+                vfr=decimate_ratio > 0
+            )
+
+        def run(cmd):
+            nonlocal encode_paused_time, file_paused_time
+            memory = self._admit_memory(ctx, enc_name, bucket, PHASE_ENCODE_VMAF if verify_vmaf else PHASE_ENCODE,
+                                        int(cpu_opts.get("threads") or 0) if slot.is_cpu else 0, len(renditions or []))
+            if not self.is_running:
+                # 等待内存期间任务已停止，不再启动 FFmpeg
+                self._release_memory(memory)
+                return -1, [], 0.0
+            try:
+                result = self._run_ffmpeg(cmd, filepath, duration_sec, startupinfo, slot.cpus, renditions,
+                                          watchdog_timeout(self.config.get('watchdog_timeout', 0), enc_name, bucket), memory)
+            finally:
+                self._release_memory(memory)
+            encode_paused_time += result[2]
+            file_paused_time += result[2]
+            return result
+
+        def on_fallback():
+            if not self.is_running:
+                return False
+            # 硬件解码失败 (驱动不支持该流等)：回退到软件解码重新编码
+            self._log(tr("log.encoder.hw_decode_fallback"), "warning")
+            self._remove_quietly(temp_file)
+            return True
+
+        try:
+            while True:
+                (return_code, err_log, _), hw_decode = encode_with_fallback(build, run, hw_decode, on_fallback)
+                if not self.is_running or not verify_vmaf:
+                    break
+
+                if return_code != 0:
+                    # FFmpeg 过旧 (无 loopback 解码器) 或未编译 libvmaf：本批次关闭验收后重试
+                    if any("Unrecognized option 'dec'" in l or "No such filter: 'libvmaf'" in l for l in err_log):
+                        self._log(tr("log.encoder.verify_unsupported"), "warning")
+                        verify_vmaf = False
+                        ctx['verify_vmaf'] = False
+                        continue
+                    break
+
+                verify_score = read_vmaf_score(verify_log, err_log)
+                if verify_score is None:
+                    self._log(tr("log.encoder.verify_no_score"), "warning")
+                    break
+                if verify_score >= target_vmaf:
+                    self._log(tr("log.encoder.verify_passed", score=verify_score, target=target_vmaf, icq=encode_icq), "success")
+                    break
+
+                if verify_action == VERIFY_ACTION_REQUEUE and verify_retries < verify_max_retries and encode_icq > 1:
+                    verify_retries += 1
+                    next_icq = max(1, encode_icq - verify_crf_step)
+                    self._log(tr("log.encoder.verify_requeue", score=verify_score, target=target_vmaf, icq=encode_icq, next_icq=next_icq), "warning")
+                    encode_icq = next_icq
+                    self._remove_quietly(temp_file)
+                    continue
+
+                verify_flagged = True
+                self._log(tr("log.encoder.verify_flagged", score=verify_score, target=target_vmaf, icq=encode_icq), "warning")
+                break
+        except Exception as e:
+            self._log(tr("log.encoder.ffmpeg_exception", error=e), "error")
+            self.file_status_signal.emit(filepath, "error")
+            self._remove_quietly(verify_log)
+            self._finalize_renditions(renditions, False)
+            return True
+        finally:
+            encode_duration = time.time() - encode_start_time - encode_paused_time
+        final_status = "warning" if verify_flagged else "success"
+
+        # 记录槽位的实测吞吐，供并行规划与混合池放置使用
+        if return_code == 0 and verify_retries == 0 and not slot.fast_lane:
+            self._record_speed(ctx, slot, width, height, duration_sec * frame_rate * (1.0 - decimate_ratio), encode_duration)
+
+        if not self.is_running:
+            self._remove_quietly(temp_file)
+            self._remove_quietly(verify_log)
+            self._finalize_renditions(renditions, False)
+            return False
+
+        # --- 3.6 弱片段修复 (仅重编码低分片段) ---
+        if repair_segments and decimate_ratio > 0:
+            # 按帧数截取的片段重编码无法复现 mpdecimate 的丢帧决策
+            self._log(tr("log.encoder.repair_decimate_skipped"), "info")
+        elif repair_segments and return_code == 0 and os.path.exists(to_long_path(temp_file)):
+            repair_start_time = time.time()
+            self._repair_weak_segments(ffmpeg, ffprobe, input_path, temp_file, verify_log,
+                                       enc_name, enc_preset, encode_icq, target_vmaf, cpu_opts, slot.device, video_filter)
+            encode_duration += time.time() - repair_start_time
+            if not self.is_running:
+                self._remove_quietly(temp_file)
+                self._remove_quietly(verify_log)
+                self._finalize_renditions(renditions, False)
+                return False
+
+        lp_temp = to_long_path(temp_file)
+        if return_code == 0 and os.path.exists(lp_temp) and os.path.getsize(lp_temp) > 1024:
+            try:
+                lp_dest = to_long_path(final_dest)
+                abs_src = os.path.normcase(os.path.abspath(filepath))
+                abs_dest = os.path.normcase(os.path.abspath(final_dest))
+                lp_src = to_long_path(filepath)
+                
+                total_duration = time.time() - task_start_time - file_paused_time
+
+                done = partial(self._on_finalized, getattr(self._slot_ctx, 'prefix', ''), filepath, final_dest,
+                               save_mode, encode_duration, total_duration, final_status)
+                if not same_volume(lp_temp, os.path.dirname(lp_dest)):
+                    # 跨盘复制交给后台收尾队列 (写入 .partial 后原子替换目标)，槽位立即开始下一个文件
+                    self._log(tr("log.encoder.finalize_queued", dest=os.path.dirname(final_dest)), "info")
+                    self.file_stats_signal.emit(filepath, tr("log.encoder.status_copying"), "")
+                    self.finalizer.submit(lp_temp, lp_dest, filepath, done)
+                elif save_mode == SAVE_MODE_OVERWRITE:
+                    success = False
+                    for _ in range(3):
+                        try:
+                            if abs_src == abs_dest:
+                                bak_path = lp_src + ".bak"
+                                # [Fix] 增强重试逻辑：仅当源文件存在时才执行重命名（防止重试时因源文件已更名而报错）
+                                if os.path.exists(lp_src):
+                                    if os.path.exists(bak_path): os.remove(bak_path)
+                                    os.replace(lp_src, bak_path)
+                                
+                                move_file(lp_temp, lp_dest, self.finalizer.verify)
+                                if os.path.exists(bak_path): os.remove(bak_path)
+                            else:
+                                move_file(lp_temp, lp_dest, self.finalizer.verify)
+                                if os.path.exists(lp_src): os.remove(lp_src)
+                            success = True
+                            break
+                        except Exception:
+                            time.sleep(1)
+                    
+                    if not success:
+                        raise Exception(tr("log.encoder.error_move_overwrite"))
+                    done(True, None)
+                else:
+                    os.replace(lp_temp, lp_dest)
+                    done(True, None)
+            except Exception as e:
+                self._log(tr("log.encoder.error_move", error=e), "error")
+                self.file_status_signal.emit(filepath, "error")
+        else:
+            self._log(tr("log.encoder.ffmpeg_crash"), "error")
+            self.file_status_signal.emit(filepath, "error")
+            for err_line in err_log:
+                self._log(f"   {err_line}", "error")
+            lp_temp = to_long_path(temp_file)
+            if os.path.exists(lp_temp): os.remove(lp_temp)
+            self._finalize_renditions(renditions, False)
+            self._remove_quietly(verify_log)
+            # 交给失败策略决定重试、回退或放弃
+            self._slot_ctx.last_error = err_log[-1] if err_log else ""
+            return ENCODE_FAILED if self.is_running else False
+
+        self._remove_quietly(verify_log)
+        if return_code == 0:
+            self._finalize_renditions(renditions, True)
+        # CPU 编码与快速通道无需等待 GPU 降温
+        if self.is_running and not slot.is_cpu and not slot.fast_lane:
+            self._log(tr("log.encoder.cooling_down"), "info")
+            time.sleep(GPU_COOLING_TIME)
+        return True
+
     def run(self):
         """ 线程的主执行体，包含完整的编码流程。 """
         # --- 1. 解包配置 ---
@@ -91,17 +1288,26 @@ class EncoderWorker(BaseWorker):
         audio_bitrate = self.config['audio_bitrate']
         loudnorm = self.config['loudnorm']
         loudnorm_mode = self.config.get('loudnorm_mode', LOUDNORM_MODE_AUTO)
+        loudnorm_two_pass = self.config.get('loudnorm_two_pass', True)
+        loudnorm_cache = JsonCache(os.path.join(cache_dir, LOUDNORM_CACHE_FILE) if cache_dir else "")
+        verify_vmaf = self.config.get('verify_vmaf', False)
+        verify_subsample = max(1, int(self.config.get('verify_subsample', 1)))
+        verify_action = self.config.get('verify_action', '')
+        verify_crf_step = max(1, int(self.config.get('verify_crf_step', 2)))
+        verify_max_retries = max(0, int(self.config.get('verify_max_retries', 0)))
+        repair_segments = self.config.get('repair_segments', False)
+        cpu_opts = {"threads": self.config.get('cpu_threads', 0), "lp": self.config.get('svt_lp', 0)}
 
         ffmpeg = tool_path("ffmpeg.exe")
         ffprobe = tool_path("ffprobe.exe")
         ab_av1 = tool_path("ab-av1.exe")
         
         os.environ["PATH"] += os.pathsep + os.path.dirname(ffmpeg)
-        startupinfo = subprocess.STARTUPINFO()
-        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        startupinfo = get_startupinfo()
 
         try:
             self.set_system_awake(True)
+            self._build_governor()
             tasks = []
             
             for p in selected_files:
@@ -116,6 +1322,21 @@ class EncoderWorker(BaseWorker):
 
             self.log_signal.emit(tr("log.encoder.tasks_found", total_tasks=total_tasks), "info")
 
+            queue_order = self.config.get('queue_order', QUEUE_ORDER_ADDED)
+            if queue_order != QUEUE_ORDER_ADDED:
+                tasks = order_tasks(tasks, queue_order, self.config.get('metadata', {}))
+                self.log_signal.emit(tr("log.encoder.queue_order", mode=tr(f"home.action_card.queue_order.{queue_order}")), "info")
+
+            # 源文件完整性预检 (在花费探测与编码时间之前发现损坏的文件)
+            tasks = self._integrity_prescan(tasks, ffmpeg, cache_dir)
+            if not self.is_running:
+                self.log_signal.emit(tr("log.encoder.stopped"), "error")
+                return
+            if not tasks:
+                self.log_signal.emit(tr("log.encoder.integrity_none_left"), "error")
+                return
+            total_tasks = len(tasks)
+
             # --- 2. 预计算通用编码器参数 ---
             try:
                 p_val = int(preset)
@@ -125,405 +1346,110 @@ class EncoderWorker(BaseWorker):
 
             enc_pix_fmt = PIX_FMT_AB_AV1
 
-            if ENC_NVENC in encoder_type:
+            if ENC_SVT in encoder_type:
+                enc_name = "libsvtav1"
+            elif ENC_AOM in encoder_type:
+                enc_name = "libaom-av1"
+            elif ENC_NVENC in encoder_type:
                 enc_name = "av1_nvenc"
-                nv_p = 8 - p_val
-                enc_preset = f"p{nv_p}"
             elif ENC_AMF in encoder_type:
                 enc_name = "av1_amf"
-                if p_val <= 2: enc_preset = "quality"
-                elif p_val <= 5: enc_preset = "balanced" 
-                else: enc_preset = "speed"
             else:
                 enc_name = "av1_qsv"
-                enc_preset = str(p_val)
+            enc_preset = preset_for(enc_name, p_val)
 
-            # --- 3. 循环处理每个文件 ---
-            for i, filepath in enumerate(tasks):
-                if not self.is_running:
-                    break
-
-                task_start_time = time.time()
-                file_paused_time = 0.0
+            # --- 3. 规划编码槽位 ---
+            speed_history = JsonCache(os.path.join(cache_dir, CPU_SPEED_CACHE_FILE) if cache_dir else "")
+            slots = self._plan_slots(tasks, enc_name, enc_preset, cpu_opts, speed_history, str(SVT_PRESET_MAP[p_val]))
+            self.parallel = len(slots) > 1
 
-                std_filepath = os.path.abspath(filepath)
-                fname = os.path.basename(filepath)
-                self.log_signal.emit(tr("log.encoder.task_start", i=i+1, total_tasks=total_tasks, fname=fname), "info")
-                self.file_status_signal.emit(filepath, "processing")
-                
-                self.progress_total_signal.emit(int((i / total_tasks) * 100))
-                self.progress_current_signal.emit(0)
+            ctx = {
+                'total_tasks': total_tasks, 'export_dir': export_dir, 'cache_dir': cache_dir, 'save_mode': save_mode,
+                'p_val': p_val, 'enc_pix_fmt': enc_pix_fmt, 'target_vmaf': target_vmaf, 'audio_bitrate': audio_bitrate,
+                'loudnorm': loudnorm, 'loudnorm_mode': loudnorm_mode, 'loudnorm_two_pass': loudnorm_two_pass,
+                'loudnorm_cache': loudnorm_cache, 'verify_vmaf': verify_vmaf, 'verify_subsample': verify_subsample,
+                'verify_action': verify_action, 'verify_crf_step': verify_crf_step, 'verify_max_retries': verify_max_retries,
+                'repair_segments': repair_segments, 'ffmpeg': ffmpeg, 'ffprobe': ffprobe, 'ab_av1': ab_av1,
+                'startupinfo': startupinfo, 'speed_history': speed_history,
+                'hw_decode': self.config.get('hw_decode', False),
+                'quarantine': JsonCache(os.path.join(cache_dir, QUARANTINE_CACHE_FILE) if cache_dir else ""),
+                'breaker': CircuitBreaker(self.config.get('circuit_breaker', 3)),
+                'failure_retries': max(0, int(self.config.get('failure_retries', 1))),
+                'failure_fallback': self.config.get('failure_fallback', True),
+                'quarantine_after': max(0, int(self.config.get('quarantine_after', 2))),
+                'interactive_errors': self.config.get('interactive_errors', False),
+                'crf_cache': CrfCache(JsonCache(os.path.join(cache_dir, CRF_CACHE_FILE) if cache_dir else "")),
+                'deadline': None,
+                'temp_on_destination': self.config.get('temp_on_destination', True),
+                'disk_guard': None,
+                'scratch': None,
+                'memory': None,
+            }
 
-                # --- 3.1 获取或补测媒体元数据 ---
-                meta = self.config.get('metadata', {}).get(filepath) or {}
-                codec = meta.get('codec', '')
-                duration_sec = meta.get('duration', 0.0)
-                source_audio_channels = meta.get('channels')
-
-                if not codec or duration_sec <= 0:
-                    try:
-                        cmd_probe = [ffprobe, "-v", "quiet", "-print_format", "json", "-show_format", "-show_streams", std_filepath]
-                        raw_out = subprocess.check_output(cmd_probe, creationflags=get_subprocess_flags())
-                        probe_data = json.loads(raw_out)
-                        for s in probe_data.get('streams', []):
-                            if s.get('codec_type') == 'video' and not codec:
-                                if s.get('codec_name', '').lower() not in ['mjpeg', 'png', 'bmp']:
-                                    codec = s.get('codec_name', '').lower()
-                            elif s.get('codec_type') == 'audio' and source_audio_channels is None:
-                                source_audio_channels = int(s.get('channels', 2))
-                        if duration_sec <= 0:
-                            duration_sec = float(probe_data.get('format', {}).get('duration', 0))
-                    except Exception:
-                        pass
-                
-                # --- 3.2 如果已是AV1则跳过 ---
-                try:
-                    if "av1" in codec:
-                        self.log_signal.emit(tr("log.encoder.skip_av1"), "success")
-                        total_duration = time.time() - task_start_time
-                        self.file_stats_signal.emit(filepath, tr("log.encoder.status_skipped"), tr("log.encoder.status_duration", total_duration=total_duration))
-                        self.file_status_signal.emit(filepath, "success")
-                        continue
-                except Exception:
-                    pass
-
-                # --- 3.3 ab-av1 VMAF 探测 ---
-                search_strategies = []
-                if enc_name != "av1_amf":
-                    search_strategies.append({"encoder": enc_name, "preset": enc_preset, "desc": "硬件探测"})
-                svt_preset = str(min(12, p_val + 5))
-                search_strategies.append({"encoder": "libsvtav1", "preset": svt_preset, "desc": "CPU 探测 (SVT-AV1)"})
-                search_strategies.append({"encoder": "libaom-av1", "preset": "6", "desc": "CPU 探测 (AOM-AV1)"})
-                
-                best_icq = 24
-                search_success = False
-                ab_av1_log = []
-                final_strategy = None
-                search_start_time = time.time()
-                search_paused_time = 0.0
-
-                for strategy in search_strategies:
-                    if not self.is_running: break
-                    s_enc, s_preset, s_desc = strategy["encoder"], strategy["preset"], strategy["desc"]
-                    if strategy != search_strategies[0]:
-                         self.log_signal.emit(tr("log.encoder.ab_av1_fallback", desc=s_desc), "warning")
-                    else:
-                         self.log_signal.emit(tr("log.encoder.ab_av1_start"), "info")
-
-                    search_max_crf = "63" if s_enc in ["libsvtav1", "libaom-av1"] else "51"
-                    cmd_search = [ab_av1, "crf-search", "-i", std_filepath, "--encoder", s_enc, "--pix-format", enc_pix_fmt, "--min-vmaf", str(target_vmaf), "--preset", s_preset, "--max-crf", search_max_crf]
-                    if cache_dir and os.path.isdir(cache_dir):
-                        cmd_search.extend(["--temp-dir", cache_dir])
-                    
-                    current_log = []
-                    last_vmaf_log = None
-                    attempt_success = False
-                    
-                    try:
-                        with subprocess.Popen(cmd_search, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0, creationflags=get_subprocess_flags()) as proc:
-                            self.current_proc = proc
-                            while True:
-                                if not self.is_running:
-                                    try: proc.kill()
-                                    except: pass
-                                    break
-                                if self.is_paused:
-                                    p_start = time.time()
-                                    while self.is_paused:
-                                        if not self.is_running: break
-                                        time.sleep(0.1)
-                                    p_dt = time.time() - p_start
-                                    search_paused_time += p_dt
-                                    file_paused_time += p_dt
-
-                                line = proc.stdout.readline()
-                                if not line and proc.poll() is not None: break
-                                if line:
-                                    decoded = safe_decode(line)
-                                    current_log.append(decoded)
-                                    match = re.search(r"(?:crf|cq|qp)\s+(\d+)", decoded, re.IGNORECASE)
-                                    vmaf_match = re.search(r"VMAF\s+([\d.]+)", decoded, re.IGNORECASE)
-                                    if match and vmaf_match:
-                                        vmaf_val = vmaf_match.group(1)
-                                        if vmaf_val != last_vmaf_log:
-                                            self.log_signal.emit(tr("log.encoder.ab_av1_probing", probe_crf=match.group(0).upper(), vmaf_val=vmaf_val), "info")
-                                            last_vmaf_log = vmaf_val
-                                        best_icq = int(match.group(1))
-                                        attempt_success = True
-                            
-                            if proc.returncode != 0:
-                                if attempt_success:
-                                    # [Fix] 如果已经成功探测到 VMAF 数据，即使进程异常退出（如驱动不稳定），也优先使用已获取的参数，避免回退到慢速 CPU 探测
-                                    self.log_signal.emit(f"⚠️ 探测术式异常中止 (Code {proc.returncode})，但已截获有效魔力参数 ({best_icq})，将强行采用。", "warning")
-                                else:
-                                    if current_log:
-                                        self.log_signal.emit(f"    -> 探测失败: {current_log[-1].strip()}", "error")
-                                    attempt_success = False
-                    except Exception as e:
-                        self.log_signal.emit(f"⚠️ 探测执行异常: {e}", "warning")
-                        attempt_success = False
-                    finally:
-                        self.current_proc = None
-                    
-                    if attempt_success:
-                        search_success = True
-                        final_strategy = strategy
-                        break
-                    else:
-                        ab_av1_log.extend(current_log)
-
-                search_duration = time.time() - search_start_time - search_paused_time
-                if not self.is_running: break
+            # 内存准入：预估放不下时推迟启动新的探测 / 编码子进程
+            memory_ceiling = float(self.config.get('memory_ceiling_gb', 0.0))
+            if memory_ceiling > 0:
+                ctx['memory'] = MemoryAdmission(memory_ceiling * 1024 ** 3,
+                                                JsonCache(os.path.join(cache_dir, MEMORY_CACHE_FILE) if cache_dir else ""))
+                self.log_signal.emit(tr("log.encoder.memory_ceiling", ceiling=f"{memory_ceiling:.1f} GB"), "info")
 
-                if search_success:
-                    is_cpu_detect = (final_strategy["encoder"] in ["libsvtav1", "libaom-av1"])
-                    is_hw_target = (enc_name in ["av1_amf", "av1_nvenc", "av1_qsv"])
-                    
-                    if is_cpu_detect and is_hw_target:
-                        offset = int(self.config.get('amf_offset', 0))
-                        cpu_crf = best_icq
-                        raw_icq = cpu_crf + offset
-                        best_icq = max(1, min(51, raw_icq))
-
-                        if best_icq != raw_icq:
-                            reason = "最小" if raw_icq < 1 else "最大"
-                            self.log_signal.emit(tr("log.encoder.ab_av1_success_offset_corrected", desc=final_strategy['desc'], cpu_crf=cpu_crf, offset=offset, raw_icq=raw_icq, reason=reason, best_icq=best_icq, search_duration=search_duration), "warning")
-                        else:
-                            self.log_signal.emit(tr("log.encoder.ab_av1_success_offset", desc=final_strategy['desc'], cpu_crf=cpu_crf, offset=offset, best_icq=best_icq, search_duration=search_duration), "success")
-                    else:
-                        self.log_signal.emit(tr("log.encoder.ab_av1_success", best_icq=best_icq, search_duration=search_duration), "success")
+            if self.config.get('ram_scratch', False):
+                ram_dir = self.config.get('ram_scratch_dir', '') or default_ram_dir()
+                if ram_dir and os.path.isdir(ram_dir):
+                    budget = float(self.config.get('ram_scratch_budget_mb', 4096))
+                    ctx['scratch'] = ScratchManager(ram_dir, budget * 1024 ** 2, cache_dir if cache_dir and os.path.isdir(cache_dir) else "")
+                    self.log_signal.emit(tr("log.encoder.scratch_enabled", dir=ram_dir, budget=f"{budget:.0f} MB"), "info")
                 else:
-                    self.log_signal.emit(tr("log.encoder.ab_av1_failed", best_icq=best_icq), "error")
-                    if ab_av1_log:
-                        self.log_signal.emit(tr("log.encoder.ab_av1_error_log_header"), "error")
-                        for log_line in ab_av1_log[-5:]:
-                            self.log_signal.emit(f"    {log_line}", "error")
-
-                if best_icq > 51:
-                    self.log_signal.emit(tr("log.encoder.icq_corrected", icq=best_icq), "warning")
-                    best_icq = 51
-
-                # --- 3.4 FFmpeg 最终编码 ---
-                base_name = os.path.splitext(fname)[0]
-                temp_file = os.path.join(cache_dir, f"{base_name}_{int(time.time())}.temp.mkv") if cache_dir and os.path.isdir(cache_dir) else os.path.join(os.path.dirname(std_filepath), base_name + ".temp.mkv")
-                if save_mode == SAVE_MODE_OVERWRITE:
-                    final_dest = os.path.join(os.path.dirname(std_filepath), base_name + ".mkv")
-                elif save_mode == SAVE_MODE_REMAIN:
-                    final_dest = os.path.join(os.path.dirname(std_filepath), base_name + "_opt.mkv")
-                else:
-                    if not export_dir: export_dir = os.path.dirname(std_filepath)
-                    os.makedirs(export_dir, exist_ok=True)
-                    final_dest = os.path.join(export_dir, base_name + ".mkv")
-
-                sub_codec = "copy"
-                if fname.lower().endswith(('.mp4', '.mov', '.m4v')):
-                    sub_codec = SUBTITLE_CODEC_SRT
-
-                audio_args = ["-c:a", AUDIO_CODEC, "-b:a", audio_bitrate, "-ar", SAMPLE_RATE]
-                if source_audio_channels:
-                    audio_args.extend(["-ac", str(source_audio_channels)])
-                    if source_audio_channels > 2:
-                        self.log_signal.emit(tr("log.encoder.info_multichannel", channels=source_audio_channels), "success")
-                
-                should_apply_loudnorm = (loudnorm_mode == LOUDNORM_MODE_ALWAYS) or (loudnorm_mode == LOUDNORM_MODE_AUTO and (source_audio_channels is None or source_audio_channels <= 2))
-                if should_apply_loudnorm and loudnorm:
-                    audio_args.extend(["-af", loudnorm])
-                    self.log_signal.emit(tr("log.encoder.info_loudnorm_enabled", mode=loudnorm_mode), "info")
-                else:
-                    self.log_signal.emit(tr("log.encoder.info_loudnorm_skipped", mode=loudnorm_mode), "info")
+                    self.log_signal.emit(tr("log.encoder.scratch_unavailable", dir=ram_dir or "-"), "warning")
 
-                cmd = []
-                # 构建 FFmpeg 命令行
-                cmd = [ffmpeg, "-y", "-hide_banner"]
-                
-                # 硬件解码加速 (如果适用)
-                if enc_name == "av1_qsv":
-                    cmd.extend(["-init_hw_device", "qsv=hw", "-filter_hw_device", "hw", "-v", "verbose"])
-                elif enc_name == "av1_nvenc":
-                    cmd.extend(["-v", "verbose"])
-                elif enc_name == "av1_amf":
-                    cmd.extend(["-v", "verbose"])
-
-                cmd.extend(["-i", std_filepath])
-                
-                # 视频编码参数
-                cmd.extend(["-c:v", enc_name, "-pix_fmt", PIX_FMT_10BIT])
-                
-                if enc_name == "av1_qsv":
-                    cmd.extend(["-global_quality:v", str(best_icq), "-preset", enc_preset, "-look_ahead", "1"])
-                elif enc_name == "av1_nvenc":
-                    cmd.extend(["-cq", str(best_icq), "-preset", enc_preset, "-b:v", "0"])
-                    if self.config.get('nv_aq', True):
-                        cmd.extend(["-spatial-aq", "1", "-temporal-aq", "1"])
-                elif enc_name == "av1_amf":
-                    cmd.extend(["-usage", "transcoding", "-quality", enc_preset, "-rc", "vbr_latency", "-qvbr_quality_level", str(best_icq)])
-                    if self.config.get('nv_aq', True): # 复用 nv_aq 开关作为 AMD PreAnalysis
-                        cmd.extend(["-preanalysis", "true"])
-
-                # 音频和字幕
-                cmd.extend(audio_args)
-                cmd.extend(["-c:s", sub_codec])
-                
-                # 映射所有流
-                cmd.extend(["-map", "0:v:0", "-map", "0:a", "-map", "0:s?"])
-                
-                # 输出文件
-                cmd.append(temp_file)
+            # 预检各磁盘的剩余空间，运行中空间不足时暂停领取新文件
+            if self.config.get('disk_space_check', True):
+                planner = DiskSpacePlanner(cache_dir, save_mode, export_dir, ctx['temp_on_destination'], self.config.get('metadata', {}))
+                ctx['disk_guard'] = DiskSpaceGuard(planner)
+                for directory, need, free in planner.shortfalls(planner.plan(tasks, len(slots))):
+                    self.log_signal.emit(tr("log.encoder.disk_space_short", dir=directory, need=format_size(need), free=format_size(free)), "warning")
 
-                # [Fix] WinError 87 修复：过滤掉 cmd 中的空字符串和非字符串对象
-                cmd = [str(arg) for arg in cmd if str(arg).strip()]
+            deadline_text = self.config.get('deadline', '')
+            deadline = parse_deadline(deadline_text)
+            if deadline:
+                ctx['deadline'] = DeadlinePlanner(deadline, speed_history)
+                self.log_signal.emit(tr("log.encoder.deadline_mode", deadline=time.strftime("%Y-%m-%d %H:%M", time.localtime(deadline))), "info")
+            elif deadline_text:
+                self.log_signal.emit(tr("log.encoder.deadline_invalid", value=deadline_text), "warning")
 
-                encode_start_time = time.time()
-                encode_paused_time = 0.0
-                try:
-                    # [Fix] 使用 text=True (universal_newlines) 让 Python 处理 \r 换行符，解决进度条不更新问题
-                    # 同时指定 encoding='utf-8' errors='replace' 防止编码报错
-                    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, 
-                                          startupinfo=startupinfo, creationflags=get_subprocess_flags(),
-                                          text=True, encoding='utf-8', errors='replace') as proc:
-                        self.current_proc = proc
-                        err_log = []
-                        max_percent = 0
-                        while True:
-                            if not self.is_running:
-                                try: proc.kill()
-                                except: pass
-                                break
-                            if self.is_paused:
-                                p_start = time.time()
-                                while self.is_paused:
-                                    if not self.is_running: break
-                                    time.sleep(0.1)
-                                p_dt = time.time() - p_start
-                                encode_paused_time += p_dt
-                                file_paused_time += p_dt
-
-                            line = proc.stdout.readline()
-                            if not line and proc.poll() is not None: break
-                            if line:
-                                d = line.strip() # 已经是字符串，无需 safe_decode
-                                
-                                # [Fix] 尝试从输出中补获时长 (防止元数据获取失败导致进度条不走)
-                                if duration_sec <= 0 and "Duration:" in d:
-                                    dur_match = re.search(r"Duration:\s*(\d+:\d+:\d+(?:\.\d+)?)", d)
-                                    if dur_match:
-                                        duration_sec = time_str_to_seconds(dur_match.group(1))
-
-                                if "time=" in d and duration_sec > 0:
-                                    t_match = re.search(r"time=\s*(\d+:\d+:\d+(?:\.\d+)?)", d)
-                                    if t_match:
-                                        current_sec = time_str_to_seconds(t_match.group(1))
-                                        percent = min(100, int((current_sec / duration_sec) * 100))
-                                        if percent > max_percent:
-                                            max_percent = percent
-                                            self.progress_current_signal.emit(percent)
-                                            self.file_progress_signal.emit(filepath, percent)
-                                        
-                                        s_match = re.search(r"speed=\s*([\d.]+)x", d)
-                                        if s_match:
-                                            try:
-                                                speed_val = float(s_match.group(1))
-                                                if speed_val > 0:
-                                                    remaining = (duration_sec - current_sec) / speed_val
-                                                    m, s = divmod(int(remaining), 60)
-                                                    h, m = divmod(m, 60)
-                                                    eta = f"ETA: {h:02d}:{m:02d}:{s:02d}"
-                                                    self.file_stats_signal.emit(filepath, f"{speed_val:.2f}x", eta)
-                                            except Exception: pass
-
-                                if "frame=" not in d:
-                                    err_log.append(d)
-                                    if len(err_log) > 20: err_log.pop(0)
-                        return_code = proc.returncode
-                except Exception as e:
-                    self.log_signal.emit(tr("log.encoder.ffmpeg_exception", error=e), "error")
-                    self.file_status_signal.emit(filepath, "error")
-                    continue
-                finally:
-                    self.current_proc = None
-                    encode_duration = time.time() - encode_start_time - encode_paused_time
+            # 预读暂存：编码期间把接下来的源文件复制到本地缓存
+            if self.config.get('staging', False) and cache_dir:
+                count = max(1, int(self.config.get('staging_count', 2)))
+                budget = float(self.config.get('staging_budget_gb', 50.0))
+                self.stager = SourceStager(os.path.join(cache_dir, STAGING_DIR_NAME), self._upcoming, count, budget * 1024 ** 3,
+                                           float(self.config.get('staging_bandwidth_mb', 0.0)) * 1024 ** 2,
+                                           self.config.get('staging_remote_only', True)).start()
+                self.log_signal.emit(tr("log.encoder.staging_enabled", count=count, budget=budget), "info")
 
-                if not self.is_running:
-                    lp_temp = to_long_path(temp_file)
-                    if os.path.exists(lp_temp): os.remove(lp_temp)
-                    break
+            # --- 4. 各槽位并行领取并处理文件 (短片先走快速通道) ---
+            fast_tasks, tasks = self._split_fast_lane(tasks)
+            if fast_tasks:
+                self.later_tasks = tasks
+                fast_slots = build_fast_slots(slots, self.config.get('fast_lane_instances', 3))
+                self.log_signal.emit(tr("log.encoder.fast_lane", count=len(fast_tasks), slots=len(fast_slots)), "info")
+                self.parallel = len(fast_slots) > 1
+                self.dispatcher = SlotDispatcher(fast_slots, fast_tasks, self.config.get('gpu_assignment', GPU_ASSIGN_LEAST_LOADED))
+                self.dispatcher.run(lambda slot, i, filepath: self._run_slot_task(ctx, slot, i, filepath), self._on_slot_error)
+                self.completed += self.dispatcher.done
+                self.later_tasks = []
+                self.parallel = len(slots) > 1
 
-                lp_temp = to_long_path(temp_file)
-                if return_code == 0 and os.path.exists(lp_temp) and os.path.getsize(lp_temp) > 1024:
-                    try:
-                        lp_dest = to_long_path(final_dest)
-                        abs_src = os.path.normcase(os.path.abspath(filepath))
-                        abs_dest = os.path.normcase(os.path.abspath(final_dest))
-                        lp_src = to_long_path(filepath)
-                        
-                        total_duration = time.time() - task_start_time - file_paused_time
-
-                        if save_mode == SAVE_MODE_OVERWRITE:
-                            success = False
-                            for _ in range(3):
-                                try:
-                                    if abs_src == abs_dest:
-                                        bak_path = lp_src + ".bak"
-                                        # [Fix] 增强重试逻辑：仅当源文件存在时才执行重命名（防止重试时因源文件已更名而报错）
-                                        if os.path.exists(lp_src):
-                                            if os.path.exists(bak_path): os.remove(bak_path)
-                                            os.replace(lp_src, bak_path)
-                                        
-                                        shutil.move(lp_temp, lp_dest)
-                                        if os.path.exists(bak_path): os.remove(bak_path)
-                                    else:
-                                        if os.path.exists(lp_dest): os.remove(lp_dest)
-                                        shutil.move(lp_temp, lp_dest)
-                                        if os.path.exists(lp_src): os.remove(lp_src)
-                                    success = True
-                                    break
-                                except Exception:
-                                    time.sleep(1)
-                            
-                            if success:
-                                self.log_signal.emit(tr("log.encoder.success_overwrite", encode_duration=encode_duration, total_duration=total_duration), "success")
-                                self.file_stats_signal.emit(filepath, tr("log.encoder.status_done"), tr("log.encoder.status_duration", total_duration=total_duration))
-                                self.file_status_signal.emit(filepath, "success")
-                            else:
-                                raise Exception(tr("log.encoder.error_move_overwrite"))
-                        else:
-                            for _ in range(3):
-                                try:
-                                    if os.path.exists(lp_dest): os.remove(lp_dest)
-                                    shutil.move(lp_temp, lp_dest)
-                                    break
-                                except Exception: time.sleep(1)
-
-                            if save_mode == SAVE_MODE_REMAIN:
-                                self.log_signal.emit(tr("log.encoder.success_remain", encode_duration=encode_duration, total_duration=total_duration), "success")
-                            else:
-                                self.log_signal.emit(tr("log.encoder.success_save_as", encode_duration=encode_duration, total_duration=total_duration), "success")
-                            self.file_stats_signal.emit(filepath, tr("log.encoder.status_done"), tr("log.encoder.status_duration", total_duration=total_duration))
-                            self.file_status_signal.emit(filepath, "success")
-                    except Exception as e:
-                        self.log_signal.emit(tr("log.encoder.error_move", error=e), "error")
-                        self.file_status_signal.emit(filepath, "error")
-                else:
-                    self.log_signal.emit(tr("log.encoder.ffmpeg_crash"), "error")
-                    self.file_status_signal.emit(filepath, "error")
-                    for err_line in err_log:
-                        self.log_signal.emit(f"   {err_line}", "error")
-                    lp_temp = to_long_path(temp_file)
-                    if os.path.exists(lp_temp): os.remove(lp_temp)
-                    
-                    if self.is_running:
-                        self.waiting_decision = True
-                        self.decision = None
-                        self.ask_error_decision.emit(tr("dialog.encoder.crash_title"), tr("dialog.encoder.crash_content", fname=fname))
-                        while self.waiting_decision and self.is_running:
-                            time.sleep(0.1)
-                        if self.decision == 'stop':
-                            break
-                
-                if self.is_running:
-                    self.log_signal.emit(tr("log.encoder.cooling_down"), "info")
-                    time.sleep(GPU_COOLING_TIME)
+            if tasks and self.is_running:
+                self.dispatcher = SlotDispatcher(slots, tasks, self.config.get('gpu_assignment', GPU_ASSIGN_LEAST_LOADED),
+                                                 self._build_placement(slots, tasks, speed_history, self.completed), self.completed)
+                self.dispatcher.run(lambda slot, i, filepath: self._run_slot_task(ctx, slot, i, filepath), self._on_slot_error)
+
+            # 等待后台收尾队列完成跨盘复制
+            if self.finalizer.pending():
+                self.log_signal.emit(tr("log.encoder.finalize_wait", count=self.finalizer.pending()), "info")
+            self.finalizer.wait()
 
+            # --- 5. 报告批次结果 ---
             if self.is_running:
                 self.log_signal.emit(tr("log.encoder.all_done"), "success")
                 self.progress_total_signal.emit(100)
@@ -534,5 +1460,9 @@ class EncoderWorker(BaseWorker):
         except Exception as e:
             self.log_signal.emit(tr("log.encoder.fatal_error", error=e), "error")
         finally:
+            if self.stager:
+                self.stager.stop()
+            if self.governor:
+                self.governor.stop()
             self.set_system_awake(False)
             self.finished_signal.emit()
@@ -0,0 +1,50 @@
+import threading
+
+from config import SVT_PRESET_MAP
+from .scheduler import EncodeSlot
+
+
+def slot_key(slot):
+    """ 熔断按编码器与显卡序号区分 (同一型号的不同显卡互不影响)。 """
+    return f"{slot.enc_name}#{slot.device}" if slot.device is not None else slot.enc_name
+
+
+def fallback_slot(slot, p_val):
+    """
+    编码器崩溃后改用的槽位：硬件编码器与 libaom 回退到 SVT-AV1，沿用原槽位的处理器绑定。
+    SVT-AV1 本身没有可回退的编码器，返回 None。
+    """
+    if slot.enc_name == "libsvtav1":
+        return None
+    if slot.is_cpu:
+        cpu_opts = dict(slot.cpu_opts)
+    else:
+        cpu_opts = {"threads": len(slot.cpus), "lp": len(slot.cpus)} if slot.cpus else {}
+    return EncodeSlot(slot.name, "libsvtav1", str(SVT_PRESET_MAP[p_val]), cpu_opts, slot.cpus)
+
+
+class CircuitBreaker:
+    """
+    编码器熔断：统计每个编码器 (及显卡) 的连续崩溃次数，达到阈值后本批次不再使用，
+    该编码器成功完成一次编码即清零。threshold 为 0 时不熔断。
+    """
+    def __init__(self, threshold):
+        self.threshold = max(0, int(threshold))
+        self._failures = {}
+        self._lock = threading.Lock()
+
+    def record_failure(self, slot):
+        """ 记录一次崩溃，返回该编码器是否因此被熔断。 """
+        key = slot_key(slot)
+        with self._lock:
+            self._failures[key] = self._failures.get(key, 0) + 1
+            return self.threshold > 0 and self._failures[key] == self.threshold
+
+    def record_success(self, slot):
+        with self._lock:
+            self._failures.pop(slot_key(slot), None)
+
+    def is_open(self, slot):
+        """ 编码器是否已被熔断。 """
+        with self._lock:
+            return self.threshold > 0 and self._failures.get(slot_key(slot), 0) >= self.threshold
@@ -0,0 +1,77 @@
+import os
+
+from config import FAST_LANE_FOLDER_HISTORY, FAST_LANE_BUCKET_HISTORY
+from .scheduler import EncodeSlot
+
+
+def _median(values):
+    ordered = sorted(values)
+    return ordered[len(ordered) // 2] if ordered else None
+
+
+class CrfCache:
+    """
+    记录 ab-av1 探测得出的最终参数，供快速通道跳过探测：
+    优先使用同一文件的结果，其次为同一文件夹 (通常是同一系列) 的中位数，最后为同一分辨率档位的中位数。
+    编码器、预设、目标 VMAF 与滤镜不同的结果互不混用。
+    """
+    def __init__(self, cache):
+        self.cache = cache
+
+    @staticmethod
+    def _keys(fingerprint, filepath, slot, target_vmaf, vfilter, bucket):
+        profile = f"{slot.enc_name}|{slot.enc_preset}|{float(target_vmaf):g}"
+        return (f"file:{fingerprint}|{profile}|{vfilter}",
+                f"dir:{os.path.normcase(os.path.dirname(os.path.abspath(filepath)))}|{bucket}|{profile}",
+                f"bucket:{bucket}|{profile}")
+
+    def lookup(self, fingerprint, filepath, slot, target_vmaf, vfilter, bucket):
+        """ 返回 (参数, 来源)，来源为 "file" / "folder" / "predicted"；没有可用记录时返回 (None, None)。 """
+        file_key, dir_key, bucket_key = self._keys(fingerprint, filepath, slot, target_vmaf, vfilter, bucket)
+        if fingerprint:
+            value = self.cache.get(file_key)
+            if value is not None:
+                return int(value), "file"
+        value = _median(self.cache.get(dir_key) or [])
+        if value is not None:
+            return int(value), "folder"
+        value = _median(self.cache.get(bucket_key) or [])
+        if value is not None:
+            return int(value), "predicted"
+        return None, None
+
+    def record(self, fingerprint, filepath, slot, target_vmaf, vfilter, bucket, icq):
+        file_key, dir_key, bucket_key = self._keys(fingerprint, filepath, slot, target_vmaf, vfilter, bucket)
+        if fingerprint:
+            self.cache.set(file_key, int(icq))
+        self.cache.set(dir_key, ((self.cache.get(dir_key) or []) + [int(icq)])[-FAST_LANE_FOLDER_HISTORY:])
+        self.cache.set(bucket_key, ((self.cache.get(bucket_key) or []) + [int(icq)])[-FAST_LANE_BUCKET_HISTORY:])
+
+
+def build_fast_slots(slots, instances):
+    """
+    将每个常规槽位拆分为 instances 个快速通道槽位，同时运行多个短片编码。
+    CPU 槽位按实例数平分线程与绑定的处理器 (每实例至少一个线程)。
+    """
+    fast_slots = []
+    for slot in slots:
+        count = max(1, int(instances))
+        threads = int(slot.cpu_opts.get("threads") or 0)
+        if slot.is_cpu and threads:
+            count = min(count, threads)
+        cpu_sets = None
+        if slot.cpus and len(slot.cpus) >= count:
+            size, extra = divmod(len(slot.cpus), count)
+            cpu_sets, start = [], 0
+            for k in range(count):
+                end = start + size + (1 if k < extra else 0)
+                cpu_sets.append(slot.cpus[start:end])
+                start = end
+        for k in range(count):
+            cpu_opts = dict(slot.cpu_opts)
+            if threads:
+                cpu_opts["threads"] = max(1, threads // count)
+                cpu_opts["lp"] = cpu_opts["threads"]
+            fast_slots.append(EncodeSlot(f"{slot.name}-F{k + 1}", slot.enc_name, slot.enc_preset, cpu_opts,
+                                         cpu_sets[k] if cpu_sets else slot.cpus, slot.device, fast_lane=True))
+    return fast_slots
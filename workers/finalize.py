@@ -0,0 +1,279 @@
+import os
+import sys
+import errno
+import queue
+import time
+import shutil
+import hashlib
+import threading
+
+from config import COPY_CHUNK_SIZE
+
+
+def volume_id(path):
+    """ 返回路径所在卷的设备号 (路径不存在时取最近的已存在上级目录)，失败时返回 None。 """
+    path = os.path.abspath(path)
+    while path:
+        try:
+            return os.stat(path).st_dev
+        except OSError:
+            parent = os.path.dirname(path)
+            if parent == path:
+                return None
+            path = parent
+    return None
+
+
+def same_volume(a, b):
+    va, vb = volume_id(a), volume_id(b)
+    return va is not None and va == vb
+
+
+def pick_temp_dir(dest_path, default_dir):
+    """
+    选择临时输出目录：目标与默认目录 (缓存目录) 不在同一卷时，优先放到目标目录 (可写时)，
+    使收尾只需在同一卷内重命名，而不是复制整个文件。
+    """
+    dest_dir = os.path.dirname(os.path.abspath(dest_path))
+    if same_volume(dest_dir, default_dir):
+        return default_dir
+    if os.path.isdir(dest_dir) and os.access(dest_dir, os.W_OK):
+        return dest_dir
+    return default_dir
+
+
+def move_file(src, dest, verify=True):
+    """ 同一卷内直接重命名 (原子替换)，跨卷时校验复制后删除源文件。 """
+    if same_volume(src, os.path.dirname(os.path.abspath(dest))):
+        os.replace(src, dest)
+    else:
+        copy_file(src, dest, verify=verify)
+        os.remove(src)
+
+
+# 内核零拷贝不受支持时返回的错误码 (文件系统或内核版本不支持，改用下一种方式)
+_UNSUPPORTED = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EBADF, errno.ENOTSOCK}
+
+
+def _copy_methods():
+    """ 按优先级返回可用的复制方式：copy_file_range 与 sendfile 在内核中完成，chunked 为用户态分块复制。 """
+    methods = []
+    if hasattr(os, 'copy_file_range'):
+        methods.append("copy_file_range")
+    if hasattr(os, 'sendfile') and sys.platform.startswith('linux'):
+        methods.append("sendfile")
+    methods.append("chunked")
+    return methods
+
+
+def _copy_chunk(method, fin, fout, offset, count):
+    """ 从 offset 处复制最多 count 字节，返回实际复制的字节数。 """
+    if method == "copy_file_range":
+        return os.copy_file_range(fin.fileno(), fout.fileno(), count, offset, offset)
+    fout.seek(offset)
+    if method == "sendfile":
+        return os.sendfile(fout.fileno(), fin.fileno(), offset, count)
+    fin.seek(offset)
+    data = fin.read(count)
+    view = memoryview(data)
+    while view:
+        view = view[fout.write(view):]
+    return len(data)
+
+
+class _HashFollower(threading.Thread):
+    """ 跟随复制进度计算文件的校验和：只读取已复制完成的部分，与复制过程重叠进行。 """
+    def __init__(self, path, chunk_size):
+        super().__init__(daemon=True)
+        self.path = path
+        self.chunk_size = chunk_size
+        self.digest = None
+        self.error = None
+        self._limit = 0
+        self._final = False
+        self._aborted = False
+        self._cond = threading.Condition()
+
+    def advance(self, limit, final=False):
+        with self._cond:
+            self._limit = limit
+            self._final = final
+            self._cond.notify()
+
+    def abort(self):
+        with self._cond:
+            self._aborted = True
+            self._cond.notify()
+
+    def run(self):
+        try:
+            h = hashlib.blake2b()
+            pos = 0
+            with open(self.path, 'rb', buffering=0) as f:
+                while True:
+                    with self._cond:
+                        while pos >= self._limit and not self._final and not self._aborted:
+                            self._cond.wait()
+                        if self._aborted:
+                            return
+                        limit, final = self._limit, self._final
+                    if pos >= limit and final:
+                        break
+                    f.seek(pos)
+                    while pos < limit:
+                        data = f.read(min(self.chunk_size, limit - pos))
+                        if not data:
+                            raise OSError(f"unexpected end of file: {self.path}")
+                        h.update(data)
+                        pos += len(data)
+            self.digest = h.hexdigest()
+        except Exception as e:
+            self.error = e
+
+
+def copy_file(src, dest, progress=None, cancelled=None, verify=True, bandwidth=0, chunk_size=COPY_CHUNK_SIZE):
+    """
+    跨卷复制文件：优先使用内核零拷贝 (copy_file_range / sendfile)，不支持时退回分块复制。
+    数据先写入 dest.partial，校验通过并落盘后再原子重命名为 dest，失败时不会留下不完整的目标文件。
+    verify 为 True 时，源文件与目标文件的校验和在复制过程中同步计算。
+    progress(percent) 报告 0-100 的进度；cancelled() 返回 True 时中止并抛出 InterruptedError。
+    bandwidth 为复制速度上限 (字节/秒)，0 表示不限。
+    """
+    partial = dest + ".partial"
+    total = os.path.getsize(src)
+    followers = [_HashFollower(src, chunk_size), _HashFollower(partial, chunk_size)] if verify else []
+    try:
+        with open(src, 'rb', buffering=0) as fin, open(partial, 'wb', buffering=0) as fout:
+            for follower in followers:
+                follower.start()
+            methods = _copy_methods()
+            offset = 0
+            last_percent = -1
+            started = time.monotonic()
+            while offset < total:
+                if cancelled and cancelled():
+                    raise InterruptedError("copy cancelled")
+                count = min(chunk_size, total - offset)
+                try:
+                    copied = _copy_chunk(methods[0], fin, fout, offset, count)
+                except OSError as e:
+                    if methods[0] == "chunked" or e.errno not in _UNSUPPORTED:
+                        raise
+                    methods.pop(0)
+                    continue
+                if copied == 0:
+                    # 零拷贝在部分文件系统上不报错但不复制数据，改用下一种方式
+                    if methods[0] == "chunked":
+                        raise OSError(f"source truncated during copy: {src}")
+                    methods.pop(0)
+                    continue
+                offset += copied
+                for follower in followers:
+                    follower.advance(offset)
+                if bandwidth > 0:
+                    ahead = offset / bandwidth - (time.monotonic() - started)
+                    if ahead > 0:
+                        time.sleep(ahead)
+                percent = offset * 100 // total
+                if progress and percent != last_percent:
+                    last_percent = percent
+                    progress(percent)
+            os.fsync(fout.fileno())
+        for follower in followers:
+            follower.advance(total, final=True)
+            follower.join()
+            if follower.error:
+                raise follower.error
+        if followers and followers[0].digest != followers[1].digest:
+            raise OSError(f"checksum mismatch after copy: {dest}")
+        shutil.copystat(src, partial)
+        os.replace(partial, dest)
+        if progress and total == 0:
+            progress(100)
+    except BaseException:
+        for follower in followers:
+            follower.abort()
+        try:
+            if os.path.exists(partial): os.remove(partial)
+        except OSError:
+            pass
+        raise
+
+
+class FinalizeQueue:
+    """
+    后台收尾队列：跨卷收尾时在后台线程中复制临时输出到目标位置，编码槽位可以立即开始下一个文件。
+    每个任务完成后调用 done(ok, error, kept)，复制过程中调用 progress(label, percent)。
+    复制失败时保留已完成的输出 (改名为 .kept.mkv，不会被缓存清理删除)，kept 为其路径。
+    """
+    def __init__(self, progress=None, verify=True):
+        self.progress = progress
+        self.verify = verify
+        self.cancelled = False
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._idle = threading.Event()
+        self._idle.set()
+
+    def submit(self, src, dest, label, done):
+        with self._lock:
+            self._pending += 1
+            self._idle.clear()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, daemon=True)
+                self._thread.start()
+        self._queue.put((src, dest, label, done))
+
+    def pending(self):
+        with self._lock:
+            return self._pending
+
+    def wait(self):
+        """ 等待所有收尾任务完成。 """
+        self._idle.wait()
+
+    def cancel(self):
+        self.cancelled = True
+
+    def _run(self, src, dest, label):
+        copy_file(src, dest, (lambda p: self.progress(label, p)) if self.progress else None,
+                  lambda: self.cancelled, self.verify)
+        # 目标已完整写入，删除临时输出失败 (被占用等) 不影响收尾结果
+        try:
+            os.remove(src)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _keep(src):
+        """ 复制失败时保留临时输出 (唯一完好的编码结果)，返回保留的路径。 """
+        if not os.path.exists(src):
+            return None
+        kept = src[:-len(".temp.mkv")] + ".kept.mkv" if src.endswith(".temp.mkv") else src
+        try:
+            os.replace(src, kept)
+            return kept
+        except OSError:
+            return src
+
+    def _loop(self):
+        while True:
+            src, dest, label, done = self._queue.get()
+            ok, error, kept = False, None, None
+            try:
+                self._run(src, dest, label)
+                ok = True
+            except Exception as e:
+                # copy_file 已删除 .partial，不完整的目标不会残留
+                error = e
+                kept = self._keep(src)
+            try:
+                done(ok, error, kept)
+            except Exception:
+                pass
+            with self._lock:
+                self._pending -= 1
+                if self._pending == 0:
+                    self._idle.set()
@@ -0,0 +1,276 @@
+import os
+import time
+import ctypes
+import shutil
+import subprocess
+import threading
+
+from config import (GOVERNOR_OFF, GOVERNOR_AUTO, GOVERNOR_INTERACTIVE, GOVERNOR_OFFHOURS, GOVERNOR_POLL_INTERVAL,
+                    PRIORITY_NORMAL, PRIORITY_BELOW_NORMAL, PRIORITY_IDLE)
+from utils import get_subprocess_flags, _descendant_pids
+from .process import available_cpus, set_affinity
+
+# nice 值与 Windows 优先级类 (IDLE / BELOW_NORMAL / NORMAL_PRIORITY_CLASS)
+NICE_LEVELS = {PRIORITY_NORMAL: 0, PRIORITY_BELOW_NORMAL: 10, PRIORITY_IDLE: 19}
+PRIORITY_CLASSES = {PRIORITY_NORMAL: 0x20, PRIORITY_BELOW_NORMAL: 0x4000, PRIORITY_IDLE: 0x40}
+# ionice 调度类 (best-effort 最低级 / idle) 与 Windows I/O 优先级 (0 very low, 1 low, 2 normal)
+IONICE_ARGS = {PRIORITY_NORMAL: ["-c", "2", "-n", "4"], PRIORITY_BELOW_NORMAL: ["-c", "2", "-n", "7"], PRIORITY_IDLE: ["-c", "3"]}
+IO_PRIORITY_HINTS = {PRIORITY_NORMAL: 2, PRIORITY_BELOW_NORMAL: 1, PRIORITY_IDLE: 0}
+
+
+class GovernorProfile:
+    """ 资源配置：进程优先级、I/O 优先级、可用处理器比例 (%) 与同时运行的任务数上限 (0 不限)。 """
+    def __init__(self, name, priority=PRIORITY_NORMAL, io=PRIORITY_NORMAL, cpu_percent=100, max_jobs=0):
+        self.name = name
+        self.priority = priority if priority in NICE_LEVELS else PRIORITY_NORMAL
+        self.io = io if io in NICE_LEVELS else PRIORITY_NORMAL
+        self.cpu_percent = max(1, min(100, int(cpu_percent or 100)))
+        self.max_jobs = max(0, int(max_jobs or 0))
+
+    def cpus(self):
+        """ 按比例保留编号最大的处理器 (编号小的通常承担系统与界面任务)；100% 时返回 None (不限制)。 """
+        if self.cpu_percent >= 100:
+            return None
+        cpus = available_cpus()
+        count = max(1, len(cpus) * self.cpu_percent // 100)
+        return cpus[-count:]
+
+    def describe(self):
+        return f"{self.name}: priority={self.priority}, io={self.io}, cpu={self.cpu_percent}%, jobs={self.max_jobs or '-'}"
+
+
+NORMAL_PROFILE = GovernorProfile(GOVERNOR_OFF)
+
+
+def parse_hours(text):
+    """ 解析时间段，例如 "09:00-18:00" 或 "09:00-12:00,13:30-18:00" (可跨越午夜)，返回 [(开始分钟, 结束分钟)]。 """
+    ranges = []
+    for part in (text or "").replace(";", ",").split(","):
+        if "-" not in part:
+            continue
+        try:
+            start, end = (int(h) * 60 + int(m) for h, m in (p.strip().split(":", 1) for p in part.split("-", 1)))
+        except ValueError:
+            continue
+        if 0 <= start < 1440 and 0 <= end <= 1440 and start != end:
+            ranges.append((start, end))
+    return ranges
+
+
+def in_hours(ranges, now=None):
+    """ 当前时间是否位于任一时间段内。 """
+    local = time.localtime(now)
+    minute = local.tm_hour * 60 + local.tm_min
+    for start, end in ranges:
+        if (start <= minute < end) if start < end else (minute >= start or minute < end):
+            return True
+    return False
+
+
+def _child_pids_nt(pid):
+    """ 通过进程快照收集某进程的全部后代进程 (Windows)。 """
+    class PROCESSENTRY32W(ctypes.Structure):
+        _fields_ = [("dwSize", ctypes.c_ulong), ("cntUsage", ctypes.c_ulong), ("th32ProcessID", ctypes.c_ulong),
+                    ("th32DefaultHeapID", ctypes.c_size_t), ("th32ModuleID", ctypes.c_ulong), ("cntThreads", ctypes.c_ulong),
+                    ("th32ParentProcessID", ctypes.c_ulong), ("pcPriClassBase", ctypes.c_long), ("dwFlags", ctypes.c_ulong),
+                    ("szExeFile", ctypes.c_wchar * 260)]
+    kernel32 = ctypes.windll.kernel32
+    kernel32.CreateToolhelp32Snapshot.restype = ctypes.c_void_p
+    snapshot = kernel32.CreateToolhelp32Snapshot(0x2, 0) # TH32CS_SNAPPROCESS
+    if not snapshot or snapshot == ctypes.c_void_p(-1).value:
+        return []
+    children = {}
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        ok = kernel32.Process32FirstW(ctypes.c_void_p(snapshot), ctypes.byref(entry))
+        while ok:
+            children.setdefault(entry.th32ParentProcessID, []).append(entry.th32ProcessID)
+            ok = kernel32.Process32NextW(ctypes.c_void_p(snapshot), ctypes.byref(entry))
+    finally:
+        kernel32.CloseHandle(ctypes.c_void_p(snapshot))
+    result, stack = [], [pid]
+    while stack:
+        for child in children.get(stack.pop(), []):
+            if child not in result and child != pid:
+                result.append(child)
+                stack.append(child)
+    return result
+
+
+def descendant_pids(pid):
+    """ 某进程的全部后代进程 (Linux 读取 /proc，Windows 使用进程快照)。 """
+    try:
+        return _child_pids_nt(pid) if os.name == 'nt' else _descendant_pids(pid)
+    except Exception:
+        return []
+
+
+def set_priority(pid, priority, io):
+    """ 设置进程的 CPU 与 I/O 优先级。提高优先级 (降低 nice) 通常需要管理员权限，失败时静默忽略。 """
+    if os.name == 'nt':
+        try:
+            kernel32 = ctypes.windll.kernel32
+            handle = kernel32.OpenProcess(0x0200 | 0x0400, False, pid) # PROCESS_SET_INFORMATION | PROCESS_QUERY_INFORMATION
+            if not handle:
+                return
+            try:
+                kernel32.SetPriorityClass(handle, PRIORITY_CLASSES[priority])
+                # ProcessIoPriority = 33 (未公开的 NtSetInformationProcess 信息类)
+                hint = ctypes.c_ulong(IO_PRIORITY_HINTS[io])
+                ctypes.windll.ntdll.NtSetInformationProcess(handle, 33, ctypes.byref(hint), ctypes.sizeof(hint))
+            finally:
+                kernel32.CloseHandle(handle)
+        except Exception:
+            pass
+        return
+    try:
+        os.setpriority(os.PRIO_PROCESS, pid, NICE_LEVELS[priority])
+    except (OSError, AttributeError):
+        pass
+    ionice = shutil.which("ionice")
+    if ionice:
+        try:
+            subprocess.run([ionice] + IONICE_ARGS[io] + ["-p", str(pid)], stdout=subprocess.DEVNULL,
+                           stderr=subprocess.DEVNULL, creationflags=get_subprocess_flags(), timeout=5)
+        except Exception:
+            pass
+
+
+class ResourceGovernor:
+    """
+    子进程资源调控：按模式选择资源配置 (auto 在 interactive_hours 时段内使用 interactive 配置，其余时间使用 offhours 配置)，
+    对登记的每个子进程及其派生进程设置优先级、I/O 优先级与处理器亲和性，并限制同时运行的任务数。
+    后台线程定期检查当前配置，模式或时段切换时重新应用到所有正在运行的子进程，无需重启批次。
+    """
+    def __init__(self, mode, profiles, hours, registry=None):
+        self.mode = mode
+        self.profiles = profiles
+        self.hours = parse_hours(hours)
+        self.registry = registry
+        self.on_change = None
+        self.stopped = False
+        self._active = None
+        self._applied = False
+        self._jobs = 0
+        self._seen = {} # 进程 -> 已应用的配置
+        self._lock = threading.Lock()
+        self._cond = threading.Condition()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def profile(self):
+        """ 当前生效的资源配置；关闭时返回 None。 """
+        if self.mode == GOVERNOR_AUTO:
+            return self.profiles[GOVERNOR_INTERACTIVE if in_hours(self.hours) else GOVERNOR_OFFHOURS]
+        return self.profiles.get(self.mode)
+
+    def start(self):
+        self._active = self.profile()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+        return self
+
+    def set_mode(self, mode):
+        """ 运行中切换模式 (界面线程调用)，由后台线程立即重新应用。 """
+        if mode in (GOVERNOR_OFF, GOVERNOR_AUTO, GOVERNOR_INTERACTIVE, GOVERNOR_OFFHOURS):
+            self.mode = mode
+            self._wake.set()
+
+    def _loop(self):
+        while not self.stopped:
+            self._wake.wait(GOVERNOR_POLL_INTERVAL)
+            self._wake.clear()
+            if self.stopped:
+                return
+            profile = self.profile()
+            if profile is not self._active:
+                self._active = profile
+                if self.on_change:
+                    self.on_change(profile)
+                with self._cond:
+                    self._cond.notify_all()
+            # 定期重新应用，覆盖后台任务 (测量、裁剪检测等) 启动的子进程
+            with self._lock:
+                self.apply_all()
+
+    def apply(self, pid, cpus=None, profile=None):
+        """ 对单个进程及其派生进程应用当前配置；cpus 为槽位绑定的处理器，与配置的处理器集合取交集。 """
+        profile = profile or self._active
+        if profile is None:
+            return []
+        allowed = profile.cpus()
+        if cpus and allowed:
+            target = [c for c in cpus if c in set(allowed)] or allowed
+        else:
+            target = cpus or allowed or (available_cpus() if profile is NORMAL_PROFILE else None)
+        pids = [pid] + descendant_pids(pid)
+        for p in pids:
+            if self._seen.get(p) is profile:
+                continue
+            self._seen[p] = profile
+            set_priority(p, profile.priority, profile.io)
+            if target:
+                set_affinity(p, target)
+        return pids
+
+    def apply_all(self):
+        """ 将当前配置应用到登记的子进程 (按各自的槽位处理器) 以及本进程派生的其他子进程。 """
+        profile = self._active
+        if profile is None:
+            if not self._applied:
+                return
+            # 关闭后恢复为普通优先级 (降低 nice 需要权限，可能仅对之后启动的进程生效)
+            profile = NORMAL_PROFILE
+        self._applied = profile is not NORMAL_PROFILE
+        handled = set()
+        for item, cpus in (self.registry.processes() if self.registry else []):
+            pid = getattr(item, "pid", None)
+            if not pid or item.poll() is not None:
+                continue
+            handled.update(self.apply(pid, cpus, profile))
+        for pid in descendant_pids(os.getpid()):
+            if pid not in handled:
+                handled.update(self.apply(pid, None, profile))
+        # 只保留仍在运行的进程，已应用过当前配置的进程不再重复设置
+        self._seen = {pid: p for pid, p in self._seen.items() if pid in handled}
+
+    def on_process(self, pid, cpus=None):
+        """ 子进程登记时立即应用当前配置 (派生进程继承优先级与亲和性)。 """
+        if self._active is None:
+            if cpus:
+                set_affinity(pid, cpus)
+        else:
+            self._applied = True
+            with self._lock:
+                self._seen.pop(pid, None)
+                self.apply(pid, cpus)
+
+    def admit(self, is_running, on_wait=None):
+        """ 等待任务数低于当前配置的上限后占用一个名额 (开始等待时调用一次 on_wait)；任务停止时返回 False。 """
+        waited = False
+        with self._cond:
+            while not self.stopped and is_running():
+                profile = self._active
+                limit = profile.max_jobs if profile else 0
+                if limit <= 0 or self._jobs < limit:
+                    self._jobs += 1
+                    return True
+                if not waited and on_wait:
+                    on_wait()
+                waited = True
+                self._cond.wait(1.0)
+        return False
+
+    def leave(self):
+        with self._cond:
+            self._jobs = max(0, self._jobs - 1)
+            self._cond.notify_all()
+
+    def stop(self):
+        self.stopped = True
+        self._wake.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join()
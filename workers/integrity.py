@@ -0,0 +1,131 @@
+import queue
+import subprocess
+import threading
+
+from config import INTEGRITY_SCAN_FULL, INTEGRITY_SAMPLE_COUNT, INTEGRITY_SAMPLE_SECONDS
+from utils import get_subprocess_flags, safe_decode, file_fingerprint
+from .cropdetect import sample_timestamps
+
+
+def decode_errors(output):
+    """ 提取 FFmpeg (-v error) 输出中的错误行。 """
+    return [line.strip() for line in output.splitlines() if line.strip()]
+
+
+class IntegrityScanner:
+    """
+    源文件完整性预检：编码前用有限的并行度解码检查队列中的文件。
+    sample 模式在多个时间点 (含片尾，截断的文件通常在末尾出错) 各解码 INTEGRITY_SAMPLE_SECONDS 秒，
+    输入端 -ss 从关键帧开始解码；full 模式完整解码整个文件。
+    解码失败或错误行数超过 tolerance 时判为损坏。结果按文件指纹与模式缓存。
+    """
+    def __init__(self, ffmpeg, mode, workers, cache, metadata=None, tolerance=0,
+                 samples=INTEGRITY_SAMPLE_COUNT, seconds=INTEGRITY_SAMPLE_SECONDS):
+        self.ffmpeg = ffmpeg
+        self.mode = mode
+        self.workers = max(1, int(workers))
+        self.cache = cache
+        self.metadata = metadata or {}
+        self.tolerance = max(0, int(tolerance))
+        self.samples = samples
+        self.seconds = seconds
+        self.cancelled = False
+        self.procs = set()
+        self._lock = threading.Lock()
+
+    def _commands(self, path):
+        base = [self.ffmpeg, "-hide_banner", "-nostats", "-v", "error"]
+        tail = ["-i", path, "-map", "0:v:0", "-map", "0:a?", "-sn", "-dn", "-f", "null", "-"]
+        duration = (self.metadata.get(path) or {}).get('duration') or 0
+        if self.mode == INTEGRITY_SCAN_FULL:
+            return [base + tail]
+        if duration <= 0:
+            return [base + ["-t", str(self.seconds)] + tail]
+        points = sample_timestamps(duration, self.samples) + [max(0.0, duration - self.seconds)]
+        return [base + ["-ss", f"{ts:.3f}", "-t", str(self.seconds)] + tail for ts in points]
+
+    def _run(self, cmd):
+        """ 运行一次解码，返回 (退出码, 错误行)；已取消时返回 None。 """
+        with self._lock:
+            if self.cancelled:
+                return None
+            proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                    creationflags=get_subprocess_flags())
+            self.procs.add(proc)
+        try:
+            _, stderr = proc.communicate()
+        finally:
+            with self._lock:
+                self.procs.discard(proc)
+        if self.cancelled:
+            return None
+        return proc.returncode, decode_errors(safe_decode(stderr))
+
+    def check(self, path):
+        """ 检查单个文件，返回 {"errors": 前几条错误, "count": 错误行数, "failed": 解码是否失败}；已取消时返回 None。 """
+        errors, failed = [], False
+        for cmd in self._commands(path):
+            try:
+                result = self._run(cmd)
+            except Exception as e:
+                result = (-1, [str(e)])
+            if result is None:
+                return None
+            code, lines = result
+            errors.extend(lines)
+            if code != 0:
+                failed = True
+                break
+        return {"errors": errors[:5], "count": len(errors), "failed": failed}
+
+    def is_ok(self, result):
+        return not result.get("failed") and result.get("count", 0) <= self.tolerance
+
+    def scan(self, tasks, on_result=None):
+        """
+        并行检查所有文件，返回 {路径: 结果}；on_result(路径, 结果, 是否来自缓存) 在每个文件完成后调用。
+        """
+        results = {}
+        pending = queue.Queue()
+        for path in tasks:
+            key = file_fingerprint(path)
+            cached = self.cache.get(f"{key}|{self.mode}") if key else None
+            if cached is not None:
+                results[path] = cached
+                if on_result:
+                    on_result(path, cached, True)
+            else:
+                pending.put((path, key))
+
+        def worker():
+            while not self.cancelled:
+                try:
+                    path, key = pending.get_nowait()
+                except queue.Empty:
+                    return
+                result = self.check(path)
+                if result is None:
+                    return
+                if key:
+                    self.cache.set(f"{key}|{self.mode}", result)
+                results[path] = result
+                if on_result:
+                    on_result(path, result, False)
+
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(min(self.workers, pending.qsize()))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return results
+
+    def cancel(self):
+        with self._lock:
+            self.cancelled = True
+            procs = list(self.procs)
+        for proc in procs:
+            if proc.poll() is None:
+                try:
+                    proc.kill()
+                except Exception:
+                    pass
@@ -0,0 +1,55 @@
+import os
+
+
+def parse_renditions(spec, default_vmaf):
+    """
+    解析多规格输出配置，格式为 "高度:VMAF:后缀"，多个规格以 ";" 分隔 (例如 "720:93:_720p")。
+    VMAF 缺省时沿用主输出的目标，后缀缺省为 "_{高度}p"。无效的条目会被忽略。
+    """
+    renditions = []
+    for entry in (spec or "").split(";"):
+        parts = [p.strip() for p in entry.split(":")]
+        if not parts or not parts[0]:
+            continue
+        try:
+            height = int(parts[0])
+            vmaf = float(parts[1]) if len(parts) > 1 and parts[1] else float(default_vmaf)
+        except ValueError:
+            continue
+        if height <= 0:
+            continue
+        suffix = parts[2] if len(parts) > 2 and parts[2] else f"_{height}p"
+        renditions.append({"height": height, "vmaf": vmaf, "suffix": suffix, "label": f"{height}p"})
+    return renditions
+
+
+def scale_filter(height):
+    """ 按高度等比缩放 (宽度取偶数)。 """
+    return f"scale=-2:{height}"
+
+
+class RenditionProgress:
+    """
+    读取 -stats_enc_post 写出的逐帧时间戳，计算单个输出的编码进度。
+    同一次解码驱动所有输出，但各编码器的速度不同，因此按输出分别统计。
+    """
+    def __init__(self, stats_path, duration_sec):
+        self.stats_path = stats_path
+        self.duration_sec = duration_sec
+        self.percent = 0
+
+    def poll(self):
+        """ 读取统计文件的最后一行，返回当前进度百分比。 """
+        if self.duration_sec <= 0:
+            return self.percent
+        try:
+            with open(self.stats_path, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                size = f.tell()
+                f.seek(max(0, size - 256))
+                lines = f.read().decode('utf-8', errors='ignore').strip().splitlines()
+            if lines:
+                self.percent = max(self.percent, min(100, int(float(lines[-1]) / self.duration_sec * 100)))
+        except (OSError, ValueError):
+            pass
+        return self.percent
@@ -0,0 +1,126 @@
+import json
+import math
+import subprocess
+import threading
+
+from utils import get_subprocess_flags, safe_decode
+
+# 第二遍时由测量结果覆盖的参数，用户自带的同名参数会被忽略
+_MEASURE_KEYS = ("measured_i", "measured_tp", "measured_lra", "measured_thresh", "offset", "linear", "print_format")
+
+
+def split_filter_chain(filter_chain):
+    """
+    将音频滤镜链拆分为 (前置滤镜, loudnorm 参数, 后置滤镜)。
+    链中不含 loudnorm 时返回 None。
+    """
+    filters = [f.strip() for f in (filter_chain or "").split(",") if f.strip()]
+    for idx, flt in enumerate(filters):
+        name, _, params = flt.partition("=")
+        if name.strip() == "loudnorm":
+            kept = [p for p in params.split(":") if p and p.split("=")[0].strip().lower() not in _MEASURE_KEYS]
+            return filters[:idx], ":".join(kept), filters[idx + 1:]
+    return None
+
+
+def _join_filters(pre, loudnorm, post):
+    return ",".join(pre + [loudnorm] + post)
+
+
+def build_measure_filter(filter_chain):
+    """ 生成第一遍测量用的滤镜链 (仅保留 loudnorm 及其前置滤镜)。 """
+    parts = split_filter_chain(filter_chain)
+    if parts is None:
+        return None
+    pre, params, _ = parts
+    loudnorm = f"loudnorm={params}:print_format=json" if params else "loudnorm=print_format=json"
+    return _join_filters(pre, loudnorm, [])
+
+
+def measurement_key(fingerprint, filter_chain):
+    """
+    测量结果的缓存键：源文件指纹、前置滤镜与 loudnorm 目标参数。
+    测量的是前置滤镜处理后的音频，修改前置滤镜或 I/TP/LRA 后都需重新测量；后置滤镜不影响测量值。
+    """
+    parts = split_filter_chain(filter_chain)
+    if parts is None or not fingerprint:
+        return None
+    pre, params, _ = parts
+    return f"{fingerprint}|{','.join(pre)}|{params}"
+
+
+def build_linear_filter(filter_chain, measured):
+    """ 将测量值写入 loudnorm 的 measured_* 参数，生成第二遍的线性增益滤镜链。 """
+    parts = split_filter_chain(filter_chain)
+    if parts is None or not measured:
+        return filter_chain
+    pre, params, post = parts
+    measured_params = (
+        f"measured_I={measured['input_i']}:measured_TP={measured['input_tp']}:"
+        f"measured_LRA={measured['input_lra']}:measured_thresh={measured['input_thresh']}:"
+        f"offset={measured['target_offset']}:linear=true"
+    )
+    loudnorm = f"loudnorm={params}:{measured_params}" if params else f"loudnorm={measured_params}"
+    return _join_filters(pre, loudnorm, post)
+
+
+def parse_measurement(output):
+    """ 从 ffmpeg 输出中提取 loudnorm 打印的 JSON 测量结果。 """
+    start = output.rfind("{")
+    end = output.rfind("}")
+    if start == -1 or end < start:
+        return None
+    try:
+        data = json.loads(output[start:end + 1])
+        measured = {k: str(data[k]) for k in ("input_i", "input_tp", "input_lra", "input_thresh", "target_offset")}
+        # 静音音轨会得到 -inf，无法用于线性归一化
+        if not all(math.isfinite(float(v)) for v in measured.values()):
+            return None
+        return measured
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+class LoudnormMeasurement:
+    """
+    在后台运行 loudnorm 第一遍测量 (仅解码首条音轨)，与 ab-av1 探测同时进行。
+    """
+    def __init__(self, ffmpeg, filepath, filter_chain):
+        self.cmd = [
+            ffmpeg, "-hide_banner", "-nostats", "-i", filepath,
+            "-map", "0:a:0", "-vn", "-sn", "-dn",
+            "-af", build_measure_filter(filter_chain),
+            "-f", "null", "-"
+        ]
+        self.proc = None
+        self._output = ""
+        self._thread = None
+
+    def start(self):
+        self.proc = subprocess.Popen(self.cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                     creationflags=get_subprocess_flags())
+        self._thread = threading.Thread(target=self._collect, daemon=True)
+        self._thread.start()
+
+    def _collect(self):
+        try:
+            _, stderr = self.proc.communicate()
+            self._output = safe_decode(stderr)
+        except Exception:
+            self._output = ""
+
+    def result(self):
+        """ 等待测量结束并返回测量值，失败时返回 None。 """
+        if not self._thread:
+            return None
+        self._thread.join()
+        if self.proc.returncode != 0:
+            return None
+        return parse_measurement(self._output)
+
+    def cancel(self):
+        if self.proc and self.proc.poll() is None:
+            try:
+                self.proc.kill()
+            except Exception:
+                pass
@@ -0,0 +1,29 @@
+from PySide6.QtCore import Signal
+
+from .base import BaseWorker
+from .cache import CacheManager
+
+# --- 缓存维护线程 ---
+class CacheWorker(BaseWorker):
+    """
+    在后台清理缓存目录，避免阻塞界面：sweep 为 True 时先清理遗留的临时产物 (启动时)，
+    随后按大小上限执行 LRU 淘汰。protect_after 为正在进行的编码任务的开始时间。
+    """
+    result_signal = Signal(int, 'qint64', int, 'qint64') # 清理数量, 清理字节数, 淘汰数量, 淘汰字节数 (可能超过 2 GiB)
+
+    def __init__(self, cache_dir, max_bytes, ram_dir="", sweep=False, protect_after=None):
+        super().__init__()
+        self.manager = CacheManager(cache_dir, max_bytes, ram_dir)
+        self.sweep = sweep
+        self.protect_after = protect_after
+
+    def run(self):
+        swept = freed = 0
+        try:
+            if self.sweep:
+                swept, freed = self.manager.sweep(self.protect_after)
+            evicted, evicted_bytes = self.manager.evict(self.protect_after)
+        except Exception:
+            evicted, evicted_bytes = 0, 0
+        if self.is_running:
+            self.result_signal.emit(swept, freed, evicted, evicted_bytes)
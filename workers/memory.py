@@ -0,0 +1,148 @@
+import os
+import ctypes
+import threading
+
+from config import (MEMORY_ESTIMATE_MB, MEMORY_PHASE_FACTOR, MEMORY_CPU_FACTOR, MEMORY_RENDITION_FACTOR,
+                    MEMORY_SAFETY_MARGIN, MEMORY_POLL_INTERVAL)
+from .governor import descendant_pids
+
+# 内存占用阶段：ab-av1 探测 (样本编码 + VMAF 评分)、最终编码、带同步验收 (libvmaf) 的最终编码
+PHASE_SEARCH = "search"
+PHASE_ENCODE = "encode"
+PHASE_ENCODE_VMAF = "encode_vmaf"
+
+
+def peak_rss(pid):
+    """ 进程启动以来的峰值常驻内存 (字节)：Linux 读取 VmHWM，Windows 读取 PeakWorkingSetSize；无法获取时返回 0。 """
+    if os.name == 'nt':
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [("cb", ctypes.c_ulong), ("PageFaultCount", ctypes.c_ulong),
+                        ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                        ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+        try:
+            kernel32 = ctypes.windll.kernel32
+            handle = kernel32.OpenProcess(0x1000 | 0x0010, False, pid) # PROCESS_QUERY_LIMITED_INFORMATION | PROCESS_VM_READ
+            if not handle:
+                return 0
+            try:
+                counters = PROCESS_MEMORY_COUNTERS()
+                counters.cb = ctypes.sizeof(counters)
+                if kernel32.K32GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+                    return counters.PeakWorkingSetSize
+            finally:
+                kernel32.CloseHandle(handle)
+        except Exception:
+            pass
+        return 0
+    try:
+        with open(f"/proc/{pid}/status", "r") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return 0
+
+
+def tree_rss(pid):
+    """ 进程及其派生进程 (ab-av1 启动的 ffmpeg) 的峰值常驻内存之和。 """
+    return sum(peak_rss(p) for p in [pid] + descendant_pids(pid))
+
+
+def memory_key(encoder, bucket, phase, threads=0, renditions=0):
+    """ 内存记录的键：编码器、分辨率档位、阶段与线程数 (多规格输出另计)。 """
+    key = f"{encoder}|{bucket}|{phase}|{int(threads or 0)}"
+    return key + f"|r{renditions}" if renditions else key
+
+
+class MemoryTicket:
+    """ 一个子进程的内存占用登记：运行期间定期采样进程树的峰值内存，超过预估时按实测值计入上限。 """
+    def __init__(self, admission, key, estimate):
+        self.admission = admission
+        self.key = key
+        self.estimate = estimate
+        self.peak = 0
+        self._pids = []
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def reserved(self):
+        return max(self.estimate, self.peak)
+
+    def track(self, pid):
+        """ 子进程启动后开始采样 (同一登记可依次跟踪多个进程)。 """
+        self._pids.append(pid)
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._poll, daemon=True)
+            self._thread.start()
+
+    def _sample(self):
+        if self._pids:
+            self.peak = max(self.peak, tree_rss(self._pids[-1]))
+
+    def _poll(self):
+        while not self._stopped.wait(MEMORY_POLL_INTERVAL):
+            self._sample()
+
+    def release(self):
+        """ 结束采样并释放名额，返回实测峰值 (字节)。 """
+        self._stopped.set()
+        if self._thread:
+            self._thread.join()
+        self.admission._release(self)
+        return self.peak
+
+
+class MemoryAdmission:
+    """
+    内存准入控制：按分辨率档位、编码器与阶段预估每个子进程的峰值内存，并以之前实测的峰值 (history) 修正，
+    只有在登记中的进程占用 (取预估与实测的较大值) 加上新进程的预估不超过上限时才允许启动。
+    没有其他进程运行时总是放行，避免单个预估超过上限的任务永远等待。
+    """
+    def __init__(self, ceiling, history):
+        self.ceiling = ceiling
+        self.history = history
+        self._active = set()
+        self._cond = threading.Condition()
+
+    def estimate(self, key, bucket, phase, cpu=False, renditions=0):
+        """ 有实测记录时使用记录值乘以安全系数，否则按档位与阶段估算 (字节)。 """
+        measured = self.history.get(key)
+        if measured:
+            return int(measured * MEMORY_SAFETY_MARGIN)
+        base = MEMORY_ESTIMATE_MB.get(bucket, MEMORY_ESTIMATE_MB["1080p"]) * MEMORY_PHASE_FACTOR.get(phase, 1.0)
+        if cpu:
+            base *= MEMORY_CPU_FACTOR
+        return int(base * (1 + MEMORY_RENDITION_FACTOR * renditions) * 1024 ** 2)
+
+    def _used(self):
+        return sum(ticket.reserved() for ticket in self._active)
+
+    def admit(self, key, estimate, is_running, on_wait=None):
+        """ 等待内存足够后登记并返回 MemoryTicket (开始等待时调用一次 on_wait(已登记, 预估))；任务停止时返回 None。 """
+        waited = False
+        with self._cond:
+            while is_running():
+                used = self._used()
+                if not self._active or used + estimate <= self.ceiling:
+                    ticket = MemoryTicket(self, key, estimate)
+                    self._active.add(ticket)
+                    return ticket
+                if not waited and on_wait:
+                    on_wait(used, estimate)
+                waited = True
+                self._cond.wait(MEMORY_POLL_INTERVAL)
+        return None
+
+    def _release(self, ticket):
+        ticket._sample()
+        if ticket.peak > 0:
+            # 实测值更高时立即采用，更低时按指数平滑缓慢下调
+            previous = self.history.get(ticket.key)
+            value = previous * 0.7 + ticket.peak * 0.3 if previous and previous > ticket.peak else ticket.peak
+            self.history.set(ticket.key, int(value))
+        with self._cond:
+            self._active.discard(ticket)
+            self._cond.notify_all()
@@ -0,0 +1,71 @@
+import os
+import re
+
+from config import (
+    QUEUE_ORDER_SHORTEST, QUEUE_ORDER_SAVINGS, QUEUE_ORDER_FOLDER, QUEUE_ORDER_DISK,
+    SAVINGS_CODEC_RATIO, SAVINGS_AV1_BPP
+)
+
+
+def _natural_key(path):
+    """ 按自然顺序排序文件名 (第 2 集排在第 10 集之前)。 """
+    return [int(part) if part.isdigit() else part.lower() for part in re.split(r"(\d+)", os.path.basename(path))]
+
+
+def estimate_savings(path, meta):
+    """
+    估计转码后节省的字节数：按源编码的典型压缩比，并以 AV1 在该像素量下的典型码率 (bpp) 为上限。
+    已是 AV1 或无法读取大小时返回 0。
+    """
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return 0
+    codec = (meta.get('codec') or '').lower()
+    if "av1" in codec:
+        return 0
+    expected = size * SAVINGS_CODEC_RATIO.get(codec, 0.5)
+    pixels = (meta.get('width') or 0) * (meta.get('height') or 0)
+    frames = (meta.get('duration') or 0) * (meta.get('frame_rate') or 0)
+    if pixels > 0 and frames > 0:
+        expected = min(expected, pixels * frames * SAVINGS_AV1_BPP / 8)
+    return max(0, size - expected)
+
+
+def source_volume(path):
+    """ 文件所在的磁盘：Windows 取盘符 / UNC 共享，其他系统取设备号。 """
+    if os.name == 'nt':
+        return os.path.splitdrive(os.path.abspath(path))[0].lower()
+    try:
+        return os.stat(path).st_dev
+    except OSError:
+        return None
+
+
+def order_tasks(tasks, mode, metadata=None):
+    """
+    按队列排序策略调整任务顺序 (依据缓存的探测元数据，未知时长/大小的文件排在最后)：
+    shortest 时长最短优先；savings 预计节省空间最多优先；folder 按文件夹分组 (同一系列连续读取)；
+    disk 在各源磁盘之间轮流领取。其他值保持添加顺序。
+    """
+    metadata = metadata or {}
+    meta_of = lambda p: metadata.get(p) or {}
+    if mode == QUEUE_ORDER_SHORTEST:
+        return sorted(tasks, key=lambda p: (meta_of(p).get('duration') or float('inf')))
+    if mode == QUEUE_ORDER_SAVINGS:
+        return sorted(tasks, key=lambda p: -estimate_savings(p, meta_of(p)))
+    if mode == QUEUE_ORDER_FOLDER:
+        folders = {}
+        for p in tasks:
+            folders.setdefault(os.path.normcase(os.path.dirname(os.path.abspath(p))), []).append(p)
+        return [p for group in folders.values() for p in sorted(group, key=_natural_key)]
+    if mode == QUEUE_ORDER_DISK:
+        volumes = {}
+        for p in tasks:
+            volumes.setdefault(source_volume(p), []).append(p)
+        queues = list(volumes.values())
+        ordered = []
+        for k in range(max((len(q) for q in queues), default=0)):
+            ordered.extend(q[k] for q in queues if k < len(q))
+        return ordered
+    return list(tasks)
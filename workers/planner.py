@@ -0,0 +1,137 @@
+import math
+
+# 分辨率档位 (按像素数划分)
+RESOLUTION_BUCKETS = (
+    (1280 * 720, "720p"),
+    (1920 * 1080, "1080p"),
+    (2560 * 1440, "1440p"),
+)
+
+# 单实例的串行比例估计 (Amdahl 定律)：分辨率越低，帧内可并行的工作越少
+_SERIAL_FRACTION = {"720p": 0.30, "1080p": 0.18, "1440p": 0.12, "2160p": 0.07}
+
+# 无实测记录时的先验帧率：CPU 为单线程中等预设的粗略值，GPU 为单路硬件编码的粗略值
+_CPU_BASE_FPS = {"720p": 6.0, "1080p": 2.5, "1440p": 1.4, "2160p": 0.6}
+_GPU_PRIOR_FPS = {"720p": 480.0, "1080p": 240.0, "1440p": 140.0, "2160p": 65.0}
+
+# aom 的 tile 列数上限 (log2)，tile 过多会损失压缩效率
+_AOM_TILE_COLS_LOG2 = {"720p": 1, "1080p": 2, "1440p": 2, "2160p": 3}
+
+# 每实例的最少线程数：实例过多时内存占用与单文件耗时都会显著上升
+_MIN_THREADS = {"720p": 2, "1080p": 4, "1440p": 6, "2160p": 8}
+
+# 增加一个并行实例至少需要带来的吞吐提升
+_MIN_GAIN = 1.05
+
+
+def resolution_bucket(width, height):
+    """ 将分辨率归入档位，未知分辨率按 1080p 处理。 """
+    try:
+        pixels = int(width) * int(height)
+    except (TypeError, ValueError):
+        pixels = 0
+    if pixels <= 0:
+        return "1080p"
+    for limit, name in RESOLUTION_BUCKETS:
+        if pixels <= limit:
+            return name
+    return "2160p"
+
+
+def median_bucket(buckets):
+    """ 取一批文件分辨率档位的中位数，作为整批次的规划依据。 """
+    order = [name for _, name in RESOLUTION_BUCKETS] + ["2160p"]
+    ranked = sorted(order.index(b) for b in buckets if b in order)
+    return order[ranked[len(ranked) // 2]] if ranked else "1080p"
+
+
+def history_key(enc_name, enc_preset, bucket, threads):
+    return f"{enc_name}|{enc_preset}|{bucket}|{threads}"
+
+
+def _amdahl(threads, serial):
+    return 1.0 / (serial + (1.0 - serial) / max(1, threads))
+
+
+def min_threads(bucket):
+    return _MIN_THREADS.get(bucket, 4)
+
+
+def instance_speed(enc_name, enc_preset, bucket, threads, history=None):
+    """
+    估计单实例在给定线程数下的吞吐 (fps)。
+    有实测记录时直接使用；否则以最接近的实测点按 Amdahl 曲线缩放，完全没有记录时使用先验值。
+    """
+    serial = _SERIAL_FRACTION.get(bucket, 0.18)
+    if history is not None:
+        measured = history.get(history_key(enc_name, enc_preset, bucket, threads))
+        if measured:
+            return float(measured)
+        nearest = None
+        for t in (threads // 2, threads * 2, threads - 1, threads + 1):
+            if t < 1:
+                continue
+            value = history.get(history_key(enc_name, enc_preset, bucket, t))
+            if value:
+                nearest = (t, float(value))
+                break
+        if nearest:
+            t, value = nearest
+            return value * _amdahl(threads, serial) / _amdahl(t, serial)
+    return _CPU_BASE_FPS.get(bucket, 2.5) * _amdahl(threads, serial)
+
+
+def gpu_speed(enc_name, enc_preset, bucket, history=None):
+    """ 估计单路硬件编码的吞吐 (fps)，实测记录以线程数 0 保存。 """
+    if history is not None:
+        measured = history.get(history_key(enc_name, enc_preset, bucket, 0))
+        if measured:
+            return float(measured)
+    return _GPU_PRIOR_FPS.get(bucket, 240.0)
+
+
+def estimate_seconds(slot, frames, bucket, history=None):
+    """ 估计某个文件在指定槽位上的编码耗时 (秒)。 """
+    if slot.is_cpu:
+        fps = instance_speed(slot.enc_name, slot.enc_preset, bucket, int(slot.cpu_opts.get("threads") or 1), history)
+    else:
+        fps = gpu_speed(slot.enc_name, slot.enc_preset, bucket, history)
+    return frames / max(fps, 0.01)
+
+
+class CpuPlan:
+    """ CPU 并行编码计划：实例数、每实例线程数及可选的处理器绑定。 """
+    def __init__(self, instances, threads, bucket, tile_cols_log2=0, cpu_sets=None):
+        self.instances = instances
+        self.threads = threads
+        self.bucket = bucket
+        self.tile_cols_log2 = tile_cols_log2
+        self.cpu_sets = cpu_sets
+
+    def cpu_opts(self, enc_name):
+        """ 转换为 build_video_args 使用的 cpu_opts。 """
+        opts = {"threads": self.threads, "lp": self.threads}
+        if enc_name == "libaom-av1":
+            opts["tiles"] = self.tile_cols_log2
+        return opts
+
+
+def plan_cpu_encodes(enc_name, enc_preset, cores, bucket, file_count, history=None, instances=0):
+    """
+    选择并行实例数：在不超订处理器的前提下 (实例数 × 线程数 ≤ 核心数)，使总吞吐最大。
+    实例数不超过文件数，且每实例不少于该分辨率档位的最少线程数；instances > 0 时直接使用指定的实例数。
+    """
+    cores = max(1, int(cores))
+    if instances > 0:
+        best_k = max(1, min(instances, cores, max(1, file_count)))
+    else:
+        limit = min(max(1, cores // min_threads(bucket)), max(1, file_count))
+        best_k, best_total = 1, instance_speed(enc_name, enc_preset, bucket, cores, history)
+        for k in range(2, limit + 1):
+            total = k * instance_speed(enc_name, enc_preset, bucket, cores // k, history)
+            if total > best_total * _MIN_GAIN:
+                best_k, best_total = k, total
+
+    threads = cores // best_k
+    tile_cols_log2 = min(_AOM_TILE_COLS_LOG2.get(bucket, 2), int(math.log2(max(1, threads))))
+    return CpuPlan(best_k, threads, bucket, tile_cols_log2)
@@ -0,0 +1,223 @@
+import os
+import time
+import ctypes
+import threading
+
+from config import WATCHDOG_BUCKET_FACTOR, WATCHDOG_CPU_FACTOR, WATCHDOG_SEARCH_FACTOR
+from utils import kill_process_tree
+
+
+def available_cpus():
+    """ 返回当前进程可用的逻辑处理器编号列表。 """
+    if hasattr(os, "sched_getaffinity"):
+        try:
+            return sorted(os.sched_getaffinity(0))
+        except OSError:
+            pass
+    return list(range(os.cpu_count() or 1))
+
+
+def _parse_cpu_list(text):
+    """ 解析 Linux cpulist 格式 (例如 "0-7,16-23")。 """
+    cpus = []
+    for part in text.strip().split(","):
+        if not part:
+            continue
+        if "-" in part:
+            lo, hi = part.split("-", 1)
+            cpus.extend(range(int(lo), int(hi) + 1))
+        else:
+            cpus.append(int(part))
+    return cpus
+
+
+def numa_nodes():
+    """ 返回各 NUMA 节点的逻辑处理器列表 (仅 Linux；无法获取时视为单节点)。 """
+    allowed = set(available_cpus())
+    base = "/sys/devices/system/node"
+    nodes = []
+    try:
+        for entry in sorted(os.listdir(base)):
+            if not (entry.startswith("node") and entry[4:].isdigit()):
+                continue
+            with open(os.path.join(base, entry, "cpulist"), "r") as f:
+                cpus = [c for c in _parse_cpu_list(f.read()) if c in allowed]
+            if cpus:
+                nodes.append(cpus)
+    except (OSError, ValueError):
+        nodes = []
+    return nodes or [sorted(allowed)]
+
+
+def split_cpu_sets(count, mode, reserve=0):
+    """
+    将可用处理器划分为 count 组互不重叠的集合，用于绑定并行的编码实例。
+    mode: "cores" 按编号连续划分；"numa" 先按 NUMA 节点排序再划分，实例数为节点数的倍数时每组不跨节点。
+    reserve 为预留给其他任务 (例如 GPU 槽位的解码与探测) 的处理器数，从编号最小的处理器开始预留。
+    处理器数不足时返回 None (不绑定)。
+    """
+    cpus = [c for node in numa_nodes() for c in node] if mode == "numa" else available_cpus()
+    reserved = set(sorted(cpus)[:max(0, reserve)])
+    cpus = [c for c in cpus if c not in reserved]
+    if count <= 0 or len(cpus) < count:
+        return None
+    size, extra = divmod(len(cpus), count)
+    sets, start = [], 0
+    for idx in range(count):
+        end = start + size + (1 if idx < extra else 0)
+        sets.append(cpus[start:end])
+        start = end
+    return sets
+
+
+def set_affinity(pid, cpus):
+    """ 将进程绑定到指定处理器 (子进程会继承该设置)。失败时静默忽略。 """
+    if not cpus:
+        return False
+    try:
+        if hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(pid, cpus)
+            return True
+        if os.name == 'nt':
+            # 仅支持第一个处理器组 (前 64 个逻辑处理器)
+            mask = 0
+            for cpu in cpus:
+                if cpu < 64:
+                    mask |= 1 << cpu
+            if not mask:
+                return False
+            kernel32 = ctypes.windll.kernel32
+            handle = kernel32.OpenProcess(0x0200 | 0x0400, False, pid) # PROCESS_SET_INFORMATION | PROCESS_QUERY_INFORMATION
+            if not handle:
+                return False
+            try:
+                return bool(kernel32.SetProcessAffinityMask(handle, ctypes.c_size_t(mask)))
+            finally:
+                kernel32.CloseHandle(handle)
+    except Exception:
+        pass
+    return False
+
+
+def pid_alive(pid):
+    """ 判断进程是否仍在运行 (用于识别崩溃后遗留的临时目录)。无法判断时视为仍在运行。 """
+    try:
+        if os.name == 'nt':
+            kernel32 = ctypes.windll.kernel32
+            handle = kernel32.OpenProcess(0x1000, False, pid) # PROCESS_QUERY_LIMITED_INFORMATION
+            if not handle:
+                return False
+            try:
+                code = ctypes.c_ulong()
+                kernel32.GetExitCodeProcess(handle, ctypes.byref(code))
+                return code.value == 259 # STILL_ACTIVE
+            finally:
+                kernel32.CloseHandle(handle)
+        os.kill(pid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+    except Exception:
+        return True
+
+
+def watchdog_timeout(base, enc_name, bucket, search=False):
+    """ 计算看门狗超时 (秒)：基础值按分辨率档位放宽，CPU 编码器与 ab-av1 探测再放宽。base 为 0 时关闭。 """
+    timeout = float(base or 0)
+    if timeout <= 0:
+        return 0
+    timeout *= WATCHDOG_BUCKET_FACTOR.get(bucket, 1.0)
+    if enc_name in ("libsvtav1", "libaom-av1"):
+        timeout *= WATCHDOG_CPU_FACTOR
+    if search:
+        timeout *= WATCHDOG_SEARCH_FACTOR
+    return timeout
+
+
+class Watchdog:
+    """
+    子进程看门狗：读取输出的循环在每次取得进展时调用 feed()，
+    超过 timeout 秒没有进展时由后台线程结束整个进程树，使阻塞的 readline() 返回。
+    暂停期间不计时。
+    """
+    def __init__(self, proc, timeout, is_paused=None):
+        self.proc = proc
+        self.timeout = timeout
+        self.is_paused = is_paused or (lambda: False)
+        self.fired = False
+        self.last_progress = time.monotonic()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self.timeout > 0:
+            self._thread = threading.Thread(target=self._loop, daemon=True)
+            self._thread.start()
+        return self
+
+    def feed(self):
+        self.last_progress = time.monotonic()
+
+    def stalled_for(self):
+        return time.monotonic() - self.last_progress
+
+    def _loop(self):
+        while not self._stop.wait(1.0):
+            if self.is_paused():
+                self.feed()
+                continue
+            if self.stalled_for() > self.timeout:
+                self.fired = True
+                try:
+                    if self.proc.poll() is None:
+                        kill_process_tree(self.proc)
+                except Exception:
+                    pass
+                return
+
+    def stop(self):
+        self._stop.set()
+
+
+class ProcessRegistry:
+    """
+    记录所有正在运行的子进程与后台任务，停止时统一结束。
+    并行编码时每个槽位各自登记，取代单一的 current_proc。
+    """
+    def __init__(self):
+        self._items = {} # 子进程或后台任务 -> 绑定的处理器
+        self._lock = threading.Lock()
+        self.governor = None
+
+    def add(self, item, cpus=None):
+        """ 登记子进程 (Popen) 或带 cancel() 的后台任务，可同时设置处理器亲和性；启用资源调控时应用当前配置。 """
+        with self._lock:
+            self._items[item] = cpus
+        if hasattr(item, "pid"):
+            if self.governor:
+                self.governor.on_process(item.pid, cpus)
+            elif cpus:
+                set_affinity(item.pid, cpus)
+        return item
+
+    def remove(self, item):
+        with self._lock:
+            self._items.pop(item, None)
+
+    def processes(self):
+        """ 登记的子进程 (Popen) 及其绑定的处理器：[(进程, cpus)]。 """
+        with self._lock:
+            return [(item, cpus) for item, cpus in self._items.items() if hasattr(item, "poll") and hasattr(item, "pid")]
+
+    def terminate_all(self):
+        with self._lock:
+            items = list(self._items)
+            self._items.clear()
+        for item in items:
+            try:
+                if hasattr(item, "cancel"):
+                    item.cancel()
+                elif item.poll() is None:
+                    kill_process_tree(item)
+            except Exception:
+                pass
@@ -0,0 +1,173 @@
+import os
+import shutil
+import subprocess
+
+from config import PIX_FMT_AB_AV1
+from utils import get_subprocess_flags, safe_decode
+from .vmaf import escape_filter_path, read_vmaf_log
+
+
+def find_weak_segments(frame_times, keyframe_indices, frame_scores, threshold, max_ratio=1.0):
+    """
+    按关键帧划分片段并找出平均 VMAF 低于阈值的片段。
+    frame_times: 按显示顺序排列的每帧时间戳；keyframe_indices: 关键帧所在帧号 (升序)；
+    frame_scores: [(帧号, VMAF)]，允许抽帧。
+    返回合并相邻片段后的 [(起始帧号, 结束帧号(不含), 平均分)]；
+    弱片段总帧数超过 max_ratio 时返回 None (此时整片重编码更划算)。
+    """
+    total = len(frame_times)
+    if total == 0 or not keyframe_indices or not frame_scores:
+        return []
+    bounds = sorted(set(keyframe_indices) | {0}) + [total]
+    score_map = dict(frame_scores)
+
+    weak = []
+    for start, end in zip(bounds, bounds[1:]):
+        scores = [score_map[n] for n in range(start, end) if n in score_map]
+        if not scores:
+            continue
+        mean = sum(scores) / len(scores)
+        if mean < threshold:
+            if weak and weak[-1][1] == start:
+                prev_start, _, prev_mean, prev_count = weak[-1]
+                count = prev_count + len(scores)
+                weak[-1] = (prev_start, end, (prev_mean * prev_count + mean * len(scores)) / count, count)
+            else:
+                weak.append((start, end, mean, len(scores)))
+
+    weak_frames = sum(end - start for start, end, _, _ in weak)
+    if weak_frames > total * max_ratio:
+        return None
+    return [(start, end, mean) for start, end, mean, _ in weak]
+
+
+class SegmentRepairer:
+    """
+    编码后的弱片段修复：逐片段评分，仅将低于阈值的关键帧区间以更低 CRF 重新编码，
+    再通过流复制拼接回原有输出 (其余部分保持不变)。
+    """
+    def __init__(self, ffmpeg, ffprobe, src, encoded, work_dir, vfilter=""):
+        self.ffmpeg = ffmpeg
+        self.vfilter = vfilter # 最终编码使用的软件视频滤镜 (例如裁剪)，参考帧与重编码片段需保持一致
+        self.ffprobe = ffprobe
+        self.src = src
+        self.encoded = encoded
+        self.work_dir = work_dir
+        self.proc = None
+        self.cancelled = False
+
+    def _run(self, cmd):
+        if self.cancelled:
+            return -1, ""
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              creationflags=get_subprocess_flags()) as proc:
+            self.proc = proc
+            output, _ = proc.communicate()
+        self.proc = None
+        return proc.returncode, safe_decode(output)
+
+    def cancel(self):
+        self.cancelled = True
+        if self.proc and self.proc.poll() is None:
+            try:
+                self.proc.kill()
+            except Exception:
+                pass
+
+    def probe_frames(self):
+        """ 读取输出视频的数据包时间戳与关键帧标记 (无需解码)。 """
+        cmd = [self.ffprobe, "-v", "error", "-select_streams", "v:0",
+               "-show_entries", "packet=pts_time,flags", "-of", "csv=p=0", self.encoded]
+        code, output = self._run(cmd)
+        if code != 0:
+            return [], []
+        packets = []
+        for line in output.splitlines():
+            parts = line.strip().split(",")
+            if len(parts) < 2:
+                continue
+            try:
+                packets.append((float(parts[0]), "K" in parts[1]))
+            except ValueError:
+                continue
+        packets.sort(key=lambda p: p[0])
+        frame_times = [t for t, _ in packets]
+        keyframes = [i for i, (_, key) in enumerate(packets) if key]
+        return frame_times, keyframes
+
+    def score_frames(self, subsample=1):
+        """ 未开启同步验收时，单独计算逐帧 VMAF。 """
+        log_path = os.path.join(self.work_dir, "score.vmaf.json")
+        vmaf_opts = f"log_fmt=json:log_path={escape_filter_path(log_path)}"
+        if subsample > 1:
+            vmaf_opts = f"n_subsample={subsample}:" + vmaf_opts
+        graph = (
+            f"[0:v:0]setpts=PTS-STARTPTS,format={PIX_FMT_AB_AV1}[dist];"
+            f"[1:v:0]{self.vfilter + ',' if self.vfilter else ''}setpts=PTS-STARTPTS,format={PIX_FMT_AB_AV1}[ref];"
+            f"[dist][ref]libvmaf={vmaf_opts}"
+        )
+        cmd = [self.ffmpeg, "-y", "-hide_banner", "-v", "error", "-i", self.encoded, "-i", self.src,
+               "-lavfi", graph, "-f", "null", "-"]
+        code, _ = self._run(cmd)
+        if code != 0:
+            return []
+        _, frames = read_vmaf_log(log_path)
+        return frames
+
+    def repair(self, frame_times, segments, hw_args, video_args):
+        """
+        重新编码弱片段并拼接。成功时用修复结果替换原输出并返回 True。
+        hw_args/video_args 与最终编码一致 (仅质量参数不同)，保证拼接处的码流参数相同。
+        """
+        total = len(frame_times)
+        cut_points = sorted({idx for start, end, _ in segments for idx in (start, end) if 0 < idx < total})
+
+        # 1. 在关键帧处将原视频流切分 (流复制)
+        pieces_pattern = os.path.join(self.work_dir, "piece_%05d.mkv")
+        cmd_split = [self.ffmpeg, "-y", "-hide_banner", "-v", "error", "-i", self.encoded,
+                     "-map", "0:v:0", "-c", "copy", "-f", "segment", "-reset_timestamps", "1"]
+        if cut_points:
+            # 分割点取在关键帧与前一帧之间，避免浮点舍入导致切到下一个关键帧
+            times = [(frame_times[i] + frame_times[i - 1]) / 2 for i in cut_points]
+            cmd_split.extend(["-segment_times", ",".join(f"{t:.6f}" for t in times)])
+        cmd_split.append(pieces_pattern)
+        code, _ = self._run(cmd_split)
+        if code != 0:
+            return False
+
+        # 2. 重新编码弱片段 (按帧数截取，确保与原片段帧数一致)
+        bounds = [0] + cut_points + [total]
+        replaced = {}
+        for start, end, _ in segments:
+            piece_idx = bounds.index(start)
+            seg_path = os.path.join(self.work_dir, f"repair_{piece_idx:05d}.mkv")
+            cmd_seg = [self.ffmpeg, "-y", "-hide_banner", "-v", "error"] + list(hw_args) + [
+                "-ss", f"{frame_times[start]:.6f}", "-i", self.src,
+                "-map", "0:v:0", "-frames:v", str(end - start)
+            ] + (["-vf", self.vfilter] if self.vfilter else []) + list(video_args) + ["-an", "-sn", seg_path]
+            code, _ = self._run(cmd_seg)
+            if code != 0 or not os.path.exists(seg_path):
+                return False
+            replaced[piece_idx] = seg_path
+
+        # 3. 拼接视频流，并从原输出中复制音频与字幕
+        list_path = os.path.join(self.work_dir, "concat.txt")
+        with open(list_path, 'w', encoding='utf-8') as f:
+            for idx in range(len(bounds) - 1):
+                piece = replaced.get(idx, pieces_pattern % idx)
+                if not os.path.exists(piece):
+                    return False
+                f.write("file '" + piece.replace("\\", "/").replace("'", "'\\''") + "'\n")
+
+        repaired = os.path.join(self.work_dir, "repaired.mkv")
+        cmd_concat = [self.ffmpeg, "-y", "-hide_banner", "-v", "error",
+                      "-f", "concat", "-safe", "0", "-i", list_path, "-i", self.encoded,
+                      "-map", "0:v:0", "-map", "1:a?", "-map", "1:s?", "-c", "copy", repaired]
+        code, _ = self._run(cmd_concat)
+        if code != 0 or not os.path.exists(repaired) or os.path.getsize(repaired) <= 1024:
+            return False
+        os.replace(repaired, self.encoded)
+        return True
+
+    def cleanup(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
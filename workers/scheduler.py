@@ -0,0 +1,118 @@
+import threading
+
+from config import GPU_ASSIGN_ROUND_ROBIN
+
+
+class EncodeSlot:
+    """
+    一个并发编码槽位：绑定最终编码器、预设、显卡设备序号及 CPU 线程/亲和性设置。
+    fast_lane 为 True 时为短片快速通道槽位 (跳过探测与降温)。
+    """
+    def __init__(self, name, enc_name, enc_preset, cpu_opts=None, cpus=None, device=None, fast_lane=False):
+        self.name = name
+        self.enc_name = enc_name
+        self.enc_preset = enc_preset
+        self.cpu_opts = cpu_opts or {}
+        self.cpus = cpus
+        self.device = device
+        self.fast_lane = fast_lane
+
+    @property
+    def is_cpu(self):
+        return self.enc_name in ("libsvtav1", "libaom-av1")
+
+
+class MixedPlacement:
+    """
+    异构槽位 (GPU + CPU) 的放置策略：GPU 槽位领取工作量最大的文件 (长片、高分辨率)，
+    CPU 槽位领取工作量最小的文件 (短片、低分辨率)。
+    当最小的文件在 CPU 上的预计耗时仍超过 GPU 排空队列所需时间时，CPU 槽位不再领取，留给 GPU 处理。
+    work: {文件序号: (帧数, 分辨率档位)}；estimate(slot, frames, bucket) 返回预计秒数。
+    """
+    def __init__(self, work, estimate):
+        self.work = work
+        self.estimate = estimate
+
+    def pick(self, slot, pending, slots):
+        frames_of = lambda k: self.work[pending[k][0]][0]
+        if not slot.is_cpu:
+            return max(range(len(pending)), key=frames_of)
+
+        k = min(range(len(pending)), key=frames_of)
+        cpu_time = self.estimate(slot, *self.work[pending[k][0]])
+        gpu_slots = [s for s in slots if not s.is_cpu]
+        if gpu_slots:
+            gpu_backlog = sum(self.estimate(gpu_slots[0], *self.work[idx]) for idx, _ in pending) / len(gpu_slots)
+            if cpu_time > gpu_backlog:
+                return None
+        return k
+
+
+class SlotDispatcher:
+    """
+    将任务分发到多个槽位：每个槽位一个线程，空闲时从队列中领取下一个文件。
+    只有一个槽位时直接在调用线程中顺序执行，与原有的串行流程一致。
+    handler(slot, index, filepath) 返回 False 表示停止领取新任务；handler 抛出异常时调用 on_error(slot, index, filepath, 异常)，
+    该槽位继续领取后续任务。
+    assignment 为 round_robin 时按文件序号轮流固定分配给各槽位，否则空闲槽位领取下一个 (最少负载)；
+    提供 placement 时由其为每个槽位挑选任务 (异构槽位)。
+    start 为本阶段第一个任务的序号 (批次分阶段执行时序号连续)。
+    """
+    def __init__(self, slots, tasks, assignment=None, placement=None, start=0):
+        self.slots = slots
+        self.assignment = assignment
+        self.placement = placement
+        self.pending = list(enumerate(tasks, start))
+        self.done = 0
+        self.stopped = False
+        self._lock = threading.Lock()
+
+    def next_task(self, slot):
+        """ 为槽位领取下一个任务，队列为空时返回 None。 """
+        with self._lock:
+            if self.stopped or not self.pending:
+                return None
+            if self.placement:
+                k = self.placement.pick(slot, self.pending, self.slots)
+                return self.pending.pop(k) if k is not None else None
+            if self.assignment == GPU_ASSIGN_ROUND_ROBIN and len(self.slots) > 1:
+                position = self.slots.index(slot)
+                for k, (index, _) in enumerate(self.pending):
+                    if index % len(self.slots) == position:
+                        return self.pending.pop(k)
+                return None
+            return self.pending.pop(0)
+
+    def stop(self):
+        with self._lock:
+            self.stopped = True
+
+    def _slot_loop(self, slot, handler, on_error=None):
+        while True:
+            task = self.next_task(slot)
+            if task is None:
+                return
+            index, filepath = task
+            keep_going = True
+            try:
+                keep_going = handler(slot, index, filepath)
+            except Exception as e:
+                # 单个文件的意外错误不应终止槽位线程 (轮流分配时该槽位的其余文件会被丢弃)
+                if on_error:
+                    on_error(slot, index, filepath, e)
+            finally:
+                with self._lock:
+                    self.done += 1
+            if keep_going is False:
+                self.stop()
+                return
+
+    def run(self, handler, on_error=None):
+        if len(self.slots) == 1:
+            self._slot_loop(self.slots[0], handler, on_error)
+            return
+        threads = [threading.Thread(target=self._slot_loop, args=(slot, handler, on_error), daemon=True) for slot in self.slots]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
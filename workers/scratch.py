@@ -0,0 +1,109 @@
+import os
+import shutil
+import itertools
+import threading
+
+from config import SCRATCH_SIZE_RATIO, SCRATCH_MIN_BYTES, SCRATCH_POLL_INTERVAL
+from .diskspace import free_space
+
+
+def default_ram_dir():
+    """ 默认的内存盘目录：Linux 使用 /dev/shm，其他系统需在设置中指定 (例如 Windows 上的 RAM Disk 盘符)。 """
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return ""
+
+
+def dir_size(path):
+    """ 目录中所有文件的总大小 (字节)。 """
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+class ScratchSpace:
+    """ 单次 ab-av1 探测使用的临时目录，后台定期统计占用空间的峰值。 """
+    def __init__(self, manager, path, on_ram, estimate):
+        self.manager = manager
+        self.path = path
+        self.on_ram = on_ram
+        self.estimate = estimate
+        self.peak = 0
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._poll, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _poll(self):
+        while not self._stopped.wait(SCRATCH_POLL_INTERVAL):
+            self.peak = max(self.peak, dir_size(self.path))
+
+    def release(self):
+        """ 删除临时目录并返回占用空间的峰值。 """
+        self._stopped.set()
+        self._thread.join()
+        self.peak = max(self.peak, dir_size(self.path))
+        shutil.rmtree(self.path, ignore_errors=True)
+        self.manager._release(self)
+        return self.peak
+
+
+class ScratchManager:
+    """
+    ab-av1 样本的临时空间管理：在内存预算内把探测的临时目录放到内存盘 (tmpfs / RAM Disk)，
+    减少样本反复写入与读取造成的磁盘磨损和延迟；预算不足时退回到磁盘缓存目录。
+    每次探测按源文件大小预估占用，运行中实际占用超过预估时按实际值计入预算。
+    """
+    def __init__(self, ram_dir, budget, disk_dir):
+        self.ram_dir = ram_dir
+        self.budget = budget
+        self.disk_dir = disk_dir
+        self._active = set()
+        self._counter = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def _used(self):
+        return sum(max(space.estimate, space.peak) for space in self._active)
+
+    def reserve(self, source):
+        """ 为一次探测分配临时目录，返回已开始统计的 ScratchSpace；磁盘缓存目录不可用时返回 None。 """
+        try:
+            estimate = max(SCRATCH_MIN_BYTES, int(os.path.getsize(source) * SCRATCH_SIZE_RATIO))
+        except OSError:
+            estimate = SCRATCH_MIN_BYTES
+        with self._lock:
+            on_ram = False
+            if self.ram_dir and self._used() + estimate <= self.budget:
+                free = free_space(self.ram_dir)
+                on_ram = free is not None and free > estimate
+            base = self.ram_dir if on_ram else self.disk_dir
+            if not base:
+                return None
+            name = f"magicworkshop_scratch_{os.getpid()}_{next(self._counter)}"
+            try:
+                path = os.path.join(base, name)
+                os.makedirs(path, exist_ok=True)
+            except OSError:
+                if not on_ram or not self.disk_dir:
+                    return None
+                # 内存盘不可写时退回磁盘
+                on_ram, path = False, os.path.join(self.disk_dir, name)
+                try:
+                    os.makedirs(path, exist_ok=True)
+                except OSError:
+                    return None
+            space = ScratchSpace(self, path, on_ram, estimate)
+            if on_ram:
+                self._active.add(space)
+        return space.start()
+
+    def _release(self, space):
+        with self._lock:
+            self._active.discard(space)
@@ -0,0 +1,171 @@
+import os
+import ctypes
+import hashlib
+import threading
+
+from config import STAGING_POLL_INTERVAL
+from .finalize import copy_file
+
+# 视为网络存储的文件系统类型 (/proc/mounts)
+REMOTE_FILESYSTEMS = ("nfs", "nfs4", "cifs", "smb3", "smbfs", "fuse.sshfs", "9p", "davfs", "afpfs")
+
+
+def is_remote(path):
+    """ 判断文件是否位于网络存储：Windows 识别 UNC 路径与网络驱动器，Linux 按挂载点的文件系统类型判断。 """
+    path = os.path.abspath(path)
+    if os.name == 'nt':
+        if path.startswith("\\\\"):
+            return True
+        try:
+            # DRIVE_REMOTE = 4
+            return ctypes.windll.kernel32.GetDriveTypeW(os.path.splitdrive(path)[0] + "\\") == 4
+        except Exception:
+            return False
+    try:
+        with open("/proc/mounts", encoding='utf-8', errors='replace') as f:
+            mounts = [line.split()[1:3] for line in f if len(line.split()) >= 3]
+    except OSError:
+        return False
+    best, fstype = "", ""
+    for mount, kind in mounts:
+        mount = mount.replace("\\040", " ")
+        if (path == mount or path.startswith(mount.rstrip("/") + "/")) and len(mount) > len(best):
+            best, fstype = mount, kind
+    return fstype in REMOTE_FILESYSTEMS
+
+
+class SourceStager:
+    """
+    源文件预读暂存：当前文件编码期间，按队列顺序把接下来的 count 个源文件复制到本地缓存目录，
+    暂存总大小不超过 budget 字节，复制速度不超过 bandwidth 字节/秒 (0 不限)。
+    探测与编码改为读取本地副本，文件处理完成后删除副本。remote_only 时只暂存网络存储上的文件。
+    upcoming() 返回尚未开始处理的文件路径 (按领取顺序)。
+    """
+    def __init__(self, stage_dir, upcoming, count, budget, bandwidth=0, remote_only=True):
+        self.stage_dir = stage_dir
+        self.upcoming = upcoming
+        self.count = max(1, int(count))
+        self.budget = budget
+        self.bandwidth = bandwidth
+        self.remote_only = remote_only
+        self.stopped = False
+        self._staged = {}    # 源路径 -> 本地副本
+        self._sizes = {}     # 已暂存或正在复制的文件占用的空间
+        self._claimed = set()  # 已开始处理 (不再暂存) 的文件
+        self._failed = set()
+        self._copying = None
+        self._remote = {}
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def start(self):
+        os.makedirs(self.stage_dir, exist_ok=True)
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+        return self
+
+    def _local_path(self, path):
+        digest = hashlib.sha1(os.path.normcase(path).encode('utf-8')).hexdigest()[:12]
+        return os.path.join(self.stage_dir, f"{digest}_{os.path.basename(path)}")
+
+    def _wanted(self, path):
+        if not self.remote_only:
+            return True
+        folder = os.path.dirname(path)
+        if folder not in self._remote:
+            self._remote[folder] = is_remote(folder)
+        return self._remote[folder]
+
+    def _next_target(self):
+        """ 按队列顺序选择下一个需要暂存的文件；超出预算时等待前面的副本释放，不跳过。 """
+        checked = 0
+        for path in self.upcoming():
+            if checked >= self.count:
+                break
+            if path in self._claimed or path in self._failed or not self._wanted(path):
+                continue
+            checked += 1
+            if path in self._staged:
+                continue
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                self._failed.add(path)
+                continue
+            if sum(self._sizes.values()) + size > self.budget:
+                return None
+            self._sizes[path] = size
+            return path
+        return None
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                if self.stopped:
+                    return
+                target = self._next_target()
+                if target is None:
+                    self._cond.wait(STAGING_POLL_INTERVAL)
+                    continue
+                self._copying = target
+            local = self._local_path(target)
+            try:
+                copy_file(target, local, cancelled=lambda: self.stopped or target in self._claimed,
+                          verify=False, bandwidth=self.bandwidth)
+                ok = True
+            except Exception:
+                ok = False
+            with self._cond:
+                self._copying = None
+                if ok and not self.stopped:
+                    self._staged[target] = local
+                else:
+                    self._sizes.pop(target, None)
+                    if not self.stopped and target not in self._claimed:
+                        self._failed.add(target)
+                    self._remove(local)
+                self._cond.notify_all()
+
+    @staticmethod
+    def _remove(path):
+        try:
+            if os.path.exists(path): os.remove(path)
+        except OSError:
+            pass
+
+    def acquire(self, path):
+        """
+        文件开始处理时调用，返回应读取的路径：已暂存时返回本地副本，正在复制时等待复制完成，
+        否则返回原路径 (之后不再暂存该文件)。
+        """
+        with self._cond:
+            while self._copying == path and not self.stopped:
+                self._cond.wait(STAGING_POLL_INTERVAL)
+            self._claimed.add(path)
+            return self._staged.get(path, path)
+
+    def release(self, path):
+        """ 文件处理完成后删除本地副本，释放预算。 """
+        with self._cond:
+            local = self._staged.pop(path, None)
+            self._sizes.pop(path, None)
+            if local:
+                self._remove(local)
+            self._cond.notify_all()
+
+    def cancel(self):
+        """ 中止正在进行的复制 (不等待)。 """
+        with self._cond:
+            self.stopped = True
+            self._cond.notify_all()
+
+    def stop(self):
+        """ 中止正在进行的复制并删除所有本地副本。 """
+        self.cancel()
+        if self._thread:
+            self._thread.join()
+        with self._cond:
+            for local in self._staged.values():
+                self._remove(local)
+            self._staged.clear()
+            self._sizes.clear()
@@ -0,0 +1,59 @@
+import os
+import re
+import json
+
+from config import PIX_FMT_AB_AV1
+
+
+def escape_filter_path(path):
+    """ 转义滤镜参数中的文件路径 (Windows 盘符冒号与反斜杠)。 """
+    return "'" + path.replace("\\", "/").replace(":", "\\:") + "'"
+
+
+def build_verify_args(log_path, subsample=1, threads=4, ref_prefix=""):
+    """
+    生成追加在主输出之后的 VMAF 验收参数。
+    使用 loopback 解码器 (-dec, 需 FFmpeg 7.1+) 直接解码刚编码的视频流，
+    与同一次解码得到的源帧比较，无需再次读取源文件或输出文件。
+    ref_prefix 为参考帧之前插入的滤镜 (例如硬件解码时的 hwdownload)。
+    """
+    vmaf_opts = f"n_threads={max(1, threads)}:log_fmt=json:log_path={escape_filter_path(log_path)}"
+    if subsample > 1:
+        vmaf_opts = f"n_subsample={subsample}:" + vmaf_opts
+    graph = (
+        f"[dec:0]setpts=PTS-STARTPTS,format={PIX_FMT_AB_AV1}[vmaf_dist];"
+        f"[0:v:0]{ref_prefix}setpts=PTS-STARTPTS,format={PIX_FMT_AB_AV1}[vmaf_ref];"
+        f"[vmaf_dist][vmaf_ref]libvmaf={vmaf_opts}[vmaf_out]"
+    )
+    return ["-dec", "0:0", "-filter_complex", graph, "-map", "[vmaf_out]", "-f", "null", "-"]
+
+
+def read_vmaf_log(log_path):
+    """ 读取 libvmaf 的 JSON 日志，返回 (平均分, [(帧号, 分数), ...])。 """
+    try:
+        with open(log_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except Exception:
+        return None, []
+    frames = []
+    for frame in data.get('frames', []):
+        score = frame.get('metrics', {}).get('vmaf')
+        if score is not None:
+            frames.append((int(frame.get('frameNum', len(frames))), float(score)))
+    mean = data.get('pooled_metrics', {}).get('vmaf', {}).get('mean')
+    if mean is None and frames:
+        mean = sum(s for _, s in frames) / len(frames)
+    return (float(mean) if mean is not None else None), frames
+
+
+def read_vmaf_score(log_path, output_lines=()):
+    """ 获取验收得分：优先读取 JSON 日志，失败时从 FFmpeg 输出的 "VMAF score" 行解析。 """
+    if log_path and os.path.exists(log_path):
+        mean, _ = read_vmaf_log(log_path)
+        if mean is not None:
+            return mean
+    for line in reversed(list(output_lines)):
+        match = re.search(r"VMAF score:\s*([\d.]+)", line)
+        if match:
+            return float(match.group(1))
+    return None